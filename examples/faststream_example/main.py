@@ -13,20 +13,25 @@ from examples.probes import (
     custom_handler,
 )
 from fast_healthchecks.integrations.base import Probe
-from fast_healthchecks.integrations.faststream import health
+from fast_healthchecks.integrations.faststream import health, health_lifespan
+
+INTEGRATION_PROBES = (
+    Probe(name="liveness", checks=LIVENESS_CHECKS),
+    Probe(name="readiness", checks=READINESS_CHECKS),
+    Probe(name="startup", checks=STARTUP_CHECKS),
+)
 
 broker = KafkaBroker(os.environ["KAFKA_BOOTSTRAP_SERVERS"].split(","))
 app_integration = AsgiFastStream(
     broker,
     asgi_routes=[
         *health(
-            Probe(name="liveness", checks=LIVENESS_CHECKS),
-            Probe(name="readiness", checks=READINESS_CHECKS),
-            Probe(name="startup", checks=STARTUP_CHECKS),
+            *INTEGRATION_PROBES,
             debug=False,
             prefix="/health",
         ),
     ],
+    lifespan=health_lifespan(*INTEGRATION_PROBES),
 )
 
 app_success = AsgiFastStream(
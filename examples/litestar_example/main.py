@@ -10,18 +10,23 @@ from examples.probes import (
     custom_handler,
 )
 from fast_healthchecks.integrations.base import Probe
-from fast_healthchecks.integrations.litestar import health
+from fast_healthchecks.integrations.litestar import health, health_lifespan
+
+INTEGRATION_PROBES = (
+    Probe(name="liveness", checks=LIVENESS_CHECKS),
+    Probe(name="readiness", checks=READINESS_CHECKS),
+    Probe(name="startup", checks=STARTUP_CHECKS),
+)
 
 app_integration = Litestar(
     route_handlers=[
         *health(
-            Probe(name="liveness", checks=LIVENESS_CHECKS),
-            Probe(name="readiness", checks=READINESS_CHECKS),
-            Probe(name="startup", checks=STARTUP_CHECKS),
+            *INTEGRATION_PROBES,
             debug=False,
             prefix="/health",
         ),
     ],
+    lifespan=[health_lifespan(*INTEGRATION_PROBES)],
 )
 
 app_success = Litestar(
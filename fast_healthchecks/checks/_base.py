@@ -1,5 +1,9 @@
 """This module contains the base classes for all health checks."""
 
+import asyncio
+import contextlib
+from collections.abc import Sequence
+from functools import lru_cache
 from typing import Generic, Protocol, TypeAlias, TypeVar
 
 from fast_healthchecks.compat import PYDANTIC_INSTALLED, PYDANTIC_V2, AmqpDsn, KafkaDsn, MongoDsn, PostgresDsn, RedisDsn
@@ -20,6 +24,8 @@ __all__ = (
     "DEFAULT_HC_TIMEOUT",
     "HealthCheck",
     "HealthCheckDSN",
+    "split_host_port",
+    "tcp_preflight",
 )
 
 
@@ -31,6 +37,27 @@ class HealthCheck(Protocol[T_co]):
 
     async def __call__(self) -> T_co: ...
 
+    @property
+    def name(self) -> str:
+        """Return the name of the health check."""
+        return getattr(self, "_name", type(self).__name__)
+
+    @property
+    def timeout(self) -> float | None:
+        """Return the timeout of the health check, or `None` if it is unbounded."""
+        return getattr(self, "_timeout", None)
+
+    @property
+    def dependency(self) -> str | None:
+        """Return the identity of the dependency the check connects to, or `None` if it opens no connections."""
+        return None
+
+    async def start(self) -> None:
+        """Open the long-lived resources of the check before the first call, if it has any."""
+
+    async def aclose(self) -> None:
+        """Release the long-lived resources of the check, if it has any."""
+
 
 class HealthCheckDSN(HealthCheck[T_co], Generic[T_co]):
     """Base class for health checks that can be created from a DSN."""
@@ -60,5 +87,66 @@ class HealthCheckDSN(HealthCheck[T_co], Generic[T_co]):
             return str(dsn)
 
         if PYDANTIC_V2:
-            return str(TypeAdapter(type_).validate_python(dsn))
+            return str(_type_adapter(type_).validate_python(dsn))
         return str(parse_obj_as(type_, dsn))  # pragma: no cover  # ty: ignore[deprecated]
+
+
+@lru_cache
+def _type_adapter(type_: type[AnyDsn]) -> "TypeAdapter[AnyDsn]":
+    """Return the adapter of the DSN type, building its validation schema once."""
+    return TypeAdapter(type_)
+
+
+def split_host_port(address: str, default_port: int) -> tuple[str, int]:
+    """Split a `host[:port]` address, supporting bracketed IPv6 hosts.
+
+    Args:
+        address: The address to split.
+        default_port: The port to use if the address does not contain one.
+
+    Returns:
+        A tuple of the host and the port.
+    """
+    if address.startswith("["):
+        host, _, rest = address[1:].partition("]")
+        return host, int(rest.removeprefix(":")) if rest else default_port
+    if address.count(":") == 1:
+        host, _, port = address.partition(":")
+        return host, int(port)
+    return address, default_port
+
+
+async def _tcp_connect(host: str, port: int) -> None:
+    _, writer = await asyncio.open_connection(host, port)
+    writer.close()
+    with contextlib.suppress(OSError):
+        await writer.wait_closed()
+
+
+async def tcp_preflight(addresses: Sequence[tuple[str, int]], timeout: float | None) -> None:
+    """Check that at least one of the addresses accepts TCP connections.
+
+    The connections are opened concurrently and closed right away, so a refused or unreachable
+    dependency is reported in a single round trip instead of after the driver's retries.
+
+    Args:
+        addresses: The `(host, port)` pairs to connect to.
+        timeout: The timeout for each connection attempt.
+
+    Raises:
+        ConnectionError: If none of the addresses is reachable.
+    """
+    pending = {asyncio.ensure_future(asyncio.wait_for(_tcp_connect(host, port), timeout)) for host, port in addresses}
+    errors: list[BaseException] = []
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            if any(task.exception() is None for task in done):
+                return
+            errors.extend(exc for task in done if (exc := task.exception()) is not None)
+    finally:
+        for task in pending:
+            task.cancel()
+    targets = ", ".join(f"{host}:{port}" for host, port in addresses)
+    msg = f"TCP preflight failed, none of {targets} is reachable"
+    raise ConnectionError(msg) from errors[0] if errors else None
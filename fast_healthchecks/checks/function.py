@@ -86,3 +86,17 @@ class FunctionHealthCheck(HealthCheck[HealthCheckResult]):
             return HealthCheckResult(name=self._name, healthy=True)
         except BaseException:  # noqa: BLE001
             return HealthCheckResult(name=self._name, healthy=False, error_details=format_exc())
+
+    def to_dict(self) -> dict[str, Any]:
+        """Converts the FunctionHealthCheck object to a dictionary.
+
+        Returns:
+            A dictionary with the FunctionHealthCheck attributes.
+        """
+        return {
+            "func": self._func,
+            "args": self._args,
+            "kwargs": self._kwargs,
+            "timeout": self._timeout,
+            "name": self._name,
+        }
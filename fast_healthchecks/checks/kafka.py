@@ -2,9 +2,14 @@
 
 Classes:
     KafkaHealthCheck: A class to perform health checks on Kafka.
+    KafkaClientHealthCheck: A class to perform health checks with an application-owned Kafka client.
 
 Usage:
     The KafkaHealthCheck class can be used to perform health checks on Kafka by calling it.
+    With `persistent=True` the check keeps one bootstrapped client between calls and sends a single
+    metadata request per call to the first broker that answers, reporting the brokers of the
+    cluster in the result details.
+    `KafkaHealthCheck.from_client` does the same with the client or the producer of the application.
 
 Example:
     health_check = KafkaHealthCheck(
@@ -15,17 +20,21 @@ Example:
     print(result.healthy)
 """
 
+import asyncio
 import ssl
 from traceback import format_exc
 from typing import Any, Literal, TypeAlias, final
 
-from fast_healthchecks.checks._base import DEFAULT_HC_TIMEOUT, HealthCheck
+from fast_healthchecks.checks._base import DEFAULT_HC_TIMEOUT, HealthCheck, split_host_port, tcp_preflight
 from fast_healthchecks.models import HealthCheckResult
+from fast_healthchecks.tls import get_ssl_context
 
 IMPORT_ERROR_MSG = "aiokafka is not installed. Install it with `pip install aiokafka`."
 
 try:
-    from aiokafka import AIOKafkaClient
+    from aiokafka import AIOKafkaClient, AIOKafkaProducer
+    from aiokafka.errors import KafkaError
+    from aiokafka.protocol.metadata import MetadataRequest
 except ImportError as exc:
     raise ImportError(IMPORT_ERROR_MSG) from exc
 
@@ -33,11 +42,40 @@ SecurityProtocol: TypeAlias = Literal["SSL", "PLAINTEXT", "SASL_PLAINTEXT", "SAS
 SaslMechanism: TypeAlias = Literal["PLAIN", "GSSAPI", "SCRAM-SHA-256", "SCRAM-SHA-512", "OAUTHBEARER"]
 
 
+async def _describe_cluster(client: AIOKafkaClient, preferred: int | None) -> tuple[dict[str, Any], int]:
+    """Fetch the cluster metadata from the first broker that answers, returning it and the broker.
+
+    The broker that answered the previous call is asked first, its connection is kept open by the
+    client, so an unreachable broker neither delays nor fails the check while another one answers.
+    """
+    node_ids = sorted(broker.nodeId for broker in client.cluster.brokers())
+    if preferred in node_ids:
+        node_ids.remove(preferred)
+        node_ids.insert(0, preferred)
+    errors: list[str] = []
+    for node_id in node_ids:
+        try:
+            # A single metadata request without topics, the brokers and the controller only.
+            response = await client.send(node_id, MetadataRequest[1]([]))
+        except KafkaError as exc:
+            errors.append(f"node {node_id}: {exc!r}")
+            continue
+        brokers = sorted(response.brokers)
+        return {
+            "node": node_id,
+            "controller": response.controller_id if response.controller_id >= 0 else None,
+            "brokers": [f"{host}:{port}" for _, host, port, _ in brokers],
+        }, node_id
+    msg = f"Unable to get cluster metadata from any broker: {'; '.join(errors) or 'no known brokers'}"
+    raise KafkaError(msg)
+
+
 @final
 class KafkaHealthCheck(HealthCheck[HealthCheckResult]):
     """A class to perform health checks on Kafka.
 
     Attributes:
+        _client: The bootstrapped client kept in persistent mode.
         _bootstrap_servers: The Kafka bootstrap servers.
         _name: The name of the health check.
         _sasl_mechanism: The SASL mechanism to use.
@@ -45,12 +83,19 @@ class KafkaHealthCheck(HealthCheck[HealthCheckResult]):
         _sasl_plain_username: The SASL plain username.
         _security_protocol: The security protocol to use.
         _ssl_context: The SSL context to use.
+        _preflight: Whether to check TCP reachability before connecting.
+        _persistent: Whether to keep one bootstrapped client between calls.
+        _node_id: The broker that answered the previous metadata request in persistent mode.
         _timeout: The timeout for the health check.
     """
 
     __slots__ = (
         "_bootstrap_servers",
+        "_client",
         "_name",
+        "_node_id",
+        "_persistent",
+        "_preflight",
         "_sasl_mechanism",
         "_sasl_plain_password",
         "_sasl_plain_username",
@@ -65,6 +110,10 @@ class KafkaHealthCheck(HealthCheck[HealthCheckResult]):
     _sasl_mechanism: SaslMechanism
     _sasl_plain_username: str | None
     _sasl_plain_password: str | None
+    _preflight: bool
+    _persistent: bool
+    _client: AIOKafkaClient | None
+    _node_id: int | None
     _timeout: float
     _name: str
 
@@ -77,6 +126,8 @@ class KafkaHealthCheck(HealthCheck[HealthCheckResult]):
         sasl_mechanism: SaslMechanism = "PLAIN",
         sasl_plain_username: str | None = None,
         sasl_plain_password: str | None = None,
+        preflight: bool = False,
+        persistent: bool = False,
         timeout: float = DEFAULT_HC_TIMEOUT,
         name: str = "Kafka",
     ) -> None:
@@ -84,11 +135,13 @@ class KafkaHealthCheck(HealthCheck[HealthCheckResult]):
 
         Args:
             bootstrap_servers: The Kafka bootstrap servers.
-            ssl_context: The SSL context to use.
+            ssl_context: The SSL context to use. Defaults to the shared one of the package for the SSL protocols.
             security_protocol: The security protocol to use.
             sasl_mechanism: The SASL mechanism to use.
             sasl_plain_username: The SASL plain username.
             sasl_plain_password: The SASL plain password.
+            preflight: Whether to check TCP reachability before connecting.
+            persistent: Whether to keep one bootstrapped client between calls.
             timeout: The timeout for the health check.
             name: The name of the health check.
         """
@@ -104,34 +157,105 @@ class KafkaHealthCheck(HealthCheck[HealthCheckResult]):
         self._sasl_mechanism = sasl_mechanism
         self._sasl_plain_username = sasl_plain_username
         self._sasl_plain_password = sasl_plain_password
+        self._preflight = preflight
+        self._persistent = persistent
+        self._client = None
+        self._node_id = None
         self._timeout = timeout
         self._name = name
 
+    @classmethod
+    def from_client(
+        cls,
+        client: AIOKafkaClient | AIOKafkaProducer,
+        *,
+        name: str = "Kafka",
+        timeout: float = DEFAULT_HC_TIMEOUT,
+    ) -> "KafkaClientHealthCheck":
+        """Creates a health check that reuses an existing client.
+
+        Args:
+            client: The started client or producer used by the application.
+            name: The name of the health check.
+            timeout: The timeout for the metadata request.
+
+        Returns:
+            A KafkaClientHealthCheck instance.
+        """
+        if isinstance(client, AIOKafkaProducer):
+            client = client.client
+        return KafkaClientHealthCheck(client=client, timeout=timeout, name=name)
+
     async def __call__(self) -> HealthCheckResult:
         """Performs the health check on Kafka.
 
         Returns:
             A HealthCheckResult object.
         """
-        client = AIOKafkaClient(
+        if self._persistent:
+            return await self._check_persistent()
+        client = self._create_client()
+        try:
+            if self._preflight:
+                await tcp_preflight(self._addresses(), self._timeout)
+            await client.bootstrap()
+            await client.check_version()
+            return HealthCheckResult(name=self._name, healthy=True)
+        except BaseException:  # noqa: BLE001
+            return HealthCheckResult(name=self._name, healthy=False, error_details=format_exc())
+        finally:
+            await client.close()
+
+    def _create_client(self) -> AIOKafkaClient:
+        return AIOKafkaClient(
             bootstrap_servers=self._bootstrap_servers,
             client_id="fast_healthchecks",
             request_timeout_ms=int(self._timeout * 1000),
-            ssl_context=self._ssl_context,
+            ssl_context=self._client_ssl_context(),
             security_protocol=self._security_protocol,
             sasl_mechanism=self._sasl_mechanism,
             sasl_plain_username=self._sasl_plain_username,
             sasl_plain_password=self._sasl_plain_password,
         )
+
+    def _client_ssl_context(self) -> ssl.SSLContext | None:
+        if self._ssl_context is None and self._security_protocol in {"SSL", "SASL_SSL"}:
+            return get_ssl_context()
+        return self._ssl_context
+
+    async def _check_persistent(self) -> HealthCheckResult:
         try:
-            await client.bootstrap()
-            await client.check_version()
-            return HealthCheckResult(name=self._name, healthy=True)
+            if self._client is None:
+                if self._preflight:
+                    await tcp_preflight(self._addresses(), self._timeout)
+                client = self._create_client()
+                try:
+                    await client.bootstrap()
+                except BaseException:
+                    await client.close()
+                    raise
+                self._client = client
+            details, self._node_id = await _describe_cluster(self._client, self._node_id)
+            return HealthCheckResult(name=self._name, healthy=True, details=details)
         except BaseException:  # noqa: BLE001
+            # No broker answered, bootstrap again on the next call.
+            await self.aclose()
             return HealthCheckResult(name=self._name, healthy=False, error_details=format_exc())
-        finally:
+
+    async def aclose(self) -> None:
+        """Close the bootstrapped client kept in persistent mode."""
+        client, self._client = self._client, None
+        if client is not None:
             await client.close()
 
+    @property
+    def dependency(self) -> str:
+        """Return the comma-separated `host:port` list of the bootstrap servers."""
+        return ",".join(f"{host}:{port}" for host, port in self._addresses())
+
+    def _addresses(self) -> list[tuple[str, int]]:
+        return [split_host_port(server.strip(), 9092) for server in self._bootstrap_servers.split(",")]
+
     def to_dict(self) -> dict[str, Any]:
         """Converts the KafkaHealthCheck object to a dictionary.
 
@@ -145,6 +269,78 @@ class KafkaHealthCheck(HealthCheck[HealthCheckResult]):
             "sasl_mechanism": self._sasl_mechanism,
             "sasl_plain_username": self._sasl_plain_username,
             "sasl_plain_password": self._sasl_plain_password,
+            "preflight": self._preflight,
+            "persistent": self._persistent,
+            "timeout": self._timeout,
+            "name": self._name,
+        }
+
+
+@final
+class KafkaClientHealthCheck(HealthCheck[HealthCheckResult]):
+    """A class to perform health checks with an application-owned Kafka client.
+
+    Attributes:
+        _client: The bootstrapped client used by the application.
+        _name: The name of the health check.
+        _node_id: The broker that answered the previous metadata request.
+        _timeout: The timeout for the metadata request.
+    """
+
+    __slots__ = ("_client", "_name", "_node_id", "_timeout")
+
+    _client: AIOKafkaClient
+    _node_id: int | None
+    _timeout: float
+    _name: str
+
+    def __init__(
+        self,
+        *,
+        client: AIOKafkaClient,
+        timeout: float = DEFAULT_HC_TIMEOUT,
+        name: str = "Kafka",
+    ) -> None:
+        """Initializes the KafkaClientHealthCheck object.
+
+        Args:
+            client: The bootstrapped client used by the application.
+            timeout: The timeout for the metadata request.
+            name: The name of the health check.
+        """
+        self._client = client
+        self._node_id = None
+        self._timeout = timeout
+        self._name = name
+
+    async def __call__(self) -> HealthCheckResult:
+        """Performs the health check with the client of the application.
+
+        Returns:
+            A HealthCheckResult object.
+        """
+        try:
+            details, self._node_id = await asyncio.wait_for(
+                _describe_cluster(self._client, self._node_id),
+                self._timeout,
+            )
+            return HealthCheckResult(name=self._name, healthy=True, details=details)
+        except BaseException:  # noqa: BLE001
+            return HealthCheckResult(name=self._name, healthy=False, error_details=format_exc())
+
+    @property
+    def dependency(self) -> str | None:
+        """Return the comma-separated `host:port` list of the brokers known to the client."""
+        return ",".join(sorted(f"{broker.host}:{broker.port}" for broker in self._client.cluster.brokers())) or None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Converts the KafkaClientHealthCheck object to a dictionary.
+
+        Returns:
+            A dictionary with the KafkaClientHealthCheck attributes.
+        """
+        return {
+            "client": self._client,
             "timeout": self._timeout,
             "name": self._name,
         }
@@ -2,9 +2,16 @@
 
 Classes:
     MongoHealthCheck: A class to perform health checks on MongoDB.
+    MongoClientHealthCheck: A class to perform health checks with an application-owned MongoDB client.
 
 Usage:
     The MongoHealthCheck class can be used to perform health checks on MongoDB by calling it.
+    The native asyncio client of pymongo (`AsyncMongoClient`) is used when it is available, and motor
+    otherwise; pass `driver` to choose explicitly.
+    With `passive=True` the check keeps one client between calls and answers from the topology
+    description maintained by the driver's server monitors, with zero additional round trips. It
+    falls back to `ping` only when the topology is stale.
+    `MongoHealthCheck.from_client` reuses the client of the application, of either driver, instead.
 
 Example:
     health_check = MongoHealthCheck(
@@ -19,30 +26,123 @@ Example:
     print(result.healthy)
 """
 
+import asyncio
+import inspect
 import logging
+import time
+from itertools import starmap
 from traceback import format_exc
-from typing import Any, TypedDict, final
-from urllib.parse import ParseResult, unquote, urlparse
+from typing import TYPE_CHECKING, Any, Literal, TypeAlias, TypedDict, final
 
-from fast_healthchecks.checks._base import DEFAULT_HC_TIMEOUT, HealthCheckDSN
+from fast_healthchecks.checks._base import (
+    DEFAULT_HC_TIMEOUT,
+    HealthCheck,
+    HealthCheckDSN,
+    split_host_port,
+    tcp_preflight,
+)
 from fast_healthchecks.compat import MongoDsn
+from fast_healthchecks.dsn import DSN, MONGO_SCHEMES, parse_dsn
 from fast_healthchecks.models import HealthCheckResult
 
-IMPORT_ERROR_MSG = "motor is not installed. Install it with `pip install motor`."
+IMPORT_ERROR_MSG = (
+    "motor is not installed. Install it with `pip install motor`, "
+    "or install `pymongo>=4.11` to use its native asyncio client."
+)
+
+try:
+    from pymongo import AsyncMongoClient
+
+    PYMONGO_ASYNC_INSTALLED = True
+except ImportError:
+    PYMONGO_ASYNC_INSTALLED = False
 
 try:
     from motor.motor_asyncio import AsyncIOMotorClient
-except ImportError as exc:
-    raise ImportError(IMPORT_ERROR_MSG) from exc
 
+    MOTOR_INSTALLED = True
+except ImportError:
+    MOTOR_INSTALLED = False
+
+if not PYMONGO_ASYNC_INSTALLED and not MOTOR_INSTALLED:
+    raise ImportError(IMPORT_ERROR_MSG) from None
+
+if TYPE_CHECKING:
+    from pymongo.topology_description import TopologyDescription
+
+    MongoClient: TypeAlias = AsyncMongoClient[dict[str, Any]] | AsyncIOMotorClient[dict[str, Any]]
+
+MongoDriver: TypeAlias = Literal["pymongo", "motor"]
+
+_SRV_PREFIX = "mongodb+srv://"
 
 logger = logging.getLogger(__name__)
 
 
+def _join_host_port(host: str, port: int | None) -> str:
+    if ":" in host:
+        host = f"[{host}]"
+    return host if port is None else f"{host}:{port}"
+
+
+def _default_driver() -> MongoDriver:
+    return "pymongo" if PYMONGO_ASYNC_INSTALLED else "motor"
+
+
+async def _close(client: "MongoClient") -> None:
+    # `AsyncMongoClient.close` is a coroutine, `AsyncIOMotorClient.close` is not.
+    result = client.close()
+    if inspect.isawaitable(result):
+        await result
+
+
+def _is_stale(topology: "TopologyDescription") -> bool:
+    """Return whether the topology was not refreshed by the server monitors within two heartbeats."""
+    if not topology.has_known_servers:
+        return True
+    last_update = max(server.last_update_time for server in topology.server_descriptions().values())
+    return time.monotonic() - last_update > 2 * topology.heartbeat_frequency
+
+
+def _describe(topology: "TopologyDescription") -> dict[str, Any]:
+    """Summarize the topology as seen by the server monitors of the driver."""
+    now = time.monotonic()
+    return {
+        "topology_type": topology.topology_type_name,
+        "replica_set_name": topology.replica_set_name,
+        "servers": {
+            f"{host}:{port}": {
+                "type": server.server_type_name,
+                "round_trip_time_ms": server.round_trip_time * 1000 if server.round_trip_time is not None else None,
+                "last_heartbeat_age": now - server.last_update_time,
+                "error": str(server.error) if server.error else None,
+            }
+            for (host, port), server in topology.server_descriptions().items()
+        },
+    }
+
+
+async def _ping(client: "MongoClient", database: str, name: str) -> HealthCheckResult:
+    res = await client[database].command("ping")
+    return HealthCheckResult(name=name, healthy=res.get("ok") == 1.0)
+
+
+async def _check_topology(client: "MongoClient", database: str, name: str) -> HealthCheckResult:
+    """Answer from the topology description, and `ping` only when it is stale."""
+    topology = client.topology_description
+    if _is_stale(topology):
+        # The server monitors have not reported yet or stopped reporting: ask the server directly.
+        result = await _ping(client, database, name)
+        result.details = _describe(client.topology_description)
+        return result
+    # Like `ping` with the default read preference, the deployment is healthy if a primary is available.
+    return HealthCheckResult(name=name, healthy=topology.has_writable_server(), details=_describe(topology))
+
+
 class ParseDSNResult(TypedDict, total=True):
     """A dictionary containing the results of parsing a DSN."""
 
-    parse_result: ParseResult
+    parse_result: DSN
     authSource: str
 
 
@@ -52,22 +152,30 @@ class MongoHealthCheck(HealthCheckDSN[HealthCheckResult]):
 
     Attributes:
         _auth_source: The MongoDB authentication source.
+        _client: The client kept in passive mode.
         _database: The MongoDB database to use.
         _hosts: The MongoDB host or a list of hosts.
         _name: The name of the health check.
         _password: The MongoDB password.
         _port: The MongoDB port.
+        _preflight: Whether to check TCP reachability before connecting.
+        _passive: Whether to keep one client between calls and answer from its topology monitoring.
+        _driver: The driver to use, `pymongo` or `motor`, defaults to `pymongo` when its asyncio client is available.
         _timeout: The timeout for the health check.
         _user: The MongoDB user.
     """
 
     __slots__ = (
         "_auth_source",
+        "_client",
         "_database",
+        "_driver",
         "_hosts",
         "_name",
+        "_passive",
         "_password",
         "_port",
+        "_preflight",
         "_timeout",
         "_user",
     )
@@ -78,6 +186,10 @@ class MongoHealthCheck(HealthCheckDSN[HealthCheckResult]):
     _password: str | None
     _database: str | None
     _auth_source: str
+    _preflight: bool
+    _passive: bool
+    _client: "MongoClient | None"
+    _driver: MongoDriver | None
     _timeout: float
     _name: str
 
@@ -90,18 +202,24 @@ class MongoHealthCheck(HealthCheckDSN[HealthCheckResult]):
         password: str | None = None,
         database: str | None = None,
         auth_source: str = "admin",
+        preflight: bool = False,
+        passive: bool = False,
+        driver: "MongoDriver | None" = None,
         timeout: float = DEFAULT_HC_TIMEOUT,
         name: str = "MongoDB",
     ) -> None:
         """Initializes the MongoHealthCheck class.
 
         Args:
-            hosts: The MongoDB host or list of hosts.
+            hosts: The MongoDB host or list of hosts, or a `mongodb+srv://` URI with the seed hostname.
             port: The MongoDB port (используется, если host — строка).
             user: The MongoDB user.
             password: The MongoDB password.
             database: The MongoDB database to use.
             auth_source: The MongoDB authentication source.
+            preflight: Whether to check TCP reachability before connecting.
+            passive: Whether to keep one client between calls and answer from its topology monitoring.
+            driver: The driver to use, `pymongo` or `motor`, defaults to `pymongo` when its asyncio client is available.
             timeout: The timeout for the health check.
             name: The name of the health check.
         """
@@ -111,6 +229,19 @@ class MongoHealthCheck(HealthCheckDSN[HealthCheckResult]):
         self._password = password
         self._database = database
         self._auth_source = auth_source
+        self._preflight = preflight
+        self._passive = passive
+        self._client = None
+        if driver not in {None, "pymongo", "motor"}:
+            msg = f"Invalid driver: {driver}"
+            raise ValueError(msg) from None
+        if driver == "pymongo" and not PYMONGO_ASYNC_INSTALLED:
+            msg = "pymongo asyncio client is not available. Install it with `pip install pymongo>=4.11`."
+            raise ImportError(msg) from None
+        if driver == "motor" and not MOTOR_INSTALLED:
+            msg = "motor is not installed. Install it with `pip install motor`."
+            raise ImportError(msg) from None
+        self._driver = driver
         self._timeout = timeout
         self._name = name
 
@@ -124,21 +255,19 @@ class MongoHealthCheck(HealthCheckDSN[HealthCheckResult]):
         Returns:
             ParseDSNResult: The results of parsing the DSN.
         """
-        parse_result: ParseResult = urlparse(dsn)
-        query = (
-            {k: unquote(v) for k, v in (q.split("=") for q in parse_result.query.split("&"))}
-            if parse_result.query
-            else {}
-        )
-        return {"parse_result": parse_result, "authSource": query.get("authSource", "admin")}
+        parse_result = parse_dsn(dsn, MONGO_SCHEMES)
+        return {"parse_result": parse_result, "authSource": parse_result.options.get("authSource", "admin")}
 
     @classmethod
-    def from_dsn(
+    def from_dsn(  # noqa: PLR0913
         cls,
         dsn: "MongoDsn | str",
         *,
         name: str = "MongoDB",
         timeout: float = DEFAULT_HC_TIMEOUT,
+        preflight: bool = False,
+        passive: bool = False,
+        driver: "MongoDriver | None" = None,
     ) -> "MongoHealthCheck":
         """Creates a MongoHealthCheck instance from a DSN.
 
@@ -146,6 +275,9 @@ class MongoHealthCheck(HealthCheckDSN[HealthCheckResult]):
             dsn (MongoDsn | str): The DSN for the MongoDB database.
             name (str): The name of the health check.
             timeout (float): The timeout for the connection.
+            preflight: Whether to check TCP reachability before connecting.
+            passive: Whether to keep one client between calls and answer from its topology monitoring.
+            driver: The driver to use, `pymongo` or `motor`, defaults to `pymongo` when its asyncio client is available.
 
         Returns:
             MongoHealthCheck: The health check instance.
@@ -155,55 +287,128 @@ class MongoHealthCheck(HealthCheckDSN[HealthCheckResult]):
         parse_result = parsed_dsn["parse_result"]
         hosts: str | list[str]
         port: int | None
-        if "," in parse_result.netloc:
-            hosts = parse_result.netloc.split("@")[1].split(",")
+        if parse_result.scheme == "mongodb+srv":
+            if preflight:
+                msg = "preflight is not supported for mongodb+srv DSNs, the servers are listed in DNS"
+                raise ValueError(msg) from None
+            host, _ = parse_result.address("localhost", 27017)
+            hosts, port = f"{_SRV_PREFIX}{host}", None
+        elif len(parse_result.hosts) > 1:
+            hosts = list(starmap(_join_host_port, parse_result.hosts))
             port = None
         else:
-            hosts = parse_result.hostname or "localhost"
-            port = parse_result.port or 27017
+            hosts, port = parse_result.address("localhost", 27017)
         return cls(
             hosts=hosts,
             port=port,
-            user=parse_result.username,
+            user=parse_result.user,
             password=parse_result.password,
-            database=parse_result.path.lstrip("/") or None,
+            database=parse_result.path or None,
             auth_source=parsed_dsn["authSource"],
+            preflight=preflight,
+            passive=passive,
+            driver=driver,
             timeout=timeout,
             name=name,
         )
 
+    @classmethod
+    def from_client(
+        cls,
+        client: "MongoClient",
+        *,
+        database: str = "admin",
+        passive: bool = False,
+        name: str = "MongoDB",
+        timeout: float = DEFAULT_HC_TIMEOUT,
+    ) -> "MongoClientHealthCheck":
+        """Creates a health check that reuses an existing client.
+
+        Args:
+            client: The `AsyncMongoClient` or `AsyncIOMotorClient` used by the application.
+            database: The database to run `ping` against.
+            passive: Whether to answer from the topology description maintained by the client.
+            name: The name of the health check.
+            timeout: The timeout for the `ping` command.
+
+        Returns:
+            A MongoClientHealthCheck instance.
+        """
+        return MongoClientHealthCheck(client=client, database=database, passive=passive, timeout=timeout, name=name)
+
     async def __call__(self) -> HealthCheckResult:
         """Performs the health check on MongoDB.
 
         Returns:
             A HealthCheckResult object.
         """
-        client: AsyncIOMotorClient[dict[str, Any]]
+        if self._passive:
+            return await self._check_passive()
+        client = self._create_client()
+        try:
+            if self._preflight:
+                await tcp_preflight(self._addresses(), self._timeout)
+            return await self._ping(client)
+        except BaseException:  # noqa: BLE001
+            return HealthCheckResult(name=self._name, healthy=False, error_details=format_exc())
+        finally:
+            await _close(client)
+
+    def _create_client(self) -> "MongoClient":
+        # The native asyncio client of pymongo avoids the thread pool hops of motor.
+        client_class = AsyncMongoClient if (self._driver or _default_driver()) == "pymongo" else AsyncIOMotorClient
         if isinstance(self._hosts, list):
-            client = AsyncIOMotorClient(  # pragma: no cover
-                host=self._hosts,
-                username=self._user,
-                password=self._password,
-                authSource=self._auth_source,
-                serverSelectionTimeoutMS=int(self._timeout * 1000),
-            )
-        else:
-            client = AsyncIOMotorClient(
+            return client_class(  # pragma: no cover
                 host=self._hosts,
-                port=self._port,
                 username=self._user,
                 password=self._password,
                 authSource=self._auth_source,
                 serverSelectionTimeoutMS=int(self._timeout * 1000),
+                connectTimeoutMS=int(self._timeout * 1000),
+                socketTimeoutMS=int(self._timeout * 1000),
             )
-        database = client[self._database] if self._database else client[self._auth_source]
+        return client_class(
+            host=self._hosts,
+            port=self._port,
+            username=self._user,
+            password=self._password,
+            authSource=self._auth_source,
+            serverSelectionTimeoutMS=int(self._timeout * 1000),
+            connectTimeoutMS=int(self._timeout * 1000),
+            socketTimeoutMS=int(self._timeout * 1000),
+        )
+
+    async def _ping(self, client: "MongoClient") -> HealthCheckResult:
+        return await _ping(client, self._database or self._auth_source, self._name)
+
+    async def _check_passive(self) -> HealthCheckResult:
         try:
-            res = await database.command("ping")
-            return HealthCheckResult(name=self._name, healthy=res.get("ok") == 1.0)
+            if self._client is None:
+                if self._preflight:
+                    await tcp_preflight(self._addresses(), self._timeout)
+                self._client = self._create_client()
+            return await _check_topology(self._client, self._database or self._auth_source, self._name)
         except BaseException:  # noqa: BLE001
+            await self.aclose()
             return HealthCheckResult(name=self._name, healthy=False, error_details=format_exc())
-        finally:
-            client.close()
+
+    async def aclose(self) -> None:
+        """Close the client kept in passive mode."""
+        client, self._client = self._client, None
+        if client is not None:
+            await _close(client)
+
+    @property
+    def dependency(self) -> str:
+        """Return the comma-separated `host:port` list of the MongoDB servers, or the `mongodb+srv://` seed."""
+        if isinstance(self._hosts, str) and self._hosts.startswith(_SRV_PREFIX):
+            # The servers are listed in the SRV records of the seed, which has no port of its own.
+            return self._hosts
+        return ",".join(f"{host}:{port}" for host, port in self._addresses())
+
+    def _addresses(self) -> list[tuple[str, int]]:
+        hosts = self._hosts.removeprefix(_SRV_PREFIX).split(",") if isinstance(self._hosts, str) else self._hosts
+        return [split_host_port(host, self._port or 27017) for host in hosts]
 
     def to_dict(self) -> dict[str, Any]:
         """Converts the MongoHealthCheck object to a dictionary.
@@ -218,6 +423,86 @@ class MongoHealthCheck(HealthCheckDSN[HealthCheckResult]):
             "password": self._password,
             "database": self._database,
             "auth_source": self._auth_source,
+            "preflight": self._preflight,
+            "passive": self._passive,
+            "driver": self._driver,
+            "timeout": self._timeout,
+            "name": self._name,
+        }
+
+
+@final
+class MongoClientHealthCheck(HealthCheck[HealthCheckResult]):
+    """A class to perform health checks with an application-owned MongoDB client.
+
+    Attributes:
+        _client: The client used by the application.
+        _database: The database to run `ping` against.
+        _name: The name of the health check.
+        _passive: Whether to answer from the topology description maintained by the client.
+        _timeout: The timeout for the `ping` command.
+    """
+
+    __slots__ = ("_client", "_database", "_name", "_passive", "_timeout")
+
+    _client: "MongoClient"
+    _database: str
+    _passive: bool
+    _timeout: float
+    _name: str
+
+    def __init__(
+        self,
+        *,
+        client: "MongoClient",
+        database: str = "admin",
+        passive: bool = False,
+        timeout: float = DEFAULT_HC_TIMEOUT,
+        name: str = "MongoDB",
+    ) -> None:
+        """Initializes the MongoClientHealthCheck object.
+
+        Args:
+            client: The client used by the application.
+            database: The database to run `ping` against.
+            passive: Whether to answer from the topology description maintained by the client.
+            timeout: The timeout for the `ping` command.
+            name: The name of the health check.
+        """
+        self._client = client
+        self._database = database
+        self._passive = passive
+        self._timeout = timeout
+        self._name = name
+
+    async def __call__(self) -> HealthCheckResult:
+        """Performs the health check with the client of the application.
+
+        Returns:
+            A HealthCheckResult object.
+        """
+        check = _check_topology if self._passive else _ping
+        try:
+            return await asyncio.wait_for(check(self._client, self._database, self._name), self._timeout)
+        except BaseException:  # noqa: BLE001
+            return HealthCheckResult(name=self._name, healthy=False, error_details=format_exc())
+
+    @property
+    def dependency(self) -> str | None:
+        """Return the comma-separated `host:port` list of the servers in the topology of the client."""
+        addresses = sorted(self._client.topology_description.server_descriptions())
+        return ",".join(f"{host}:{port}" for host, port in addresses) or None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Converts the MongoClientHealthCheck object to a dictionary.
+
+        Returns:
+            A dictionary with the MongoClientHealthCheck attributes.
+        """
+        return {
+            "client": self._client,
+            "database": self._database,
+            "passive": self._passive,
             "timeout": self._timeout,
             "name": self._name,
         }
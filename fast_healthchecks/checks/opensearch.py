@@ -2,9 +2,15 @@
 
 Classes:
     OpenSearchHealthCheck: A class to perform health checks on OpenSearch.
+    OpenSearchClientHealthCheck: A class to perform health checks with an application-owned OpenSearch client.
 
 Usage:
     The OpenSearchHealthCheck class can be used to perform health checks on OpenSearch by calling it.
+    With `persistent=True` the check keeps one client, and its connection pool, between calls.
+    With `cluster_health=True` the check queries `_cluster/health` of the node it talks to instead of
+    the root endpoint, is unhealthy when the cluster status is red and reports the status, the number
+    of pending tasks and the number of unassigned shards in the result details.
+    `OpenSearchHealthCheck.from_client` reuses the client of the application instead.
 
 Example:
     health_check = OpenSearchHealthCheck(
@@ -19,20 +25,43 @@ Example:
     print(result.healthy)
 """
 
+import asyncio
+import ssl
+import warnings
+from pathlib import Path
 from traceback import format_exc
 from typing import Any, final
 
 from fast_healthchecks.checks._base import DEFAULT_HC_TIMEOUT, HealthCheck
 from fast_healthchecks.models import HealthCheckResult
+from fast_healthchecks.tls import get_ssl_context
 
 IMPORT_ERROR_MSG = "opensearch-py is not installed. Install it with `pip install opensearch-py`."
 
 try:
+    import certifi
     from opensearchpy import AsyncOpenSearch  # ty: ignore[possibly-unbound-import]
 except ImportError as exc:
     raise ImportError(IMPORT_ERROR_MSG) from exc
 
 
+async def _info(client: AsyncOpenSearch, name: str, timeout: float) -> HealthCheckResult:  # noqa: ARG001
+    info = await client.info()
+    return HealthCheckResult(name=name, healthy=info["version"]["number"] is not None)
+
+
+async def _cluster_health(client: AsyncOpenSearch, name: str, timeout: float) -> HealthCheckResult:
+    # `local` answers from the node's own cluster state, so a lost cluster manager does not
+    # stall the check, and `timeout` bounds the request on the server side as well.
+    health = await client.cluster.health(local=True, timeout=f"{int(timeout * 1000)}ms")
+    details = {
+        "status": health["status"],
+        "pending_tasks": health["number_of_pending_tasks"],
+        "unassigned_shards": health["unassigned_shards"],
+    }
+    return HealthCheckResult(name=name, healthy=health["status"] != "red", details=details)
+
+
 @final
 class OpenSearchHealthCheck(HealthCheck[HealthCheckResult]):
     """A class to perform health checks on OpenSearch.
@@ -45,14 +74,20 @@ class OpenSearchHealthCheck(HealthCheck[HealthCheckResult]):
         _verify_certs: Whether to verify certificates or not.
         _ssl_show_warn: Whether to show SSL warnings or not.
         _ca_certs: The CA certificates.
+        _cluster_health: Whether to query the cluster health instead of the node info.
+        _persistent: Whether to keep one client between calls.
+        _client: The client kept in persistent mode.
         _timeout: The timeout for the health check.
     """
 
     __slots__ = (
         "_ca_certs",
+        "_client",
+        "_cluster_health",
         "_hosts",
         "_http_auth",
         "_name",
+        "_persistent",
         "_ssl_show_warn",
         "_timeout",
         "_use_ssl",
@@ -65,6 +100,9 @@ class OpenSearchHealthCheck(HealthCheck[HealthCheckResult]):
     _verify_certs: bool
     _ssl_show_warn: bool
     _ca_certs: str | None
+    _cluster_health: bool
+    _persistent: bool
+    _client: AsyncOpenSearch | None
     _timeout: float
     _name: str
 
@@ -77,6 +115,8 @@ class OpenSearchHealthCheck(HealthCheck[HealthCheckResult]):
         verify_certs: bool = False,
         ssl_show_warn: bool = False,
         ca_certs: str | None = None,
+        cluster_health: bool = False,
+        persistent: bool = False,
         timeout: float = DEFAULT_HC_TIMEOUT,
         name: str = "OpenSearch",
     ) -> None:
@@ -89,6 +129,8 @@ class OpenSearchHealthCheck(HealthCheck[HealthCheckResult]):
             verify_certs: Whether to verify certificates or not.
             ssl_show_warn: Whether to show SSL warnings or not.
             ca_certs: The CA certificates.
+            cluster_health: Whether to query the cluster health instead of the node info.
+            persistent: Whether to keep one client between calls.
             timeout: The timeout for the health check.
             name: The name of the health check.
         """
@@ -98,31 +140,98 @@ class OpenSearchHealthCheck(HealthCheck[HealthCheckResult]):
         self._verify_certs = verify_certs
         self._ssl_show_warn = ssl_show_warn
         self._ca_certs = ca_certs
+        self._cluster_health = cluster_health
+        self._persistent = persistent
+        self._client = None
         self._timeout = timeout
         self._name = name
 
+    @classmethod
+    def from_client(
+        cls,
+        client: AsyncOpenSearch,
+        *,
+        cluster_health: bool = False,
+        timeout: float = DEFAULT_HC_TIMEOUT,
+        name: str = "OpenSearch",
+    ) -> "OpenSearchClientHealthCheck":
+        """Creates a health check that reuses an existing client.
+
+        Args:
+            client: The client used by the application.
+            cluster_health: Whether to query the cluster health instead of the node info.
+            timeout: The timeout for the health check.
+            name: The name of the health check.
+
+        Returns:
+            An OpenSearchClientHealthCheck object.
+        """
+        return OpenSearchClientHealthCheck(client=client, cluster_health=cluster_health, timeout=timeout, name=name)
+
     async def __call__(self) -> HealthCheckResult:
         """Performs the health check on OpenSearch.
 
         Returns:
             A HealthCheckResult object.
         """
-        client = AsyncOpenSearch(
+        client = self._client
+        try:
+            if client is None:
+                client = self._create_client()
+                if self._persistent:
+                    self._client = client
+            check = _cluster_health if self._cluster_health else _info
+            return await check(client, self._name, self._timeout)
+        except BaseException:  # noqa: BLE001
+            if self._persistent:
+                await self.aclose()
+            return HealthCheckResult(name=self._name, healthy=False, error_details=format_exc())
+        finally:
+            if not self._persistent and client is not None:
+                await client.close()
+
+    def _create_client(self) -> AsyncOpenSearch:
+        if self._use_ssl:
+            # opensearch-py ignores ssl_show_warn next to an ssl_context, so its insecure connection
+            # warning is issued here.
+            if not self._verify_certs and self._ssl_show_warn:
+                for host in self._hosts:
+                    warnings.warn(f"Connecting to {host} using SSL with verify_certs=False is insecure.", stacklevel=2)
+            return AsyncOpenSearch(
+                hosts=self._hosts,
+                http_auth=self._http_auth,
+                use_ssl=True,
+                ssl_context=self._ssl_context(),
+                timeout=self._timeout,
+            )
+        return AsyncOpenSearch(
             hosts=self._hosts,
             http_auth=self._http_auth,
             use_ssl=self._use_ssl,
             verify_certs=self._verify_certs,
             ssl_show_warn=self._ssl_show_warn,
             ca_certs=self._ca_certs,
+            timeout=self._timeout,
         )
-        try:
-            info = await client.info()
-            return HealthCheckResult(name=self._name, healthy=info["version"]["number"] is not None)
-        except BaseException:  # noqa: BLE001
-            return HealthCheckResult(name=self._name, healthy=False, error_details=format_exc())
-        finally:
+
+    def _ssl_context(self) -> ssl.SSLContext:
+        # The same CA certificates as opensearch-py uses by default, from the package-wide SSL context registry.
+        ca_certs = self._ca_certs or certifi.where()
+        if Path(ca_certs).is_dir():
+            return get_ssl_context(verify=self._verify_certs, capath=ca_certs)
+        return get_ssl_context(verify=self._verify_certs, cafile=ca_certs)
+
+    async def aclose(self) -> None:
+        """Close the client kept in persistent mode."""
+        client, self._client = self._client, None
+        if client is not None:
             await client.close()
 
+    @property
+    def dependency(self) -> str:
+        """Return the comma-separated list of the OpenSearch hosts."""
+        return ",".join(self._hosts)
+
     def to_dict(self) -> dict[str, Any]:
         """Converts the OpenSearchHealthCheck object to a dictionary.
 
@@ -136,6 +245,79 @@ class OpenSearchHealthCheck(HealthCheck[HealthCheckResult]):
             "verify_certs": self._verify_certs,
             "ssl_show_warn": self._ssl_show_warn,
             "ca_certs": self._ca_certs,
+            "cluster_health": self._cluster_health,
+            "persistent": self._persistent,
+            "timeout": self._timeout,
+            "name": self._name,
+        }
+
+
+@final
+class OpenSearchClientHealthCheck(HealthCheck[HealthCheckResult]):
+    """A class to perform health checks with an application-owned OpenSearch client.
+
+    Attributes:
+        _client: The client used by the application.
+        _cluster_health: Whether to query the cluster health instead of the node info.
+        _name: The name of the health check.
+        _timeout: The timeout for the health check.
+    """
+
+    __slots__ = ("_client", "_cluster_health", "_name", "_timeout")
+
+    _client: AsyncOpenSearch
+    _cluster_health: bool
+    _timeout: float
+    _name: str
+
+    def __init__(
+        self,
+        *,
+        client: AsyncOpenSearch,
+        cluster_health: bool = False,
+        timeout: float = DEFAULT_HC_TIMEOUT,
+        name: str = "OpenSearch",
+    ) -> None:
+        """Initializes the OpenSearchClientHealthCheck object.
+
+        Args:
+            client: The client used by the application.
+            cluster_health: Whether to query the cluster health instead of the node info.
+            timeout: The timeout for the health check.
+            name: The name of the health check.
+        """
+        self._client = client
+        self._cluster_health = cluster_health
+        self._timeout = timeout
+        self._name = name
+
+    async def __call__(self) -> HealthCheckResult:
+        """Performs the health check with the client of the application.
+
+        Returns:
+            A HealthCheckResult object.
+        """
+        check = _cluster_health if self._cluster_health else _info
+        try:
+            return await asyncio.wait_for(check(self._client, self._name, self._timeout), self._timeout)
+        except BaseException:  # noqa: BLE001
+            return HealthCheckResult(name=self._name, healthy=False, error_details=format_exc())
+
+    @property
+    def dependency(self) -> str | None:
+        """Return the comma-separated `host:port` list of the hosts of the client."""
+        hosts = self._client.transport.hosts or []
+        return ",".join(f"{host.get('host', 'localhost')}:{host.get('port', 9200)}" for host in hosts) or None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Converts the OpenSearchClientHealthCheck object to a dictionary.
+
+        Returns:
+            A dictionary with the OpenSearchClientHealthCheck attributes.
+        """
+        return {
+            "client": self._client,
+            "cluster_health": self._cluster_health,
             "timeout": self._timeout,
             "name": self._name,
         }
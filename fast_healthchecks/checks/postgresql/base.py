@@ -3,9 +3,10 @@
 import ssl
 from functools import lru_cache
 from typing import Generic, Literal, TypeAlias, TypedDict, cast
-from urllib.parse import ParseResult, unquote, urlparse
 
 from fast_healthchecks.checks._base import HealthCheckDSN, T_co
+from fast_healthchecks.dsn import DSN, POSTGRES_SCHEMES, parse_dsn
+from fast_healthchecks.tls import get_ssl_context
 
 SslMode: TypeAlias = Literal["disable", "allow", "prefer", "require", "verify-ca", "verify-full"]
 
@@ -13,7 +14,7 @@ SslMode: TypeAlias = Literal["disable", "allow", "prefer", "require", "verify-ca
 class ParseDSNResult(TypedDict, total=True):
     """A dictionary containing the results of parsing a DSN."""
 
-    parse_result: ParseResult
+    parse_result: DSN
     sslmode: SslMode
     sslcert: str | None
     sslkey: str | None
@@ -30,6 +31,8 @@ def create_ssl_context(
 ) -> ssl.SSLContext | None:
     """Create an SSL context from the query parameters.
 
+    The context is taken from the package-wide registry of `fast_healthchecks.tls`.
+
     Args:
         sslmode (SslMode): The SSL mode to use.
         sslcert (str | None): The path to the SSL certificate.
@@ -46,25 +49,16 @@ def create_ssl_context(
         case "allow":
             sslctx = None
         case "prefer":
-            sslctx = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
+            sslctx = get_ssl_context()
         case "require":
-            sslctx = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
-            sslctx.check_hostname = False
-            sslctx.verify_mode = ssl.CERT_NONE
+            sslctx = get_ssl_context(verify=False)
         case "verify-ca":
-            sslctx = ssl.create_default_context(ssl.Purpose.SERVER_AUTH, cafile=sslrootcert)
-            sslctx.check_hostname = False
-            sslctx.verify_mode = ssl.CERT_REQUIRED
+            sslctx = get_ssl_context(check_hostname=False, cafile=sslrootcert)
         case "verify-full":
             if sslcert is None:
                 msg = "sslcert is required for verify-full"
                 raise ValueError(msg) from None
-            sslctx = ssl.create_default_context(ssl.Purpose.SERVER_AUTH, cafile=sslrootcert)
-            sslctx.check_hostname = True
-            sslctx.load_cert_chain(
-                certfile=sslcert,
-                keyfile=sslkey,
-            )
+            sslctx = get_ssl_context(cafile=sslrootcert, certfile=sslcert, keyfile=sslkey)
         case _:  # pragma: no cover
             msg = f"Unsupported sslmode: {sslmode}"
             raise ValueError(msg) from None
@@ -123,12 +117,8 @@ class BasePostgreSQLHealthCheck(HealthCheckDSN[T_co], Generic[T_co]):
         Returns:
             ParseDSNResult: The results of parsing the DSN.
         """
-        parse_result: ParseResult = urlparse(dsn)
-        query = (
-            {k: unquote(v) for k, v in (q.split("=") for q in parse_result.query.split("&"))}
-            if parse_result.query
-            else {}
-        )
+        parse_result = parse_dsn(dsn, POSTGRES_SCHEMES)
+        query = parse_result.options
         sslmode: SslMode = cls.validate_sslmode(query.get("sslmode", "disable"))
         sslcert: str | None = query.get("sslcert")
         sslkey: str | None = query.get("sslkey")
@@ -2,9 +2,14 @@
 
 Classes:
     RabbitMQHealthCheck: A class to perform health checks on RabbitMQ.
+    RabbitMQClientHealthCheck: A class to perform health checks with an application-owned aio-pika connection.
 
 Usage:
     The RabbitMQHealthCheck class can be used to perform health checks on RabbitMQ by calling it.
+    With `lean=True` the check performs just the AMQP handshake with aiormq instead of setting up a
+    robust connection, `persistent=True` keeps that connection between calls, and `open_channel=True`
+    also opens and closes a channel on it.
+    `RabbitMQHealthCheck.from_client` reuses the aio-pika connection of the application instead.
 
 Example:
     health_check = RabbitMQHealthCheck(
@@ -17,21 +22,29 @@ Example:
     print(result.healthy)
 """
 
+import asyncio
 from traceback import format_exc
-from typing import Any, TypeAlias, TypedDict, final
-from urllib.parse import ParseResult, urlparse
+from typing import TYPE_CHECKING, Any, TypeAlias, TypedDict, final
 
-from fast_healthchecks.checks._base import DEFAULT_HC_TIMEOUT, HealthCheckDSN
+from fast_healthchecks.checks._base import DEFAULT_HC_TIMEOUT, HealthCheck, HealthCheckDSN, tcp_preflight
 from fast_healthchecks.compat import PYDANTIC_INSTALLED
+from fast_healthchecks.dsn import AMQP_SCHEMES, DSN, parse_dsn
 from fast_healthchecks.models import HealthCheckResult
+from fast_healthchecks.tls import get_ssl_context
 
 IMPORT_ERROR_MSG = "aio-pika is not installed. Install it with `pip install aio-pika`."
 
 try:
     import aio_pika
+    import aiormq
+    from aio_pika.connection import make_url
 except ImportError as exc:
     raise ImportError(IMPORT_ERROR_MSG) from exc
 
+if TYPE_CHECKING:
+    from aio_pika.abc import AbstractConnection as AbstractPikaConnection
+    from aiormq.abc import AbstractConnection
+
 if PYDANTIC_INSTALLED:
     from pydantic import AmqpDsn
 else:  # pragma: no cover
@@ -41,7 +54,7 @@ else:  # pragma: no cover
 class ParseDSNResult(TypedDict, total=True):
     """A dictionary containing the results of parsing a DSN."""
 
-    parse_result: ParseResult
+    parse_result: DSN
 
 
 @final
@@ -49,17 +62,35 @@ class RabbitMQHealthCheck(HealthCheckDSN[HealthCheckResult]):
     """A class to perform health checks on RabbitMQ.
 
     Attributes:
+        _connection: The lean connection kept in persistent mode.
         _host: The RabbitMQ host.
         _name: The name of the health check.
         _password: The RabbitMQ password.
         _port: The RabbitMQ port.
         _secure: Whether to use a secure connection.
+        _preflight: Whether to check TCP reachability before connecting.
+        _lean: Whether to perform just the AMQP handshake with aiormq instead of a robust connection.
+        _persistent: Whether to keep one lean AMQP connection between calls, implies lean.
+        _open_channel: Whether to open and close a channel on the lean connection.
         _timeout: The timeout for the health check.
         _user: The RabbitMQ user.
         _vhost: The RabbitMQ virtual host.
     """
 
-    __slots__ = ("_host", "_name", "_password", "_port", "_secure", "_timeout", "_user")
+    __slots__ = (
+        "_connection",
+        "_host",
+        "_lean",
+        "_name",
+        "_open_channel",
+        "_password",
+        "_persistent",
+        "_port",
+        "_preflight",
+        "_secure",
+        "_timeout",
+        "_user",
+    )
 
     _host: str
     _port: int
@@ -67,6 +98,11 @@ class RabbitMQHealthCheck(HealthCheckDSN[HealthCheckResult]):
     _user: str
     _vhost: str
     _password: str
+    _preflight: bool
+    _lean: bool
+    _persistent: bool
+    _open_channel: bool
+    _connection: "AbstractConnection | None"
     _timeout: float
     _name: str
 
@@ -79,6 +115,10 @@ class RabbitMQHealthCheck(HealthCheckDSN[HealthCheckResult]):
         port: int = 5672,
         vhost: str = "/",
         secure: bool = False,
+        preflight: bool = False,
+        lean: bool = False,
+        persistent: bool = False,
+        open_channel: bool = False,
         timeout: float = DEFAULT_HC_TIMEOUT,
         name: str = "RabbitMQ",
     ) -> None:
@@ -91,6 +131,10 @@ class RabbitMQHealthCheck(HealthCheckDSN[HealthCheckResult]):
             port: The RabbitMQ port
             vhost: The RabbitMQ virtual host
             secure: Whether to use a secure connection
+            preflight: Whether to check TCP reachability before connecting
+            lean: Whether to perform just the AMQP handshake with aiormq instead of a robust connection
+            persistent: Whether to keep one lean AMQP connection between calls, implies lean
+            open_channel: Whether to open and close a channel on the lean connection
             timeout: The timeout for the health check
             name: The name of the health check
         """
@@ -100,6 +144,11 @@ class RabbitMQHealthCheck(HealthCheckDSN[HealthCheckResult]):
         self._port = port
         self._vhost = vhost
         self._secure = secure
+        self._preflight = preflight
+        self._lean = lean
+        self._persistent = persistent
+        self._open_channel = open_channel
+        self._connection = None
         self._timeout = timeout
         self._name = name
 
@@ -113,16 +162,20 @@ class RabbitMQHealthCheck(HealthCheckDSN[HealthCheckResult]):
         Returns:
             ParseDSNResult: The results of parsing the DSN.
         """
-        parse_result: ParseResult = urlparse(dsn)
+        parse_result = parse_dsn(dsn, AMQP_SCHEMES)
         return {"parse_result": parse_result}
 
     @classmethod
-    def from_dsn(
+    def from_dsn(  # noqa: PLR0913
         cls,
         dsn: "AmqpDsn | str",
         *,
         name: str = "RabbitMQ",
         timeout: float = DEFAULT_HC_TIMEOUT,
+        preflight: bool = False,
+        lean: bool = False,
+        persistent: bool = False,
+        open_channel: bool = False,
     ) -> "RabbitMQHealthCheck":
         """Creates a RabbitMQHealthCheck instance from a DSN.
 
@@ -130,6 +183,10 @@ class RabbitMQHealthCheck(HealthCheckDSN[HealthCheckResult]):
             dsn: The DSN to create the RabbitMQHealthCheck instance from.
             name: The name of the health check.
             timeout: The timeout for the health check.
+            preflight: Whether to check TCP reachability before connecting.
+            lean: Whether to perform just the AMQP handshake with aiormq instead of a robust connection.
+            persistent: Whether to keep one lean AMQP connection between calls, implies lean.
+            open_channel: Whether to open and close a channel on the lean connection.
 
         Returns:
             A RabbitMQHealthCheck instance.
@@ -137,17 +194,44 @@ class RabbitMQHealthCheck(HealthCheckDSN[HealthCheckResult]):
         dsn = cls.validate_dsn(dsn, type_=AmqpDsn)
         parsed_dsn = cls.parse_dsn(dsn)
         parse_result = parsed_dsn["parse_result"]
+        host, port = parse_result.address("localhost", 5672)
         return RabbitMQHealthCheck(
-            host=parse_result.hostname or "localhost",
-            user=parse_result.username or "guest",
+            host=host,
+            user=parse_result.user or "guest",
             password=parse_result.password or "guest",
-            port=parse_result.port or 5672,
-            vhost=parse_result.path.lstrip("/") or "/",
+            port=port,
+            vhost=parse_result.path or "/",
             secure=parse_result.scheme == "amqps",
+            preflight=preflight,
+            lean=lean,
+            persistent=persistent,
+            open_channel=open_channel,
             timeout=timeout,
             name=name,
         )
 
+    @classmethod
+    def from_client(
+        cls,
+        connection: "AbstractPikaConnection",
+        *,
+        open_channel: bool = False,
+        timeout: float = DEFAULT_HC_TIMEOUT,
+        name: str = "RabbitMQ",
+    ) -> "RabbitMQClientHealthCheck":
+        """Creates a health check that reuses an existing connection.
+
+        Args:
+            connection: The aio-pika connection used by the application.
+            open_channel: Whether to open and close a channel on the connection.
+            timeout: The timeout for the health check.
+            name: The name of the health check.
+
+        Returns:
+            A RabbitMQClientHealthCheck instance.
+        """
+        return RabbitMQClientHealthCheck(connection=connection, open_channel=open_channel, timeout=timeout, name=name)
+
     async def __call__(self) -> HealthCheckResult:
         """Performs the health check on RabbitMQ.
 
@@ -155,19 +239,63 @@ class RabbitMQHealthCheck(HealthCheckDSN[HealthCheckResult]):
             A HealthCheckResult object.
         """
         try:
+            if self._preflight:
+                await tcp_preflight([(self._host, self._port)], self._timeout)
+            if self._lean or self._persistent or self._open_channel:
+                return await self._lean_check()
             async with await aio_pika.connect_robust(
                 host=self._host,
                 port=self._port,
                 login=self._user,
                 password=self._password,
                 ssl=self._secure,
+                ssl_context=get_ssl_context() if self._secure else None,
                 virtualhost=self._vhost,
                 timeout=self._timeout,
             ):
                 return HealthCheckResult(name=self._name, healthy=True)
         except BaseException:  # noqa: BLE001
+            await self.aclose()
             return HealthCheckResult(name=self._name, healthy=False, error_details=format_exc())
 
+    async def _lean_check(self) -> HealthCheckResult:
+        connection = self._connection
+        if connection is None or connection.is_closed:
+            url = make_url(
+                host=self._host,
+                port=self._port,
+                login=self._user,
+                password=self._password,
+                virtualhost=self._vhost,
+                ssl=self._secure,
+            )
+            # Protocol header, Start/Tune/Open and nothing else: no channels, no reconnect machinery.
+            connection = await asyncio.wait_for(
+                aiormq.connect(url, context=get_ssl_context() if self._secure else None),
+                self._timeout,
+            )
+            if self._persistent:
+                self._connection = connection
+        try:
+            if self._open_channel:
+                channel = await asyncio.wait_for(connection.channel(), self._timeout)
+                await channel.close()
+        finally:
+            if not self._persistent:
+                await connection.close()
+        return HealthCheckResult(name=self._name, healthy=True)
+
+    async def aclose(self) -> None:
+        """Close the lean connection kept in persistent mode."""
+        connection, self._connection = self._connection, None
+        if connection is not None and not connection.is_closed:
+            await connection.close()
+
+    @property
+    def dependency(self) -> str:
+        """Return the `host:port` of the RabbitMQ server."""
+        return f"{self._host}:{self._port}"
+
     def to_dict(self) -> dict[str, Any]:
         """Converts the RabbitMQHealthCheck object to a dictionary.
 
@@ -181,6 +309,92 @@ class RabbitMQHealthCheck(HealthCheckDSN[HealthCheckResult]):
             "port": self._port,
             "vhost": self._vhost,
             "secure": self._secure,
+            "preflight": self._preflight,
+            "lean": self._lean,
+            "persistent": self._persistent,
+            "open_channel": self._open_channel,
+            "timeout": self._timeout,
+            "name": self._name,
+        }
+
+
+@final
+class RabbitMQClientHealthCheck(HealthCheck[HealthCheckResult]):
+    """A class to perform health checks with an application-owned aio-pika connection.
+
+    Attributes:
+        _connection: The aio-pika connection used by the application.
+        _name: The name of the health check.
+        _open_channel: Whether to open and close a channel on the connection.
+        _timeout: The timeout for the health check.
+    """
+
+    __slots__ = ("_connection", "_name", "_open_channel", "_timeout")
+
+    _connection: "AbstractPikaConnection"
+    _open_channel: bool
+    _timeout: float
+    _name: str
+
+    def __init__(
+        self,
+        *,
+        connection: "AbstractPikaConnection",
+        open_channel: bool = False,
+        timeout: float = DEFAULT_HC_TIMEOUT,
+        name: str = "RabbitMQ",
+    ) -> None:
+        """Initializes the RabbitMQClientHealthCheck class.
+
+        Args:
+            connection: The aio-pika connection used by the application
+            open_channel: Whether to open and close a channel on the connection
+            timeout: The timeout for the health check
+            name: The name of the health check
+        """
+        self._connection = connection
+        self._open_channel = open_channel
+        self._timeout = timeout
+        self._name = name
+
+    async def __call__(self) -> HealthCheckResult:
+        """Performs the health check with the connection of the application.
+
+        Returns:
+            A HealthCheckResult object.
+        """
+        try:
+            await asyncio.wait_for(self._probe(), self._timeout)
+            return HealthCheckResult(name=self._name, healthy=True)
+        except BaseException:  # noqa: BLE001
+            return HealthCheckResult(name=self._name, healthy=False, error_details=format_exc())
+
+    async def _probe(self) -> None:
+        if self._connection.is_closed:
+            msg = "The connection is closed"
+            raise ConnectionError(msg)
+        if self._open_channel:
+            # A round trip to the broker, the connection state alone does not notice a stalled broker.
+            async with self._connection.channel(publisher_confirms=False):
+                pass
+
+    @property
+    def dependency(self) -> str | None:
+        """Return the `host:port` of the broker of the connection, or `None` if it has no URL."""
+        url = getattr(self._connection, "url", None)
+        if url is None or not url.host:
+            return None
+        return f"{url.host}:{url.port or (5671 if url.scheme == 'amqps' else 5672)}"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Converts the RabbitMQClientHealthCheck object to a dictionary.
+
+        Returns:
+            A dictionary with the RabbitMQClientHealthCheck attributes.
+        """
+        return {
+            "connection": self._connection,
+            "open_channel": self._open_channel,
             "timeout": self._timeout,
             "name": self._name,
         }
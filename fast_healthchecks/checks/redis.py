@@ -2,9 +2,13 @@
 
 Classes:
     RedisHealthCheck: A class to perform health checks on Redis.
+    RedisClientHealthCheck: A class to perform health checks with an application-owned Redis client.
 
 Usage:
     The RedisHealthCheck class can be used to perform health checks on Redis by calling it.
+    With `persistent=True` the check keeps one long-lived connection between calls and reconnects
+    automatically, and `info_sections` are fetched in the same round trip as the PING.
+    `RedisHealthCheck.from_client` reuses the client of the application instead of opening a new connection.
 
 Example:
     health_check = RedisHealthCheck(
@@ -17,29 +21,55 @@ Example:
 
 from __future__ import annotations
 
+import asyncio
 from traceback import format_exc
 from typing import TYPE_CHECKING, Any, TypedDict, final
 
-from fast_healthchecks.checks._base import DEFAULT_HC_TIMEOUT, HealthCheckDSN
+from fast_healthchecks.checks._base import DEFAULT_HC_TIMEOUT, HealthCheck, HealthCheckDSN, tcp_preflight
 from fast_healthchecks.compat import RedisDsn
+from fast_healthchecks.dsn import DSN, REDIS_SCHEMES, parse_dsn
 from fast_healthchecks.models import HealthCheckResult
+from fast_healthchecks.tls import get_ssl_context
 
 IMPORT_ERROR_MSG = "redis is not installed. Install it with `pip install redis`."
 
 try:
-    from redis.asyncio import Redis
-    from redis.asyncio.connection import parse_url
+    from redis.asyncio import BlockingConnectionPool, Redis
+    from redis.asyncio.connection import Connection, SSLConnection
 except ImportError as exc:
     raise ImportError(IMPORT_ERROR_MSG) from exc
 
 if TYPE_CHECKING:
-    from redis.asyncio.connection import ConnectKwargs
+    from collections.abc import Mapping
 
 
 class ParseDSNResult(TypedDict, total=True):
     """A dictionary containing the results of parsing a DSN."""
 
-    parse_result: ConnectKwargs
+    parse_result: DSN
+
+
+class _SSLConnection(SSLConnection):
+    """A TLS connection that takes its SSL context from the package-wide registry."""
+
+    def _connection_arguments(self) -> Mapping[str, Any]:
+        return {
+            **Connection._connection_arguments(self),  # noqa: SLF001
+            "ssl": get_ssl_context(cafile=self.ssl_context.ca_certs),
+        }
+
+
+async def _ping(redis: Redis, name: str, info_sections: tuple[str, ...]) -> HealthCheckResult:
+    """PING the server, fetching the INFO sections in the same round trip."""
+    if not info_sections:
+        healthy: bool = await redis.ping()
+        return HealthCheckResult(name=name, healthy=healthy)
+    async with redis.pipeline(transaction=False) as pipeline:
+        pipeline.ping()
+        for section in info_sections:
+            pipeline.info(section)
+        healthy, *infos = await pipeline.execute()
+    return HealthCheckResult(name=name, healthy=healthy, details=dict(zip(info_sections, infos, strict=True)))
 
 
 @final
@@ -47,11 +77,15 @@ class RedisHealthCheck(HealthCheckDSN[HealthCheckResult]):
     """A class to perform health checks on Redis.
 
     Attributes:
+        _client: The long-lived client used in persistent mode.
         _database: The database to connect to.
         _host: The host to connect to.
         _name: The name of the health check.
         _password: The password to authenticate with.
         _port: The port to connect to.
+        _preflight: Whether to check TCP reachability before connecting.
+        _persistent: Whether to keep one long-lived connection between calls.
+        _info_sections: The INFO sections to fetch with the PING in one round trip.
         _timeout: The timeout for the connection.
         _user: The user to authenticate with.
         _ssl: Whether to use SSL or not.
@@ -59,11 +93,15 @@ class RedisHealthCheck(HealthCheckDSN[HealthCheckResult]):
     """
 
     __slots__ = (
+        "_client",
         "_database",
         "_host",
+        "_info_sections",
         "_name",
         "_password",
+        "_persistent",
         "_port",
+        "_preflight",
         "_ssl",
         "_ssl_ca_certs",
         "_timeout",
@@ -75,10 +113,14 @@ class RedisHealthCheck(HealthCheckDSN[HealthCheckResult]):
     _database: str | int
     _user: str | None
     _password: str | None
+    _preflight: bool
+    _persistent: bool
+    _info_sections: tuple[str, ...]
     _timeout: float | None
     _name: str
     _ssl: bool
     _ssl_ca_certs: str | None
+    _client: Redis | None
 
     def __init__(  # noqa: PLR0913, D417
         self,
@@ -90,6 +132,9 @@ class RedisHealthCheck(HealthCheckDSN[HealthCheckResult]):
         password: str | None = None,
         ssl: bool = False,
         ssl_ca_certs: str | None = None,
+        preflight: bool = False,
+        persistent: bool = False,
+        info_sections: tuple[str, ...] = (),
         timeout: float | None = DEFAULT_HC_TIMEOUT,
         name: str = "Redis",
     ) -> None:
@@ -101,6 +146,9 @@ class RedisHealthCheck(HealthCheckDSN[HealthCheckResult]):
             database: The database to connect to.
             user: The user to authenticate with.
             password: The password to authenticate with.
+            preflight: Whether to check TCP reachability before connecting.
+            persistent: Whether to keep one long-lived connection between calls.
+            info_sections: The INFO sections to fetch with the PING in one round trip.
             timeout: The timeout for the connection.
             name: The name of the health check.
         """
@@ -111,8 +159,12 @@ class RedisHealthCheck(HealthCheckDSN[HealthCheckResult]):
         self._password = password
         self._ssl = ssl
         self._ssl_ca_certs = ssl_ca_certs
+        self._preflight = preflight
+        self._persistent = persistent
+        self._info_sections = info_sections
         self._timeout = timeout
         self._name = name
+        self._client = None
 
     @classmethod
     def parse_dsn(cls, dsn: str) -> ParseDSNResult:
@@ -124,16 +176,19 @@ class RedisHealthCheck(HealthCheckDSN[HealthCheckResult]):
         Returns:
             ParseDSNResult: The results of parsing the DSN.
         """
-        parse_result: ConnectKwargs = parse_url(str(dsn))
+        parse_result = parse_dsn(str(dsn), REDIS_SCHEMES)
         return {"parse_result": parse_result}
 
     @classmethod
-    def from_dsn(
+    def from_dsn(  # noqa: PLR0913
         cls,
         dsn: RedisDsn | str,
         *,
         name: str = "Redis",
         timeout: float = DEFAULT_HC_TIMEOUT,
+        preflight: bool = False,
+        persistent: bool = False,
+        info_sections: tuple[str, ...] = (),
     ) -> RedisHealthCheck:
         """Create a RedisHealthCheck instance from a DSN.
 
@@ -141,6 +196,9 @@ class RedisHealthCheck(HealthCheckDSN[HealthCheckResult]):
             dsn: The DSN to connect to.
             name: The name of the health check.
             timeout: The timeout for the connection.
+            preflight: Whether to check TCP reachability before connecting.
+            persistent: Whether to keep one long-lived connection between calls.
+            info_sections: The INFO sections to fetch with the PING in one round trip.
 
         Returns:
             A RedisHealthCheck instance.
@@ -148,20 +206,49 @@ class RedisHealthCheck(HealthCheckDSN[HealthCheckResult]):
         dsn = cls.validate_dsn(dsn, type_=RedisDsn)
         parsed_dsn = cls.parse_dsn(dsn)
         parse_result = parsed_dsn["parse_result"]
-        ssl_ca_certs: str | None = parse_result.get("ssl_ca_certs", None)
-        ssl = "ssl_ca_certs" in parse_result and bool(ssl_ca_certs)
+        host, port = parse_result.address("localhost", 6379)
+        database = parse_result.path or parse_result.options.get("db") or "0"
+        if not (database.isascii() and database.isdigit()):
+            msg = f"Invalid database: {database}"
+            raise ValueError(msg) from None
+        ssl_ca_certs = parse_result.options.get("ssl_ca_certs") or None
         return RedisHealthCheck(
-            host=parse_result.get("host", "localhost"),
-            port=parse_result.get("port", 6379),
-            database=parse_result.get("db", 0),
-            user=parse_result.get("username"),
-            password=parse_result.get("password"),
-            ssl=ssl,
+            host=host,
+            port=port,
+            database=int(database),
+            user=parse_result.user,
+            password=parse_result.password,
+            ssl=parse_result.scheme == "rediss" or ssl_ca_certs is not None,
             ssl_ca_certs=ssl_ca_certs,
+            preflight=preflight,
+            persistent=persistent,
+            info_sections=info_sections,
             timeout=timeout,
             name=name,
         )
 
+    @classmethod
+    def from_client(
+        cls,
+        client: Redis,
+        *,
+        info_sections: tuple[str, ...] = (),
+        name: str = "Redis",
+        timeout: float = DEFAULT_HC_TIMEOUT,
+    ) -> RedisClientHealthCheck:
+        """Create a health check that reuses an existing client.
+
+        Args:
+            client: The Redis client used by the application.
+            info_sections: The INFO sections to fetch with the PING in one round trip.
+            name: The name of the health check.
+            timeout: The timeout for the PING.
+
+        Returns:
+            A RedisClientHealthCheck instance.
+        """
+        return RedisClientHealthCheck(client=client, info_sections=info_sections, timeout=timeout, name=name)
+
     async def __call__(self) -> HealthCheckResult:
         """Perform a health check on Redis.
 
@@ -169,21 +256,68 @@ class RedisHealthCheck(HealthCheckDSN[HealthCheckResult]):
             A HealthCheckResult instance.
         """
         try:
-            async with Redis(
+            if self._preflight:
+                await tcp_preflight([(self._host, self._port)], self._timeout)
+            if self._persistent:
+                return await self._check(self._get_client())
+            async with self._create_client() as redis:
+                return await self._check(redis)
+        except BaseException:  # noqa: BLE001
+            if self._client is not None:
+                # Reconnect on the next call instead of reusing a connection in an unknown state.
+                await self.aclose()
+            return HealthCheckResult(name=self._name, healthy=False, error_details=format_exc())
+
+    def _create_client(self) -> Redis:
+        if not self._persistent and not self._ssl:
+            return Redis(
                 host=self._host,
                 port=self._port,
                 db=self._database,
                 username=self._user,
                 password=self._password,
                 socket_timeout=self._timeout,
+                socket_connect_timeout=self._timeout,
                 single_connection_client=True,
                 ssl=self._ssl,
                 ssl_ca_certs=self._ssl_ca_certs,
-            ) as redis:
-                healthy: bool = await redis.ping()
-                return HealthCheckResult(name=self._name, healthy=healthy)
-        except BaseException:  # noqa: BLE001
-            return HealthCheckResult(name=self._name, healthy=False, error_details=format_exc())
+            )
+        # A single connection, shared by concurrent calls and re-established by the pool when it drops in
+        # persistent mode. TLS connections take their SSL context from the registry to resume sessions.
+        ssl_kwargs: dict[str, Any] = {"ssl_ca_certs": self._ssl_ca_certs} if self._ssl else {}
+        pool = BlockingConnectionPool(
+            max_connections=1,
+            timeout=self._timeout,
+            connection_class=_SSLConnection if self._ssl else Connection,
+            host=self._host,
+            port=self._port,
+            db=self._database,
+            username=self._user,
+            password=self._password,
+            socket_timeout=self._timeout,
+            socket_connect_timeout=self._timeout,
+            **ssl_kwargs,
+        )
+        return Redis.from_pool(pool)
+
+    def _get_client(self) -> Redis:
+        if self._client is None:
+            self._client = self._create_client()
+        return self._client
+
+    async def _check(self, redis: Redis) -> HealthCheckResult:
+        return await _ping(redis, self._name, self._info_sections)
+
+    async def aclose(self) -> None:
+        """Close the long-lived connection of the persistent mode."""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    @property
+    def dependency(self) -> str:
+        """Return the `host:port` of the Redis server."""
+        return f"{self._host}:{self._port}"
 
     def to_dict(self) -> dict[str, Any]:
         """Converts the RedisHealthCheck object to a dictionary.
@@ -199,6 +333,82 @@ class RedisHealthCheck(HealthCheckDSN[HealthCheckResult]):
             "password": self._password,
             "ssl": self._ssl,
             "ssl_ca_certs": self._ssl_ca_certs,
+            "preflight": self._preflight,
+            "persistent": self._persistent,
+            "info_sections": self._info_sections,
+            "timeout": self._timeout,
+            "name": self._name,
+        }
+
+
+@final
+class RedisClientHealthCheck(HealthCheck[HealthCheckResult]):
+    """A class to perform health checks with an application-owned Redis client.
+
+    Attributes:
+        _client: The Redis client used by the application.
+        _info_sections: The INFO sections to fetch with the PING in one round trip.
+        _name: The name of the health check.
+        _timeout: The timeout for the PING.
+    """
+
+    __slots__ = ("_client", "_info_sections", "_name", "_timeout")
+
+    _client: Redis
+    _info_sections: tuple[str, ...]
+    _timeout: float
+    _name: str
+
+    def __init__(
+        self,
+        *,
+        client: Redis,
+        info_sections: tuple[str, ...] = (),
+        timeout: float = DEFAULT_HC_TIMEOUT,
+        name: str = "Redis",
+    ) -> None:
+        """Initialize the RedisClientHealthCheck class.
+
+        Args:
+            client: The Redis client used by the application.
+            info_sections: The INFO sections to fetch with the PING in one round trip.
+            timeout: The timeout for the PING.
+            name: The name of the health check.
+        """
+        self._client = client
+        self._info_sections = info_sections
+        self._timeout = timeout
+        self._name = name
+
+    async def __call__(self) -> HealthCheckResult:
+        """Perform a health check with the client of the application.
+
+        Returns:
+            A HealthCheckResult instance.
+        """
+        try:
+            # The client is configured by the application, so bound the PING here.
+            return await asyncio.wait_for(_ping(self._client, self._name, self._info_sections), self._timeout)
+        except BaseException:  # noqa: BLE001
+            return HealthCheckResult(name=self._name, healthy=False, error_details=format_exc())
+
+    @property
+    def dependency(self) -> str | None:
+        """Return the `host:port` of the Redis server of the client, or `None` for a Unix socket."""
+        kwargs = self._client.connection_pool.connection_kwargs
+        if "path" in kwargs:
+            return None
+        return f"{kwargs.get('host', 'localhost')}:{kwargs.get('port', 6379)}"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Converts the RedisClientHealthCheck object to a dictionary.
+
+        Returns:
+            A dictionary with the RedisClientHealthCheck attributes.
+        """
+        return {
+            "client": self._client,
+            "info_sections": self._info_sections,
             "timeout": self._timeout,
             "name": self._name,
         }
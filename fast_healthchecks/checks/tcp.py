@@ -0,0 +1,102 @@
+"""This module provides a health check class for TCP endpoints.
+
+Classes:
+    TcpHealthCheck: A class to perform health checks on a TCP endpoint.
+
+Usage:
+    The TcpHealthCheck class opens a TCP connection to the endpoint, closes it right away and
+    reports how long the connection took to establish.
+
+Example:
+    health_check = TcpHealthCheck(
+        host="localhost",
+        port=8080,
+    )
+    result = await health_check()
+    print(result.healthy, result.details)
+"""
+
+import asyncio
+import time
+from traceback import format_exc
+from typing import Any, final
+
+from fast_healthchecks.checks._base import DEFAULT_HC_TIMEOUT, HealthCheck
+from fast_healthchecks.models import HealthCheckResult
+
+
+@final
+class TcpHealthCheck(HealthCheck[HealthCheckResult]):
+    """A class to perform health checks on a TCP endpoint.
+
+    Attributes:
+        _host: The host to connect to.
+        _name: The name of the health check.
+        _port: The port to connect to.
+        _timeout: The timeout for the health check.
+    """
+
+    __slots__ = ("_host", "_name", "_port", "_timeout")
+
+    _host: str
+    _port: int
+    _timeout: float
+    _name: str
+
+    def __init__(
+        self,
+        *,
+        host: str,
+        port: int,
+        timeout: float = DEFAULT_HC_TIMEOUT,
+        name: str = "TCP",
+    ) -> None:
+        """Initializes the TcpHealthCheck class.
+
+        Args:
+            host: The host to connect to.
+            port: The port to connect to.
+            timeout: The timeout for the health check.
+            name: The name of the health check.
+        """
+        self._host = host
+        self._port = port
+        self._timeout = timeout
+        self._name = name
+
+    async def __call__(self) -> HealthCheckResult:
+        """Performs the health check.
+
+        Returns:
+            A HealthCheckResult object with the connect time in milliseconds.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+            started = time.perf_counter()
+            transport, _ = await asyncio.wait_for(
+                loop.create_connection(asyncio.Protocol, self._host, self._port),
+                self._timeout,
+            )
+            connect_time = time.perf_counter() - started
+            transport.close()
+            return HealthCheckResult(name=self._name, healthy=True, details={"connect_time_ms": connect_time * 1000})
+        except BaseException:  # noqa: BLE001
+            return HealthCheckResult(name=self._name, healthy=False, error_details=format_exc())
+
+    @property
+    def dependency(self) -> str:
+        """Return the `host:port` of the endpoint."""
+        return f"{self._host}:{self._port}"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Converts the TcpHealthCheck object to a dictionary.
+
+        Returns:
+            A dictionary with the TcpHealthCheck attributes.
+        """
+        return {
+            "host": self._host,
+            "port": self._port,
+            "timeout": self._timeout,
+            "name": self._name,
+        }
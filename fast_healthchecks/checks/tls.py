@@ -0,0 +1,183 @@
+"""This module provides a health check class for TLS endpoints.
+
+Classes:
+    TlsHealthCheck: A class to perform health checks on a TLS endpoint.
+
+Usage:
+    The TlsHealthCheck class opens a TCP connection to the endpoint, performs the TLS handshake and
+    reports the connect and handshake times, the negotiated protocol and the number of days until
+    the certificate of the server expires. With `min_days_to_expiry` the check is unhealthy if the
+    certificate expires sooner.
+
+Example:
+    health_check = TlsHealthCheck(
+        host="example.com",
+        port=443,
+        min_days_to_expiry=14,
+    )
+    result = await health_check()
+    print(result.healthy, result.details)
+"""
+
+import asyncio
+import ssl
+import time
+from traceback import format_exc
+from typing import Any, final
+
+from fast_healthchecks.checks._base import DEFAULT_HC_TIMEOUT, HealthCheck
+from fast_healthchecks.models import HealthCheckResult
+from fast_healthchecks.tls import get_ssl_context
+
+SECONDS_PER_DAY = 86400
+
+
+class CertificateExpiryError(ConnectionError):
+    """The certificate of the server expires sooner than allowed."""
+
+
+def _days_to_expiry(ssl_object: ssl.SSLObject) -> float | None:
+    """Return the days until the certificate of the server expires, `None` if it was not verified."""
+    # The fields of the certificate are only decoded once the certificate is verified.
+    not_after = (ssl_object.getpeercert() or {}).get("notAfter")
+    if not isinstance(not_after, str):
+        return None
+    return (ssl.cert_time_to_seconds(not_after) - time.time()) / SECONDS_PER_DAY
+
+
+@final
+class TlsHealthCheck(HealthCheck[HealthCheckResult]):
+    """A class to perform health checks on a TLS endpoint.
+
+    Attributes:
+        _host: The host to connect to.
+        _min_days_to_expiry: The minimum number of days the certificate must stay valid.
+        _name: The name of the health check.
+        _port: The port to connect to.
+        _server_hostname: The hostname to verify the certificate against, defaults to the host.
+        _ssl_context: The SSL context, defaults to the shared context verifying the certificate.
+        _timeout: The timeout for the connection and the handshake.
+    """
+
+    __slots__ = (
+        "_host",
+        "_min_days_to_expiry",
+        "_name",
+        "_port",
+        "_server_hostname",
+        "_ssl_context",
+        "_timeout",
+    )
+
+    _host: str
+    _port: int
+    _server_hostname: str | None
+    _ssl_context: ssl.SSLContext | None
+    _min_days_to_expiry: float | None
+    _timeout: float
+    _name: str
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        host: str,
+        port: int = 443,
+        server_hostname: str | None = None,
+        ssl_context: ssl.SSLContext | None = None,
+        min_days_to_expiry: float | None = None,
+        timeout: float = DEFAULT_HC_TIMEOUT,
+        name: str = "TLS",
+    ) -> None:
+        """Initializes the TlsHealthCheck class.
+
+        Args:
+            host: The host to connect to.
+            port: The port to connect to.
+            server_hostname: The hostname to verify the certificate against, defaults to the host.
+            ssl_context: The SSL context, defaults to the shared context verifying the certificate.
+            min_days_to_expiry: The minimum number of days the certificate must stay valid, the
+                expiry is not enforced if `None`. Requires a context that verifies the certificate.
+            timeout: The timeout for the connection and the handshake.
+            name: The name of the health check.
+        """
+        self._host = host
+        self._port = port
+        self._server_hostname = server_hostname
+        self._ssl_context = ssl_context
+        self._min_days_to_expiry = min_days_to_expiry
+        self._timeout = timeout
+        self._name = name
+
+    async def _handshake(self) -> dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        transport, protocol = await loop.create_connection(asyncio.Protocol, self._host, self._port)
+        connected = time.perf_counter()
+        try:
+            tls_transport = await loop.start_tls(
+                transport,
+                protocol,
+                self._ssl_context or get_ssl_context(),
+                server_hostname=self._server_hostname or self._host,
+            )
+        except BaseException:
+            transport.close()
+            raise
+        handshaken = time.perf_counter()
+        if tls_transport is None:  # pragma: no cover
+            transport.close()
+            msg = "The TLS handshake did not complete"
+            raise ssl.SSLError(msg)
+        ssl_object: ssl.SSLObject = tls_transport.get_extra_info("ssl_object")
+        tls_transport.close()
+        return {
+            "connect_time_ms": (connected - started) * 1000,
+            "handshake_time_ms": (handshaken - connected) * 1000,
+            "protocol": ssl_object.version(),
+            "session_reused": ssl_object.session_reused,
+            "days_to_expiry": _days_to_expiry(ssl_object),
+        }
+
+    def _check_expiry(self, days_to_expiry: float | None) -> None:
+        if self._min_days_to_expiry is None:
+            return
+        if days_to_expiry is None:
+            msg = "The certificate was not verified, its expiry is unknown"
+            raise CertificateExpiryError(msg)
+        if days_to_expiry < self._min_days_to_expiry:
+            msg = f"The certificate expires in {days_to_expiry:.1f} days"
+            raise CertificateExpiryError(msg)
+
+    async def __call__(self) -> HealthCheckResult:
+        """Performs the health check.
+
+        Returns:
+            A HealthCheckResult object with the connect and handshake times and the certificate expiry.
+        """
+        try:
+            details = await asyncio.wait_for(self._handshake(), self._timeout)
+            self._check_expiry(details["days_to_expiry"])
+            return HealthCheckResult(name=self._name, healthy=True, details=details)
+        except BaseException:  # noqa: BLE001
+            return HealthCheckResult(name=self._name, healthy=False, error_details=format_exc())
+
+    @property
+    def dependency(self) -> str:
+        """Return the `host:port` of the endpoint."""
+        return f"{self._host}:{self._port}"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Converts the TlsHealthCheck object to a dictionary.
+
+        Returns:
+            A dictionary with the TlsHealthCheck attributes.
+        """
+        return {
+            "host": self._host,
+            "port": self._port,
+            "server_hostname": self._server_hostname,
+            "ssl_context": self._ssl_context,
+            "min_days_to_expiry": self._min_days_to_expiry,
+            "timeout": self._timeout,
+            "name": self._name,
+        }
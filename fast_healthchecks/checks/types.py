@@ -40,10 +40,38 @@ try:
     from fast_healthchecks.checks.redis import RedisHealthCheck
 except ImportError:
     RedisHealthCheck = Any  # ty: ignore[invalid-assignment]
+try:
+    from fast_healthchecks.checks.tcp import TcpHealthCheck
+except ImportError:
+    TcpHealthCheck = Any  # ty: ignore[invalid-assignment]
+try:
+    from fast_healthchecks.checks.tls import TlsHealthCheck
+except ImportError:
+    TlsHealthCheck = Any  # ty: ignore[invalid-assignment]
 try:
     from fast_healthchecks.checks.url import UrlHealthCheck
 except ImportError:
     UrlHealthCheck = Any  # ty: ignore[invalid-assignment]
+try:
+    from fast_healthchecks.checks.wire.kafka import KafkaWireHealthCheck
+except ImportError:
+    KafkaWireHealthCheck = Any  # ty: ignore[invalid-assignment]
+try:
+    from fast_healthchecks.checks.wire.mongo import MongoWireHealthCheck
+except ImportError:
+    MongoWireHealthCheck = Any  # ty: ignore[invalid-assignment]
+try:
+    from fast_healthchecks.checks.wire.postgresql import PostgreSQLWireHealthCheck
+except ImportError:
+    PostgreSQLWireHealthCheck = Any  # ty: ignore[invalid-assignment]
+try:
+    from fast_healthchecks.checks.wire.rabbitmq import RabbitMQWireHealthCheck
+except ImportError:
+    RabbitMQWireHealthCheck = Any  # ty: ignore[invalid-assignment]
+try:
+    from fast_healthchecks.checks.wire.redis import RedisWireHealthCheck
+except ImportError:
+    RedisWireHealthCheck = Any  # ty: ignore[invalid-assignment]
 
 Check: TypeAlias = (
     FunctionHealthCheck
@@ -54,7 +82,14 @@ Check: TypeAlias = (
     | PostgreSQLPsycopgHealthCheck
     | RabbitMQHealthCheck
     | RedisHealthCheck
+    | TcpHealthCheck
+    | TlsHealthCheck
     | UrlHealthCheck
+    | KafkaWireHealthCheck
+    | MongoWireHealthCheck
+    | PostgreSQLWireHealthCheck
+    | RabbitMQWireHealthCheck
+    | RedisWireHealthCheck
 )
 
 __all__ = (
@@ -2,9 +2,24 @@
 
 Classes:
     UrlHealthCheck: A class to perform health checks on URLs.
+    UrlGroupHealthCheck: A class to perform health checks on many URLs with one client.
 
 Usage:
     The UrlHealthCheck class can be used to perform health checks on URLs by calling it.
+    With `persistent=True` the checks share a long-lived client that keeps connections alive between
+    calls, optionally multiplexing requests over HTTP/2 with `http2=True` (requires `httpx[http2]`).
+    Call `aclose()` on shutdown to release it.
+
+    With `uds` the requests go to a Unix domain socket instead of the host and port of the URL,
+    which then only sets the `Host` header and the path.
+
+    With `method="HEAD"` no body is transferred. With `max_body_bytes` or a body assertion the body
+    is streamed: at most `max_body_bytes` of it are read and the connection is dropped instead of
+    downloading the rest. `body_contains` is matched chunk by chunk and stops the download as soon
+    as it is found, `body_pattern` and `json_fields` are matched against the bytes read.
+
+    The UrlGroupHealthCheck class requests all its URLs through a single client, a bounded number at
+    a time, and is healthy if at least `min_healthy` of them are.
 
 Example:
     health_check = UrlHealthCheck(
@@ -12,34 +27,123 @@ Example:
     )
     result = await health_check()
     print(result.healthy)
+
+    group_health_check = UrlGroupHealthCheck(
+        urls=["https://service-a/health", "https://service-b/health", "https://service-c/health"],
+        min_healthy=2,
+    )
+    result = await group_health_check()
+    print(result.healthy, result.details)
 """
 
+import asyncio
+import json
+import re
+from collections.abc import Mapping, Sequence
+from contextlib import AbstractAsyncContextManager, nullcontext
 from http import HTTPStatus
+from pathlib import Path
 from traceback import format_exc
-from typing import TYPE_CHECKING, final
+from typing import TYPE_CHECKING, Any, Literal, TypeAlias, final
 
 from fast_healthchecks.checks._base import DEFAULT_HC_TIMEOUT, HealthCheck
+from fast_healthchecks.execution import get_connection_budget
 from fast_healthchecks.models import HealthCheckResult
+from fast_healthchecks.tls import get_ssl_context
 
 IMPORT_ERROR_MSG = "httpx is not installed. Install it with `pip install httpx`."
 
 try:
-    from httpx import AsyncClient, AsyncHTTPTransport, BasicAuth, Response
+    import certifi
+    from httpx import URL, AsyncClient, AsyncHTTPTransport, BasicAuth, Response
 except ImportError as exc:
     raise ImportError(IMPORT_ERROR_MSG) from exc
 
 if TYPE_CHECKING:
     from httpx._types import URLTypes
 
+HttpMethod: TypeAlias = Literal["GET", "HEAD"]
+
+_ClientKey: TypeAlias = tuple[bool, bool, str | None]
+
+_MISSING = object()
+
+# Long-lived clients shared by the checks in persistent mode, keyed by `(verify_ssl, http2, uds)`, with
+# the number of checks using each of them.
+_shared_clients: dict[_ClientKey, tuple[AsyncClient, int]] = {}
+
+
+def _create_transport(*, verify_ssl: bool, http2: bool, uds: str | None = None) -> AsyncHTTPTransport:
+    # The same CA certificates as httpx uses by default, from the package-wide SSL context registry.
+    ssl_context = get_ssl_context(verify=verify_ssl, cafile=certifi.where() if verify_ssl else None)
+    return AsyncHTTPTransport(verify=ssl_context, http2=http2, uds=uds)
+
+
+def _acquire_shared_client(key: _ClientKey) -> AsyncClient:
+    client, users = _shared_clients.get(key, (None, 0))
+    if client is None:
+        verify_ssl, http2, uds = key
+        client = AsyncClient(transport=_create_transport(verify_ssl=verify_ssl, http2=http2, uds=uds))
+    _shared_clients[key] = (client, users + 1)
+    return client
+
+
+async def _release_shared_client(key: _ClientKey) -> None:
+    client, users = _shared_clients[key]
+    if users > 1:
+        _shared_clients[key] = (client, users - 1)
+        return
+    del _shared_clients[key]
+    await client.aclose()
+
+
+class ResponseBodyError(ValueError):
+    """The body of the response does not satisfy the assertions of the check."""
+
+
+def _json_field(document: Any, path: str) -> Any:  # noqa: ANN401
+    """Return the value at the dotted path of the JSON document, `_MISSING` if there is none."""
+    value = document
+    for key in path.split("."):
+        if isinstance(value, dict):
+            value = value.get(key, _MISSING)
+        elif isinstance(value, list) and key.isdigit() and int(key) < len(value):
+            value = value[int(key)]
+        else:
+            return _MISSING
+        if value is _MISSING:
+            return _MISSING
+    return value
+
+
+def _dependency(url: "URLTypes") -> str:
+    parsed = URL(url)
+    return f"{parsed.host}:{parsed.port or (443 if parsed.scheme == 'https' else 80)}"
+
+
+def _connection_slot(url: "URLTypes") -> AbstractAsyncContextManager[None]:
+    """Hold a slot of the connection budget for the request to the URL, if a budget is installed."""
+    budget = get_connection_budget()
+    return nullcontext() if budget is None else budget.acquire(_dependency(url))
+
 
 @final
 class UrlHealthCheck(HealthCheck[HealthCheckResult]):
     """A class to perform health checks on URLs.
 
     Attributes:
+        _body_contains: The text the body must contain.
+        _body_pattern: The regular expression the body must match.
+        _client_key: The key of the shared client acquired in persistent mode.
+        _http2: Whether to enable HTTP/2.
+        _json_fields: The values the fields of the JSON body must have, by dotted path.
+        _max_body_bytes: The maximum number of bytes of the body to read.
+        _method: The HTTP method, `GET` or `HEAD`.
         _name: The name of the health check.
         _password: The password to authenticate with.
+        _persistent: Whether to share a long-lived keep-alive client between calls.
         _timeout: The timeout for the connection.
+        _uds: The path of the Unix domain socket to connect to instead of the host of the URL.
         _url: The URL to connect to.
         _username: The user to authenticate with.
         _verify_ssl: Whether to verify the SSL certificate.
@@ -47,11 +151,20 @@ class UrlHealthCheck(HealthCheck[HealthCheckResult]):
 
     __slots__ = (
         "_auth",
+        "_body_contains",
+        "_body_pattern",
+        "_client_key",
         "_follow_redirects",
+        "_http2",
+        "_json_fields",
+        "_max_body_bytes",
+        "_method",
         "_name",
         "_password",
+        "_persistent",
         "_timeout",
         "_transport",
+        "_uds",
         "_url",
         "_username",
         "_verify_ssl",
@@ -62,8 +175,17 @@ class UrlHealthCheck(HealthCheck[HealthCheckResult]):
     _password: str | None
     _auth: BasicAuth | None
     _verify_ssl: bool
-    _transport: AsyncHTTPTransport | None
+    _transport: AsyncHTTPTransport
     _follow_redirects: bool
+    _uds: str | None
+    _persistent: bool
+    _http2: bool
+    _method: HttpMethod
+    _max_body_bytes: int | None
+    _body_contains: str | None
+    _body_pattern: re.Pattern[str] | None
+    _json_fields: dict[str, Any]
+    _client_key: _ClientKey | None
     _timeout: float
     _name: str
 
@@ -75,6 +197,14 @@ class UrlHealthCheck(HealthCheck[HealthCheckResult]):
         password: str | None = None,
         verify_ssl: bool = True,
         follow_redirects: bool = True,
+        uds: str | None = None,
+        persistent: bool = False,
+        http2: bool = False,
+        method: HttpMethod = "GET",
+        max_body_bytes: int | None = None,
+        body_contains: str | None = None,
+        body_pattern: str | None = None,
+        json_fields: Mapping[str, Any] | None = None,
         timeout: float = DEFAULT_HC_TIMEOUT,
         name: str = "HTTP",
     ) -> None:
@@ -85,16 +215,41 @@ class UrlHealthCheck(HealthCheck[HealthCheckResult]):
             username: The user to authenticate with.
             password: The password to authenticate with.
             verify_ssl: Whether to verify the SSL certificate.
+            uds: The path of the Unix domain socket to connect to instead of the host of the URL.
+            persistent: Whether to share a long-lived keep-alive client between calls.
+            http2: Whether to enable HTTP/2.
+            method: The HTTP method, `GET` or `HEAD`.
+            max_body_bytes: The maximum number of bytes of the body to read, the rest is not
+                downloaded. Defaults to the whole body.
+            body_contains: The text the UTF-8 encoded body must contain.
+            body_pattern: The regular expression the body, decoded as UTF-8, must match.
+            json_fields: The values the fields of the JSON body must have, by dotted path, e.g.
+                `{"status": "ok", "checks.0.healthy": True}`.
             timeout: The timeout for the connection.
             name: The name of the health check.
+
+        Raises:
+            ValueError: If the body is asserted on in a `HEAD` request.
         """
+        if method == "HEAD" and (body_contains is not None or body_pattern is not None or json_fields):
+            msg = "HEAD responses have no body to assert on"
+            raise ValueError(msg) from None
         self._url = url
         self._username = username
         self._password = password
         self._auth = BasicAuth(self._username, self._password or "") if self._username else None
         self._verify_ssl = verify_ssl
-        self._transport = AsyncHTTPTransport(verify=self._verify_ssl) if self._verify_ssl else None
+        self._transport = _create_transport(verify_ssl=self._verify_ssl, http2=http2, uds=uds)
         self._follow_redirects = follow_redirects
+        self._uds = uds
+        self._persistent = persistent
+        self._http2 = http2
+        self._method = method
+        self._max_body_bytes = max_body_bytes
+        self._body_contains = body_contains
+        self._body_pattern = re.compile(body_pattern) if body_pattern is not None else None
+        self._json_fields = dict(json_fields or {})
+        self._client_key = None
         self._timeout = timeout
         self._name = name
 
@@ -105,17 +260,345 @@ class UrlHealthCheck(HealthCheck[HealthCheckResult]):
             A HealthCheckResult object with the result of the health check.
         """
         try:
+            if self._persistent:
+                return await self._request(
+                    self._acquire_client(),
+                    auth=self._auth,
+                    timeout=self._timeout,
+                    follow_redirects=self._follow_redirects,
+                )
             async with AsyncClient(
                 auth=self._auth,
                 timeout=self._timeout,
                 transport=self._transport,
                 follow_redirects=self._follow_redirects,
             ) as client:
-                response: Response = await client.get(self._url)
-                if response.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR or (
-                    self._username and response.status_code in {HTTPStatus.UNAUTHORIZED, HTTPStatus.FORBIDDEN}
-                ):
-                    response.raise_for_status()
-                return HealthCheckResult(name=self._name, healthy=response.is_success)
+                return await self._request(client)
+        except BaseException:  # noqa: BLE001
+            return HealthCheckResult(name=self._name, healthy=False, error_details=format_exc())
+
+    async def _request(self, client: AsyncClient, **kwargs: Any) -> HealthCheckResult:  # noqa: ANN401
+        if self._method == "HEAD":
+            return self._check_response(await client.head(self._url, **kwargs))
+        if not self._streams_body:
+            return self._check_response(await client.get(self._url, **kwargs))
+        async with client.stream("GET", self._url, **kwargs) as response:
+            result = self._check_response(response)
+            if result.healthy:
+                await self._check_body(response)
+            return result
+
+    @property
+    def _streams_body(self) -> bool:
+        return (
+            self._max_body_bytes is not None
+            or self._body_contains is not None
+            or self._body_pattern is not None
+            or bool(self._json_fields)
+        )
+
+    async def _check_body(self, response: Response) -> None:
+        """Read the body up to `max_body_bytes`, stopping once the assertions are decided."""
+        needle = self._body_contains.encode() if self._body_contains is not None else None
+        found = needle is None
+        tail = b""
+        # The body is only kept for the assertions that need all of it.
+        buffer = bytearray() if self._body_pattern is not None or self._json_fields else None
+        remaining = self._max_body_bytes
+        truncated = False
+        async for chunk in response.aiter_bytes():
+            if remaining is not None:
+                # A body ending exactly at the limit is only known to be cut once more of it arrives.
+                truncated = len(chunk) > remaining
+                chunk = chunk[:remaining]  # noqa: PLW2901
+                remaining -= len(chunk)
+            if needle is not None and not found:
+                window = tail + chunk
+                found = needle in window
+                tail = window[max(len(window) - len(needle) + 1, 0) :]
+            if buffer is not None:
+                buffer.extend(chunk)
+            if truncated or (needle is not None and found and buffer is None):
+                break
+        if not found:
+            msg = f"The body does not contain {self._body_contains!r}"
+            raise ResponseBodyError(msg)
+        if buffer is not None:
+            self._check_buffered_body(bytes(buffer), truncated=truncated)
+
+    def _check_buffered_body(self, body: bytes, *, truncated: bool) -> None:
+        if self._body_pattern is not None and not self._body_pattern.search(body.decode(errors="replace")):
+            msg = f"The body does not match {self._body_pattern.pattern!r}"
+            raise ResponseBodyError(msg)
+        if not self._json_fields:
+            return
+        try:
+            document = json.loads(body)
+        except ValueError:
+            msg = "The body is not valid JSON"
+            if truncated:
+                msg += f", it was cut at {self._max_body_bytes} bytes"
+            raise ResponseBodyError(msg) from None
+        for path, expected in self._json_fields.items():
+            actual = _json_field(document, path)
+            if actual is _MISSING:
+                msg = f"The JSON body has no field {path!r}"
+                raise ResponseBodyError(msg)
+            if actual != expected:
+                msg = f"The JSON field {path!r} is {actual!r}, expected {expected!r}"
+                raise ResponseBodyError(msg)
+
+    def _check_response(self, response: Response) -> HealthCheckResult:
+        if response.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR or (
+            self._username and response.status_code in {HTTPStatus.UNAUTHORIZED, HTTPStatus.FORBIDDEN}
+        ):
+            response.raise_for_status()
+        return HealthCheckResult(name=self._name, healthy=response.is_success)
+
+    def _acquire_client(self) -> AsyncClient:
+        if self._client_key is None:
+            self._client_key = (self._verify_ssl, self._http2, self._uds)
+            _acquire_shared_client(self._client_key)
+        return _shared_clients[self._client_key][0]
+
+    async def start(self) -> None:
+        """Acquire the shared client of the persistent mode."""
+        if self._persistent:
+            self._acquire_client()
+
+    async def aclose(self) -> None:
+        """Release the shared client of the persistent mode, closing it if no other check uses it."""
+        key, self._client_key = self._client_key, None
+        if key is not None:
+            await _release_shared_client(key)
+
+    @property
+    def dependency(self) -> str:
+        """Return the `host:port` the URL points to, or the `unix://` URL of its socket."""
+        if self._uds is not None:
+            # An absolute path keeps checks on the same socket sharing their budgets and rate limits.
+            return f"unix://{Path(self._uds).absolute()}"
+        return _dependency(self._url)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Converts the UrlHealthCheck object to a dictionary.
+
+        Returns:
+            A dictionary with the UrlHealthCheck attributes.
+        """
+        return {
+            "url": str(self._url),
+            "username": self._username,
+            "password": self._password,
+            "verify_ssl": self._verify_ssl,
+            "follow_redirects": self._follow_redirects,
+            "uds": self._uds,
+            "persistent": self._persistent,
+            "http2": self._http2,
+            "method": self._method,
+            "max_body_bytes": self._max_body_bytes,
+            "body_contains": self._body_contains,
+            "body_pattern": self._body_pattern.pattern if self._body_pattern is not None else None,
+            "json_fields": self._json_fields,
+            "timeout": self._timeout,
+            "name": self._name,
+        }
+
+
+@final
+class UrlGroupHealthCheck(HealthCheck[HealthCheckResult]):
+    """A class to perform health checks on many URLs with one client.
+
+    The URLs are requested through one client, so they share its connection pool and TLS sessions,
+    with at most `max_concurrency` requests in flight. The timeout bounds the whole group: each
+    request gets the time left, and a URL still waiting for a slot when it runs out is unhealthy.
+
+    The group has no single dependency: each request takes a slot of the connection budget for the
+    `host:port` of its URL, and the rate limiter does not apply to the group.
+
+    Attributes:
+        _client_key: The key of the shared client acquired in persistent mode.
+        _follow_redirects: Whether to follow redirects.
+        _http2: Whether to enable HTTP/2.
+        _max_concurrency: The maximum number of requests in flight.
+        _min_healthy: The number of URLs that must be healthy.
+        _name: The name of the health check.
+        _persistent: Whether to share a long-lived keep-alive client between calls.
+        _timeout: The timeout for the whole group.
+        _transport: The transport of the client created for each call.
+        _urls: The URLs to check.
+        _verify_ssl: Whether to verify the SSL certificates.
+    """
+
+    __slots__ = (
+        "_client_key",
+        "_follow_redirects",
+        "_http2",
+        "_max_concurrency",
+        "_min_healthy",
+        "_name",
+        "_persistent",
+        "_timeout",
+        "_transport",
+        "_urls",
+        "_verify_ssl",
+    )
+
+    _urls: tuple["URLTypes", ...]
+    _min_healthy: int
+    _max_concurrency: int
+    _verify_ssl: bool
+    _transport: AsyncHTTPTransport
+    _follow_redirects: bool
+    _persistent: bool
+    _http2: bool
+    _client_key: _ClientKey | None
+    _timeout: float
+    _name: str
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        urls: Sequence["URLTypes"],
+        min_healthy: int | None = None,
+        max_concurrency: int = 10,
+        verify_ssl: bool = True,
+        follow_redirects: bool = True,
+        persistent: bool = False,
+        http2: bool = False,
+        timeout: float = DEFAULT_HC_TIMEOUT,
+        name: str = "HTTP group",
+    ) -> None:
+        """Initializes the health check.
+
+        Args:
+            urls: The URLs to check.
+            min_healthy: The number of URLs that must be healthy, defaults to all of them.
+            max_concurrency: The maximum number of requests in flight.
+            verify_ssl: Whether to verify the SSL certificates.
+            follow_redirects: Whether to follow redirects.
+            persistent: Whether to share a long-lived keep-alive client between calls.
+            http2: Whether to enable HTTP/2.
+            timeout: The timeout for the whole group.
+            name: The name of the health check.
+
+        Raises:
+            ValueError: If there are no URLs, or `min_healthy` or `max_concurrency` is out of range.
+        """
+        if not urls:
+            msg = "At least one URL is required"
+            raise ValueError(msg) from None
+        if min_healthy is not None and not 1 <= min_healthy <= len(urls):
+            msg = f"min_healthy must be between 1 and {len(urls)}, got {min_healthy}"
+            raise ValueError(msg) from None
+        if max_concurrency < 1:
+            msg = f"max_concurrency must be at least 1, got {max_concurrency}"
+            raise ValueError(msg) from None
+        self._urls = tuple(urls)
+        self._min_healthy = len(urls) if min_healthy is None else min_healthy
+        self._max_concurrency = max_concurrency
+        self._verify_ssl = verify_ssl
+        self._transport = _create_transport(verify_ssl=self._verify_ssl, http2=http2)
+        self._follow_redirects = follow_redirects
+        self._persistent = persistent
+        self._http2 = http2
+        self._client_key = None
+        self._timeout = timeout
+        self._name = name
+
+    async def _check_url(
+        self,
+        client: AsyncClient,
+        url: "URLTypes",
+        semaphore: asyncio.Semaphore,
+        deadline: float,
+    ) -> dict[str, Any]:
+        async with semaphore:
+            try:
+                async with _connection_slot(url):
+                    remaining = deadline - asyncio.get_running_loop().time()
+                    if remaining <= 0:
+                        return {
+                            "healthy": False,
+                            "status_code": None,
+                            "error": "TimeoutError: no time left for the request",
+                        }
+                    response = await client.get(url, timeout=remaining, follow_redirects=self._follow_redirects)
+            except Exception as exc:  # noqa: BLE001
+                return {"healthy": False, "status_code": None, "error": f"{type(exc).__name__}: {exc}"}
+        healthy = response.is_success
+        return {
+            "healthy": healthy,
+            "status_code": response.status_code,
+            "error": None if healthy else f"HTTP {response.status_code}",
+        }
+
+    async def _check_urls(self, client: AsyncClient) -> HealthCheckResult:
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        deadline = asyncio.get_running_loop().time() + self._timeout
+        results = await asyncio.gather(*(self._check_url(client, url, semaphore, deadline) for url in self._urls))
+        healthy = sum(result["healthy"] for result in results)
+        details = {
+            "healthy": healthy,
+            "total": len(self._urls),
+            "min_healthy": self._min_healthy,
+            "urls": {str(url): result for url, result in zip(self._urls, results, strict=True)},
+        }
+        if healthy < self._min_healthy:
+            error_details = f"{healthy} of {len(self._urls)} URLs are healthy, {self._min_healthy} required"
+            return HealthCheckResult(name=self._name, healthy=False, error_details=error_details, details=details)
+        return HealthCheckResult(name=self._name, healthy=True, details=details)
+
+    async def __call__(self) -> HealthCheckResult:
+        """Performs the health check.
+
+        Returns:
+            A HealthCheckResult object with the result of each URL in its details.
+        """
+        try:
+            if self._persistent:
+                return await self._check_urls(self._acquire_client())
+            async with AsyncClient(transport=self._transport) as client:
+                return await self._check_urls(client)
         except BaseException:  # noqa: BLE001
             return HealthCheckResult(name=self._name, healthy=False, error_details=format_exc())
+
+    def _acquire_client(self) -> AsyncClient:
+        if self._client_key is None:
+            self._client_key = (self._verify_ssl, self._http2, None)
+            _acquire_shared_client(self._client_key)
+        return _shared_clients[self._client_key][0]
+
+    async def start(self) -> None:
+        """Acquire the shared client of the persistent mode."""
+        if self._persistent:
+            self._acquire_client()
+
+    async def aclose(self) -> None:
+        """Release the shared client of the persistent mode, closing it if no other check uses it."""
+        key, self._client_key = self._client_key, None
+        if key is not None:
+            await _release_shared_client(key)
+
+    @property
+    def dependency(self) -> None:
+        """Return `None`, the requests of the group take the connection budget per URL instead."""
+        return None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Converts the UrlGroupHealthCheck object to a dictionary.
+
+        Returns:
+            A dictionary with the UrlGroupHealthCheck attributes.
+        """
+        return {
+            "urls": [str(url) for url in self._urls],
+            "min_healthy": self._min_healthy,
+            "max_concurrency": self._max_concurrency,
+            "verify_ssl": self._verify_ssl,
+            "follow_redirects": self._follow_redirects,
+            "persistent": self._persistent,
+            "http2": self._http2,
+            "timeout": self._timeout,
+            "name": self._name,
+        }
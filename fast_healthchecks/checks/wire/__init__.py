@@ -0,0 +1,8 @@
+"""Module for health checks speaking the wire protocol of their dependency without a driver.
+
+The checks open a single `asyncio` stream and exchange just enough of the protocol to verify that the
+server is alive: a RESP `PING` for Redis, the startup, authentication and a `SELECT 1` for
+PostgreSQL, the AMQP connection handshake for RabbitMQ, an `ApiVersions` request for Kafka and a
+`hello` command for MongoDB. They import no driver, so they suit sidecars and exec probes that only
+need reachability and must stay small in memory and fast to import.
+"""
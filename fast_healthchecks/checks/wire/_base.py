@@ -0,0 +1,78 @@
+"""This module contains the base class for the driverless health checks."""
+
+import asyncio
+import contextlib
+import ssl
+from traceback import format_exc
+from typing import Any
+
+from fast_healthchecks.checks._base import HealthCheck
+from fast_healthchecks.models import HealthCheckResult
+
+__all__ = (
+    "WireHealthCheck",
+    "WireProtocolError",
+)
+
+
+class WireProtocolError(ConnectionError):
+    """The server answered with an error or with a message the check did not expect."""
+
+
+async def close_writer(writer: asyncio.StreamWriter) -> None:
+    """Close the stream without waiting for a peer that does not acknowledge it."""
+    writer.close()
+    with contextlib.suppress(OSError, ssl.SSLError):
+        await writer.wait_closed()
+
+
+class WireHealthCheck(HealthCheck[HealthCheckResult]):
+    """Base class for health checks speaking the wire protocol of their dependency.
+
+    The check opens a connection, lets `_probe` talk to the server and closes it. The server is
+    healthy if `_probe` returns, its return value becomes the details of the result.
+
+    Attributes:
+        _host: The host of the server.
+        _name: The name of the health check.
+        _port: The port of the server.
+        _ssl_context: The SSL context, or `None` for a plain TCP connection.
+        _timeout: The timeout for the whole exchange.
+    """
+
+    _host: str
+    _port: int
+    _ssl_context: ssl.SSLContext | None
+    _timeout: float
+    _name: str
+
+    async def __call__(self) -> HealthCheckResult:
+        """Performs the health check.
+
+        Returns:
+            A HealthCheckResult object.
+        """
+        try:
+            details = await asyncio.wait_for(self._run(), self._timeout)
+        except BaseException:  # noqa: BLE001
+            return HealthCheckResult(name=self._name, healthy=False, error_details=format_exc())
+        return HealthCheckResult(name=self._name, healthy=True, details=details)
+
+    async def _open(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        return await asyncio.open_connection(self._host, self._port, ssl=self._ssl_context)
+
+    async def _run(self) -> dict[str, Any] | None:
+        reader, writer = await self._open()
+        try:
+            return await self._probe(reader, writer)
+        finally:
+            await close_writer(writer)
+
+    async def _probe(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> dict[str, Any] | None:
+        """Talk to the server, raising if it is not healthy."""
+        raise NotImplementedError
+
+    @property
+    def dependency(self) -> str:
+        """Return the `host:port` of the server."""
+        return f"{self._host}:{self._port}"
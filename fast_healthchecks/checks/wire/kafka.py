@@ -0,0 +1,123 @@
+"""This module provides a driverless health check class for Kafka.
+
+Classes:
+    KafkaWireHealthCheck: A class to perform health checks on Kafka with an `ApiVersions` request.
+
+Usage:
+    The KafkaWireHealthCheck class sends an `ApiVersions` v0 request to the bootstrap servers in
+    order and is healthy as soon as one of them answers without an error code.
+
+Example:
+    health_check = KafkaWireHealthCheck(
+        bootstrap_servers="localhost:9092",
+    )
+    result = await health_check()
+    print(result.healthy)
+"""
+
+import asyncio
+import ssl
+import struct
+from typing import Any, final
+
+from fast_healthchecks.checks._base import DEFAULT_HC_TIMEOUT, split_host_port
+from fast_healthchecks.checks.wire._base import WireHealthCheck, WireProtocolError, close_writer
+
+API_VERSIONS_KEY = 18
+CLIENT_ID = b"fast_healthchecks"
+
+_INT32 = struct.Struct("!i")
+_REQUEST_HEADER = struct.Struct("!hhih")
+_RESPONSE_HEADER = struct.Struct("!ih")
+
+
+@final
+class KafkaWireHealthCheck(WireHealthCheck):
+    """A class to perform health checks on Kafka without a driver.
+
+    Attributes:
+        _bootstrap_servers: The comma-separated Kafka bootstrap servers.
+        _name: The name of the health check.
+        _ssl_context: The SSL context, or `None` for a plain TCP connection.
+        _timeout: The timeout for the health check.
+    """
+
+    __slots__ = ("_bootstrap_servers", "_name", "_ssl_context", "_timeout")
+
+    _bootstrap_servers: str
+
+    def __init__(
+        self,
+        *,
+        bootstrap_servers: str = "localhost:9092",
+        ssl_context: ssl.SSLContext | None = None,
+        timeout: float = DEFAULT_HC_TIMEOUT,
+        name: str = "Kafka",
+    ) -> None:
+        """Initialize the KafkaWireHealthCheck.
+
+        Args:
+            bootstrap_servers: The comma-separated Kafka bootstrap servers.
+            ssl_context: The SSL context, or `None` for a plain TCP connection.
+            timeout: The timeout for the health check.
+            name: The name of the health check.
+        """
+        self._bootstrap_servers = bootstrap_servers
+        self._ssl_context = ssl_context
+        self._timeout = timeout
+        self._name = name
+
+    async def _run(self) -> dict[str, Any] | None:
+        error: BaseException | None = None
+        for host, port in self._addresses():
+            try:
+                reader, writer = await asyncio.open_connection(host, port, ssl=self._ssl_context)
+            except OSError as exc:
+                error = exc
+                continue
+            try:
+                return await self._probe(reader, writer)
+            except (OSError, asyncio.IncompleteReadError) as exc:
+                error = exc
+            finally:
+                await close_writer(writer)
+        if error is None:
+            msg = "No bootstrap servers"
+            raise ValueError(msg)
+        raise error
+
+    async def _probe(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:  # noqa: PLR6301
+        correlation_id = 1
+        request = _REQUEST_HEADER.pack(API_VERSIONS_KEY, 0, correlation_id, len(CLIENT_ID)) + CLIENT_ID
+        writer.write(_INT32.pack(len(request)) + request)
+        await writer.drain()
+        (size,) = _INT32.unpack(await reader.readexactly(_INT32.size))
+        response = await reader.readexactly(size)
+        response_id, error_code = _RESPONSE_HEADER.unpack(response[: _RESPONSE_HEADER.size])
+        if response_id != correlation_id:
+            msg = f"Unexpected correlation id: {response_id}"
+            raise WireProtocolError(msg)
+        if error_code != 0:
+            msg = f"ApiVersions failed with error code {error_code}"
+            raise WireProtocolError(msg)
+
+    @property
+    def dependency(self) -> str:
+        """Return the comma-separated `host:port` list of the bootstrap servers."""
+        return ",".join(f"{host}:{port}" for host, port in self._addresses())
+
+    def _addresses(self) -> list[tuple[str, int]]:
+        return [split_host_port(server.strip(), 9092) for server in self._bootstrap_servers.split(",")]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Converts the KafkaWireHealthCheck object to a dictionary.
+
+        Returns:
+            A dictionary with the KafkaWireHealthCheck attributes.
+        """
+        return {
+            "bootstrap_servers": self._bootstrap_servers,
+            "ssl_context": self._ssl_context,
+            "timeout": self._timeout,
+            "name": self._name,
+        }
@@ -0,0 +1,221 @@
+"""This module provides a driverless health check class for MongoDB.
+
+Classes:
+    MongoWireHealthCheck: A class to perform health checks on MongoDB with an `OP_MSG` `hello`.
+
+Usage:
+    The MongoWireHealthCheck class sends the `hello` command, which does not require authentication,
+    and expects a reply with `ok: 1`.
+
+Example:
+    health_check = MongoWireHealthCheck(
+        host="localhost",
+        port=27017,
+    )
+    result = await health_check()
+    print(result.healthy)
+"""
+
+import asyncio
+import ssl
+import struct
+from typing import Any, final
+
+from fast_healthchecks.checks._base import DEFAULT_HC_TIMEOUT
+from fast_healthchecks.checks.wire._base import WireHealthCheck, WireProtocolError
+from fast_healthchecks.dsn import MONGO_SCHEMES, parse_dsn
+from fast_healthchecks.tls import get_ssl_context
+
+OP_MSG = 2013
+
+_HEADER = struct.Struct("<iiii")
+_INT32 = struct.Struct("<i")
+_DOUBLE = struct.Struct("<d")
+_INT64 = struct.Struct("<q")
+
+BSON_DOUBLE = 0x01
+BSON_STRING = 0x02
+BSON_BINARY = 0x05
+BSON_BOOLEAN = 0x08
+BSON_REGEX = 0x0B
+BSON_INT32 = 0x10
+BSON_INT64 = 0x12
+
+# The size of the fixed-length BSON values, by type.
+_FIXED_SIZES = {
+    BSON_DOUBLE: 8,
+    0x07: 12,  # ObjectId
+    BSON_BOOLEAN: 1,
+    0x09: 8,  # UTC datetime
+    0x0A: 0,  # null
+    BSON_INT32: 4,
+    0x11: 8,  # timestamp
+    BSON_INT64: 8,
+    0x13: 16,  # decimal128
+    0x7F: 0,  # max key
+    0xFF: 0,  # min key
+}
+
+
+def _element(type_: int, name: str, value: bytes) -> bytes:
+    return bytes([type_]) + name.encode() + b"\x00" + value
+
+
+def _string(value: str) -> bytes:
+    data = value.encode() + b"\x00"
+    return _INT32.pack(len(data)) + data
+
+
+def _document(*elements: bytes) -> bytes:
+    body = b"".join(elements) + b"\x00"
+    return _INT32.pack(len(body) + 4) + body
+
+
+def _value_size(type_: int, data: bytes, offset: int) -> int:
+    if type_ in _FIXED_SIZES:
+        return _FIXED_SIZES[type_]
+    if type_ in {BSON_STRING, 0x0D, 0x0E}:  # string, JavaScript code, symbol
+        return 4 + _INT32.unpack_from(data, offset)[0]
+    if type_ in {0x03, 0x04, 0x0F}:  # document, array, code with scope
+        return _INT32.unpack_from(data, offset)[0]
+    if type_ == BSON_BINARY:
+        return 5 + _INT32.unpack_from(data, offset)[0]
+    if type_ == BSON_REGEX:
+        end = data.index(b"\x00", data.index(b"\x00", offset) + 1)
+        return end + 1 - offset
+    msg = f"Unsupported BSON type: {type_:#x}"
+    raise WireProtocolError(msg)
+
+
+def _decode_scalars(data: bytes) -> dict[str, Any]:
+    """Decode the top-level numbers, strings and booleans of a BSON document, skipping the rest."""
+    result: dict[str, Any] = {}
+    offset = 4
+    while data[offset] != 0:
+        type_ = data[offset]
+        end = data.index(b"\x00", offset + 1)
+        name = data[offset + 1 : end].decode(errors="replace")
+        offset = end + 1
+        if type_ == BSON_DOUBLE:
+            result[name] = _DOUBLE.unpack_from(data, offset)[0]
+        elif type_ == BSON_STRING:
+            size = _INT32.unpack_from(data, offset)[0]
+            result[name] = data[offset + 4 : offset + 3 + size].decode(errors="replace")
+        elif type_ == BSON_BOOLEAN:
+            result[name] = data[offset] == 1
+        elif type_ == BSON_INT32:
+            result[name] = _INT32.unpack_from(data, offset)[0]
+        elif type_ == BSON_INT64:
+            result[name] = _INT64.unpack_from(data, offset)[0]
+        offset += _value_size(type_, data, offset)
+    return result
+
+
+@final
+class MongoWireHealthCheck(WireHealthCheck):
+    """A class to perform health checks on MongoDB without a driver.
+
+    Attributes:
+        _host: The MongoDB host.
+        _name: The name of the health check.
+        _port: The MongoDB port.
+        _ssl_context: The SSL context, or `None` for a plain TCP connection.
+        _timeout: The timeout for the health check.
+    """
+
+    __slots__ = ("_host", "_name", "_port", "_ssl_context", "_timeout")
+
+    def __init__(
+        self,
+        *,
+        host: str = "localhost",
+        port: int = 27017,
+        ssl_context: ssl.SSLContext | None = None,
+        timeout: float = DEFAULT_HC_TIMEOUT,
+        name: str = "MongoDB",
+    ) -> None:
+        """Initialize the MongoWireHealthCheck.
+
+        Args:
+            host: The MongoDB host.
+            port: The MongoDB port.
+            ssl_context: The SSL context, or `None` for a plain TCP connection.
+            timeout: The timeout for the health check.
+            name: The name of the health check.
+        """
+        self._host = host
+        self._port = port
+        self._ssl_context = ssl_context
+        self._timeout = timeout
+        self._name = name
+
+    @classmethod
+    def from_dsn(
+        cls,
+        dsn: str,
+        *,
+        name: str = "MongoDB",
+        timeout: float = DEFAULT_HC_TIMEOUT,
+    ) -> "MongoWireHealthCheck":
+        """Create a MongoWireHealthCheck instance from a DSN.
+
+        Only single-host `mongodb://` DSNs are supported, `mongodb+srv://` needs an SRV lookup.
+
+        Args:
+            dsn: The DSN to connect to.
+            name: The name of the health check.
+            timeout: The timeout for the health check.
+
+        Returns:
+            A MongoWireHealthCheck instance.
+
+        Raises:
+            ValueError: If the DSN is a `mongodb+srv://` DSN.
+        """
+        parsed = parse_dsn(str(dsn), MONGO_SCHEMES)
+        if parsed.scheme == "mongodb+srv":
+            msg = "mongodb+srv DSNs are not supported, the servers are listed in DNS"
+            raise ValueError(msg) from None
+        host, port = parsed.address("localhost", 27017)
+        options = parsed.options
+        secure = "true" in {options.get("tls", "").lower(), options.get("ssl", "").lower()}
+        return cls(
+            host=host,
+            port=port,
+            ssl_context=get_ssl_context(cafile=options.get("tlsCAFile") or None) if secure else None,
+            timeout=timeout,
+            name=name,
+        )
+
+    async def _probe(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:  # noqa: PLR6301
+        request_id = 1
+        document = _document(
+            _element(BSON_INT32, "hello", _INT32.pack(1)),
+            _element(BSON_STRING, "$db", _string("admin")),
+        )
+        body = b"\x00\x00\x00\x00" + b"\x00" + document  # flagBits and a body section
+        writer.write(_HEADER.pack(_HEADER.size + len(body), request_id, 0, OP_MSG) + body)
+        await writer.drain()
+        length, _, response_to, op_code = _HEADER.unpack(await reader.readexactly(_HEADER.size))
+        payload = await reader.readexactly(length - _HEADER.size)
+        if op_code != OP_MSG or response_to != request_id or payload[4] != 0:
+            msg = f"Unexpected reply: opCode {op_code}, responseTo {response_to}"
+            raise WireProtocolError(msg)
+        reply = _decode_scalars(payload[5:])
+        if reply.get("ok") != 1:
+            msg = f"hello failed: {reply.get('errmsg', 'no error message')}"
+            raise WireProtocolError(msg)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Converts the MongoWireHealthCheck object to a dictionary.
+
+        Returns:
+            A dictionary with the MongoWireHealthCheck attributes.
+        """
+        return {
+            "host": self._host,
+            "port": self._port,
+            "ssl_context": self._ssl_context,
+            "timeout": self._timeout,
+            "name": self._name,
+        }
@@ -0,0 +1,310 @@
+"""This module provides a driverless health check class for PostgreSQL.
+
+Classes:
+    PostgreSQLWireHealthCheck: A class to perform health checks on PostgreSQL over its frontend/backend protocol.
+
+Usage:
+    The PostgreSQLWireHealthCheck class sends the startup message, authenticates with a cleartext
+    password, MD5 or SCRAM-SHA-256, runs `SELECT 1` and terminates the session. With an SSL context
+    the connection is upgraded to TLS with an `SSLRequest` first.
+
+Example:
+    health_check = PostgreSQLWireHealthCheck(
+        host="localhost",
+        port=5432,
+        user="postgres",
+        password="postgres",
+        database="postgres",
+    )
+    result = await health_check()
+    print(result.healthy)
+"""
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import secrets
+import socket
+import ssl
+import struct
+from typing import Any, final
+
+from fast_healthchecks.checks._base import DEFAULT_HC_TIMEOUT
+from fast_healthchecks.checks.postgresql.base import BasePostgreSQLHealthCheck, create_ssl_context
+from fast_healthchecks.checks.wire._base import WireHealthCheck, WireProtocolError
+from fast_healthchecks.dsn import POSTGRES_SCHEMES, parse_dsn
+
+PROTOCOL_VERSION = 196608  # 3.0
+SSL_REQUEST_CODE = 80877103
+
+AUTH_OK = 0
+AUTH_CLEARTEXT_PASSWORD = 3
+AUTH_MD5_PASSWORD = 5
+AUTH_SASL = 10
+AUTH_SASL_CONTINUE = 11
+AUTH_SASL_FINAL = 12
+
+SCRAM_SHA_256 = "SCRAM-SHA-256"
+
+_INT32 = struct.Struct("!i")
+
+
+def _message(type_: bytes, payload: bytes) -> bytes:
+    return type_ + _INT32.pack(len(payload) + 4) + payload
+
+
+async def _read_message(reader: asyncio.StreamReader) -> tuple[bytes, bytes]:
+    header = await reader.readexactly(5)
+    (length,) = _INT32.unpack(header[1:])
+    return header[:1], await reader.readexactly(length - 4)
+
+
+def _error(payload: bytes) -> WireProtocolError:
+    """Build an error from the fields of an `ErrorResponse`."""
+    fields = {field[:1]: field[1:].decode(errors="replace") for field in payload.split(b"\x00") if field}
+    return WireProtocolError(f"{fields.get(b'S', 'ERROR')} {fields.get(b'C', '')}: {fields.get(b'M', '')}")
+
+
+async def _request_tls(loop: asyncio.AbstractEventLoop, sock: socket.socket) -> None:
+    await loop.sock_sendall(sock, _INT32.pack(8) + _INT32.pack(SSL_REQUEST_CODE))
+    if await loop.sock_recv(sock, 1) != b"S":
+        msg = "The server does not accept TLS connections"
+        raise WireProtocolError(msg)
+
+
+class _ScramSHA256:
+    """The client side of a SCRAM-SHA-256 exchange, without channel binding."""
+
+    __slots__ = ("_auth_message", "_client_first_bare", "_nonce", "_password", "_salted_password")
+
+    def __init__(self, password: str) -> None:
+        self._password = password
+        self._nonce = base64.b64encode(secrets.token_bytes(18)).decode()
+        # PostgreSQL takes the user name from the startup message.
+        self._client_first_bare = f"n=,r={self._nonce}"
+        self._auth_message = b""
+        self._salted_password = b""
+
+    def first_message(self, mechanisms: list[bytes]) -> bytes:
+        if SCRAM_SHA_256.encode() not in mechanisms:
+            msg = "The server offers no supported SASL mechanism"
+            raise WireProtocolError(msg)
+        first = f"n,,{self._client_first_bare}".encode()
+        return SCRAM_SHA_256.encode() + b"\x00" + _INT32.pack(len(first)) + first
+
+    def final_message(self, server_first: bytes) -> bytes:
+        attributes = dict(item.split("=", 1) for item in server_first.decode().split(","))
+        if not attributes["r"].startswith(self._nonce):
+            msg = "The server nonce does not extend the client nonce"
+            raise WireProtocolError(msg)
+        self._salted_password = hashlib.pbkdf2_hmac(
+            "sha256",
+            self._password.encode(),
+            base64.b64decode(attributes["s"]),
+            int(attributes["i"]),
+        )
+        client_final = f"c=biws,r={attributes['r']}"
+        self._auth_message = f"{self._client_first_bare},{server_first.decode()},{client_final}".encode()
+        client_key = hmac.digest(self._salted_password, b"Client Key", "sha256")
+        signature = hmac.digest(hashlib.sha256(client_key).digest(), self._auth_message, "sha256")
+        proof = bytes(key ^ sig for key, sig in zip(client_key, signature, strict=True))
+        return f"{client_final},p={base64.b64encode(proof).decode()}".encode()
+
+    def verify(self, server_final: bytes) -> None:
+        server_key = hmac.digest(self._salted_password, b"Server Key", "sha256")
+        expected = base64.b64encode(hmac.digest(server_key, self._auth_message, "sha256")).decode()
+        if server_final.decode() != f"v={expected}":
+            msg = "The server signature is invalid"
+            raise WireProtocolError(msg)
+
+
+@final
+class PostgreSQLWireHealthCheck(WireHealthCheck):
+    """A class to perform health checks on PostgreSQL without a driver.
+
+    Attributes:
+        _database: The database to connect to, defaults to the user name.
+        _host: The PostgreSQL host.
+        _name: The name of the health check.
+        _password: The PostgreSQL password.
+        _port: The PostgreSQL port.
+        _ssl_context: The SSL context, or `None` for a plain TCP connection.
+        _timeout: The timeout for the health check.
+        _user: The PostgreSQL user.
+    """
+
+    __slots__ = ("_database", "_host", "_name", "_password", "_port", "_ssl_context", "_timeout", "_user")
+
+    _user: str
+    _password: str | None
+    _database: str | None
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        host: str = "localhost",
+        port: int = 5432,
+        user: str = "postgres",
+        password: str | None = None,
+        database: str | None = None,
+        ssl_context: ssl.SSLContext | None = None,
+        timeout: float = DEFAULT_HC_TIMEOUT,
+        name: str = "PostgreSQL",
+    ) -> None:
+        """Initialize the PostgreSQLWireHealthCheck.
+
+        Args:
+            host: The PostgreSQL host.
+            port: The PostgreSQL port.
+            user: The PostgreSQL user.
+            password: The PostgreSQL password.
+            database: The database to connect to, defaults to the user name.
+            ssl_context: The SSL context, or `None` for a plain TCP connection.
+            timeout: The timeout for the health check.
+            name: The name of the health check.
+        """
+        self._host = host
+        self._port = port
+        self._user = user
+        self._password = password
+        self._database = database
+        self._ssl_context = ssl_context
+        self._timeout = timeout
+        self._name = name
+
+    @classmethod
+    def from_dsn(
+        cls,
+        dsn: str,
+        *,
+        name: str = "PostgreSQL",
+        timeout: float = DEFAULT_HC_TIMEOUT,
+    ) -> "PostgreSQLWireHealthCheck":
+        """Create a PostgreSQLWireHealthCheck instance from a DSN.
+
+        The `sslmode` values `allow` and `prefer` connect without TLS, like `disable`.
+
+        Args:
+            dsn: The DSN to connect to.
+            name: The name of the health check.
+            timeout: The timeout for the health check.
+
+        Returns:
+            A PostgreSQLWireHealthCheck instance.
+        """
+        parsed = parse_dsn(str(dsn), POSTGRES_SCHEMES)
+        host, port = parsed.address("localhost", 5432)
+        options = parsed.options
+        sslmode = BasePostgreSQLHealthCheck.validate_sslmode(options.get("sslmode", "disable"))
+        ssl_context = (
+            create_ssl_context(sslmode, options.get("sslcert"), options.get("sslkey"), options.get("sslrootcert"))
+            if sslmode in {"require", "verify-ca", "verify-full"}
+            else None
+        )
+        return cls(
+            host=host,
+            port=port,
+            user=parsed.user or "postgres",
+            password=parsed.password,
+            database=parsed.path or None,
+            ssl_context=ssl_context,
+            timeout=timeout,
+            name=name,
+        )
+
+    async def _open(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        if self._ssl_context is None:
+            return await asyncio.open_connection(self._host, self._port)
+        # The TLS handshake starts after the server accepts the `SSLRequest` in plain text.
+        loop = asyncio.get_running_loop()
+        family, type_, proto, _, address = (await loop.getaddrinfo(self._host, self._port, type=socket.SOCK_STREAM))[0]
+        sock = socket.socket(family, type_, proto)
+        try:
+            sock.setblocking(False)  # noqa: FBT003
+            await loop.sock_connect(sock, address)
+            await _request_tls(loop, sock)
+            return await asyncio.open_connection(sock=sock, ssl=self._ssl_context, server_hostname=self._host)
+        except BaseException:
+            sock.close()
+            raise
+
+    def _require_password(self) -> str:
+        if self._password is None:
+            msg = "The server requires a password"
+            raise WireProtocolError(msg)
+        return self._password
+
+    def _password_message(self, code: int, salt: bytes) -> bytes:
+        """Answer a cleartext or MD5 password request."""
+        password = self._require_password()
+        if code == AUTH_CLEARTEXT_PASSWORD:
+            return password.encode() + b"\x00"
+        if code == AUTH_MD5_PASSWORD:
+            inner = hashlib.md5((password + self._user).encode()).hexdigest()  # noqa: S324
+            outer = hashlib.md5(inner.encode() + salt).hexdigest()  # noqa: S324
+            return f"md5{outer}".encode() + b"\x00"
+        msg = f"Unsupported authentication method: {code}"
+        raise WireProtocolError(msg)
+
+    async def _authenticate(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        scram: _ScramSHA256 | None = None
+        while True:
+            type_, payload = await _read_message(reader)
+            if type_ == b"E":
+                raise _error(payload)
+            if type_ != b"R":
+                msg = f"Unexpected message during authentication: {type_!r}"
+                raise WireProtocolError(msg)
+            (code,) = _INT32.unpack(payload[:4])
+            if code == AUTH_OK:
+                return
+            if code == AUTH_SASL_FINAL and scram is not None:
+                scram.verify(payload[4:])
+                continue
+            if code == AUTH_SASL:
+                scram = _ScramSHA256(self._require_password())
+                response = scram.first_message(payload[4:].split(b"\x00"))
+            elif code == AUTH_SASL_CONTINUE and scram is not None:
+                response = scram.final_message(payload[4:])
+            else:
+                response = self._password_message(code, payload[4:8])
+            writer.write(_message(b"p", response))
+            await writer.drain()
+
+    async def _probe(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        parameters = {"user": self._user, "database": self._database or self._user}
+        startup = b"".join(f"{key}\x00{value}\x00".encode() for key, value in parameters.items()) + b"\x00"
+        body = _INT32.pack(PROTOCOL_VERSION) + startup
+        writer.write(_INT32.pack(len(body) + 4) + body)
+        await writer.drain()
+        await self._authenticate(reader, writer)
+        writer.write(_message(b"Q", b"SELECT 1\x00"))
+        await writer.drain()
+        # The backend sends its parameters and ready state, then the answer to the query.
+        ready = 0
+        while ready < 2:  # noqa: PLR2004
+            type_, payload = await _read_message(reader)
+            if type_ == b"E":
+                raise _error(payload)
+            if type_ == b"Z":
+                ready += 1
+        writer.write(_message(b"X", b""))
+        await writer.drain()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Converts the PostgreSQLWireHealthCheck object to a dictionary.
+
+        Returns:
+            A dictionary with the PostgreSQLWireHealthCheck attributes.
+        """
+        return {
+            "host": self._host,
+            "port": self._port,
+            "user": self._user,
+            "password": self._password,
+            "database": self._database,
+            "ssl_context": self._ssl_context,
+            "timeout": self._timeout,
+            "name": self._name,
+        }
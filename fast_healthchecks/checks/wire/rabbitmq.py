@@ -0,0 +1,209 @@
+"""This module provides a driverless health check class for RabbitMQ.
+
+Classes:
+    RabbitMQWireHealthCheck: A class to perform health checks on RabbitMQ with the AMQP 0-9-1 handshake.
+
+Usage:
+    The RabbitMQWireHealthCheck class negotiates an AMQP 0-9-1 connection, authenticating with
+    `PLAIN` and opening the virtual host, and closes it again.
+
+Example:
+    health_check = RabbitMQWireHealthCheck(
+        host="localhost",
+        user="guest",
+        password="guest",
+    )
+    result = await health_check()
+    print(result.healthy)
+"""
+
+import asyncio
+import ssl
+import struct
+from typing import Any, final
+
+from fast_healthchecks.checks._base import DEFAULT_HC_TIMEOUT
+from fast_healthchecks.checks.wire._base import WireHealthCheck, WireProtocolError
+from fast_healthchecks.dsn import AMQP_SCHEMES, parse_dsn
+from fast_healthchecks.tls import get_ssl_context
+
+PROTOCOL_HEADER = b"AMQP\x00\x00\x09\x01"
+FRAME_METHOD = 1
+FRAME_END = 0xCE
+
+CONNECTION_START = (10, 10)
+CONNECTION_START_OK = (10, 11)
+CONNECTION_TUNE = (10, 30)
+CONNECTION_TUNE_OK = (10, 31)
+CONNECTION_OPEN = (10, 40)
+CONNECTION_OPEN_OK = (10, 41)
+CONNECTION_CLOSE = (10, 50)
+CONNECTION_CLOSE_OK = (10, 51)
+
+_FRAME_HEADER = struct.Struct("!BHI")
+_METHOD_HEADER = struct.Struct("!HH")
+
+
+def _shortstr(value: str) -> bytes:
+    data = value.encode()
+    return struct.pack("!B", len(data)) + data
+
+
+def _longstr(value: bytes) -> bytes:
+    return struct.pack("!I", len(value)) + value
+
+
+def _method(method: tuple[int, int], arguments: bytes) -> bytes:
+    payload = _METHOD_HEADER.pack(*method) + arguments
+    return _FRAME_HEADER.pack(FRAME_METHOD, 0, len(payload)) + payload + bytes([FRAME_END])
+
+
+async def _read_method(reader: asyncio.StreamReader) -> tuple[tuple[int, int], bytes]:
+    """Read the next method on channel 0, skipping heartbeats."""
+    while True:
+        frame_type, _, size = _FRAME_HEADER.unpack(await reader.readexactly(_FRAME_HEADER.size))
+        payload = await reader.readexactly(size + 1)
+        if payload[-1] != FRAME_END:
+            msg = "Malformed frame"
+            raise WireProtocolError(msg)
+        if frame_type == FRAME_METHOD:
+            return _METHOD_HEADER.unpack(payload[:4]), payload[4:-1]
+
+
+def _close_error(arguments: bytes) -> WireProtocolError:
+    """Build an error from the arguments of a `Connection.Close`."""
+    (reply_code,) = struct.unpack("!H", arguments[:2])
+    reply_text = arguments[3 : 3 + arguments[2]].decode(errors="replace")
+    return WireProtocolError(f"{reply_code}: {reply_text}")
+
+
+async def _expect(reader: asyncio.StreamReader, expected: tuple[int, int]) -> bytes:
+    method, arguments = await _read_method(reader)
+    if method == CONNECTION_CLOSE:
+        raise _close_error(arguments)
+    if method != expected:
+        msg = f"Unexpected method {method}, expected {expected}"
+        raise WireProtocolError(msg)
+    return arguments
+
+
+@final
+class RabbitMQWireHealthCheck(WireHealthCheck):
+    """A class to perform health checks on RabbitMQ without a driver.
+
+    Attributes:
+        _host: The RabbitMQ host.
+        _name: The name of the health check.
+        _password: The RabbitMQ password.
+        _port: The RabbitMQ port.
+        _ssl_context: The SSL context, or `None` for a plain TCP connection.
+        _timeout: The timeout for the health check.
+        _user: The RabbitMQ user.
+        _vhost: The RabbitMQ virtual host.
+    """
+
+    __slots__ = ("_host", "_name", "_password", "_port", "_ssl_context", "_timeout", "_user", "_vhost")
+
+    _user: str
+    _password: str
+    _vhost: str
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        host: str,
+        user: str,
+        password: str,
+        port: int = 5672,
+        vhost: str = "/",
+        ssl_context: ssl.SSLContext | None = None,
+        timeout: float = DEFAULT_HC_TIMEOUT,
+        name: str = "RabbitMQ",
+    ) -> None:
+        """Initialize the RabbitMQWireHealthCheck.
+
+        Args:
+            host: The RabbitMQ host.
+            user: The RabbitMQ user.
+            password: The RabbitMQ password.
+            port: The RabbitMQ port.
+            vhost: The RabbitMQ virtual host.
+            ssl_context: The SSL context, or `None` for a plain TCP connection.
+            timeout: The timeout for the health check.
+            name: The name of the health check.
+        """
+        self._host = host
+        self._user = user
+        self._password = password
+        self._port = port
+        self._vhost = vhost
+        self._ssl_context = ssl_context
+        self._timeout = timeout
+        self._name = name
+
+    @classmethod
+    def from_dsn(
+        cls,
+        dsn: str,
+        *,
+        name: str = "RabbitMQ",
+        timeout: float = DEFAULT_HC_TIMEOUT,
+    ) -> "RabbitMQWireHealthCheck":
+        """Create a RabbitMQWireHealthCheck instance from a DSN.
+
+        Args:
+            dsn: The DSN to connect to.
+            name: The name of the health check.
+            timeout: The timeout for the health check.
+
+        Returns:
+            A RabbitMQWireHealthCheck instance.
+        """
+        parsed = parse_dsn(str(dsn), AMQP_SCHEMES)
+        secure = parsed.scheme == "amqps"
+        host, port = parsed.address("localhost", 5671 if secure else 5672)
+        return cls(
+            host=host,
+            port=port,
+            user=parsed.user or "guest",
+            password=parsed.password or "guest",
+            vhost=parsed.path or "/",
+            ssl_context=get_ssl_context() if secure else None,
+            timeout=timeout,
+            name=name,
+        )
+
+    async def _probe(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        writer.write(PROTOCOL_HEADER)
+        await writer.drain()
+        await _expect(reader, CONNECTION_START)
+        response = f"\x00{self._user}\x00{self._password}".encode()
+        arguments = _longstr(b"") + _shortstr("PLAIN") + _longstr(response) + _shortstr("en_US")
+        writer.write(_method(CONNECTION_START_OK, arguments))
+        await writer.drain()
+        channel_max, frame_max, _ = struct.unpack("!HIH", (await _expect(reader, CONNECTION_TUNE))[:8])
+        # No heartbeats, the connection only lives for the duration of the check.
+        writer.write(_method(CONNECTION_TUNE_OK, struct.pack("!HIH", channel_max, frame_max, 0)))
+        writer.write(_method(CONNECTION_OPEN, _shortstr(self._vhost) + _shortstr("") + b"\x00"))
+        await writer.drain()
+        await _expect(reader, CONNECTION_OPEN_OK)
+        writer.write(_method(CONNECTION_CLOSE, struct.pack("!H", 200) + _shortstr("") + struct.pack("!HH", 0, 0)))
+        await writer.drain()
+        await _expect(reader, CONNECTION_CLOSE_OK)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Converts the RabbitMQWireHealthCheck object to a dictionary.
+
+        Returns:
+            A dictionary with the RabbitMQWireHealthCheck attributes.
+        """
+        return {
+            "host": self._host,
+            "port": self._port,
+            "user": self._user,
+            "password": self._password,
+            "vhost": self._vhost,
+            "ssl_context": self._ssl_context,
+            "timeout": self._timeout,
+            "name": self._name,
+        }
@@ -0,0 +1,151 @@
+"""This module provides a driverless health check class for Redis.
+
+Classes:
+    RedisWireHealthCheck: A class to perform health checks on Redis with a RESP `PING`.
+
+Usage:
+    The RedisWireHealthCheck class sends `AUTH`, if credentials are given, and `PING` in a single
+    round trip and expects `+OK` and `+PONG` back.
+
+Example:
+    health_check = RedisWireHealthCheck(
+        host="localhost",
+        port=6379,
+    )
+    result = await health_check()
+    print(result.healthy)
+"""
+
+import asyncio
+import ssl
+from typing import Any, final
+
+from fast_healthchecks.checks._base import DEFAULT_HC_TIMEOUT
+from fast_healthchecks.checks.wire._base import WireHealthCheck, WireProtocolError
+from fast_healthchecks.dsn import REDIS_SCHEMES, parse_dsn
+from fast_healthchecks.tls import get_ssl_context
+
+
+def _command(*args: str) -> bytes:
+    """Encode a command as a RESP array of bulk strings."""
+    parts = [f"*{len(args)}\r\n".encode()]
+    for arg in args:
+        data = arg.encode()
+        parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+    return b"".join(parts)
+
+
+async def _expect(reader: asyncio.StreamReader, expected: bytes) -> None:
+    reply = (await reader.readuntil(b"\r\n"))[:-2]
+    if reply != expected:
+        msg = f"Unexpected reply: {reply.decode(errors='replace')}"
+        raise WireProtocolError(msg)
+
+
+@final
+class RedisWireHealthCheck(WireHealthCheck):
+    """A class to perform health checks on Redis without a driver.
+
+    Attributes:
+        _host: The Redis host.
+        _name: The name of the health check.
+        _password: The Redis password.
+        _port: The Redis port.
+        _ssl_context: The SSL context, or `None` for a plain TCP connection.
+        _timeout: The timeout for the health check.
+        _user: The Redis user.
+    """
+
+    __slots__ = ("_host", "_name", "_password", "_port", "_ssl_context", "_timeout", "_user")
+
+    _user: str | None
+    _password: str | None
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        host: str = "localhost",
+        port: int = 6379,
+        user: str | None = None,
+        password: str | None = None,
+        ssl_context: ssl.SSLContext | None = None,
+        timeout: float = DEFAULT_HC_TIMEOUT,
+        name: str = "Redis",
+    ) -> None:
+        """Initialize the RedisWireHealthCheck.
+
+        Args:
+            host: The Redis host.
+            port: The Redis port.
+            user: The Redis user.
+            password: The Redis password.
+            ssl_context: The SSL context, or `None` for a plain TCP connection.
+            timeout: The timeout for the health check.
+            name: The name of the health check.
+        """
+        self._host = host
+        self._port = port
+        self._user = user
+        self._password = password
+        self._ssl_context = ssl_context
+        self._timeout = timeout
+        self._name = name
+
+    @classmethod
+    def from_dsn(
+        cls,
+        dsn: str,
+        *,
+        name: str = "Redis",
+        timeout: float = DEFAULT_HC_TIMEOUT,
+    ) -> "RedisWireHealthCheck":
+        """Create a RedisWireHealthCheck instance from a DSN.
+
+        Args:
+            dsn: The DSN to connect to.
+            name: The name of the health check.
+            timeout: The timeout for the health check.
+
+        Returns:
+            A RedisWireHealthCheck instance.
+        """
+        parsed = parse_dsn(str(dsn), REDIS_SCHEMES)
+        host, port = parsed.address("localhost", 6379)
+        ssl_ca_certs = parsed.options.get("ssl_ca_certs") or None
+        secure = parsed.scheme == "rediss" or ssl_ca_certs is not None
+        return cls(
+            host=host,
+            port=port,
+            user=parsed.user,
+            password=parsed.password,
+            ssl_context=get_ssl_context(cafile=ssl_ca_certs) if secure else None,
+            timeout=timeout,
+            name=name,
+        )
+
+    async def _probe(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        request = _command("PING")
+        if self._password is not None:
+            auth = ("AUTH", self._user, self._password) if self._user else ("AUTH", self._password)
+            request = _command(*auth) + request
+        writer.write(request)
+        await writer.drain()
+        if self._password is not None:
+            await _expect(reader, b"+OK")
+        await _expect(reader, b"+PONG")
+
+    def to_dict(self) -> dict[str, Any]:
+        """Converts the RedisWireHealthCheck object to a dictionary.
+
+        Returns:
+            A dictionary with the RedisWireHealthCheck attributes.
+        """
+        return {
+            "host": self._host,
+            "port": self._port,
+            "user": self._user,
+            "password": self._password,
+            "ssl_context": self._ssl_context,
+            "timeout": self._timeout,
+            "name": self._name,
+        }
@@ -0,0 +1,547 @@
+"""This module provides helpers to run health checks.
+
+Classes:
+    ConnectionBudget: A limit on the connections opened by health checks at the same time.
+    RateLimiter: A limit on how often health checks contact each dependency.
+    CheckRegistry: A registry sharing the results of identical health checks.
+
+Functions:
+    run_check: Run a single health check, hard-bounded by its timeout.
+    run_checks: Run several health checks concurrently.
+    get_connection_budget: Return the process-wide connection budget.
+    set_connection_budget: Install or remove the process-wide connection budget.
+    get_rate_limiter: Return the process-wide rate limiter.
+    set_rate_limiter: Install or remove the process-wide rate limiter.
+    get_check_registry: Return the process-wide check registry.
+    set_check_registry: Install or remove the process-wide check registry.
+
+Usage:
+    Drivers apply their own timeouts only to some phases of a check (connect, query, ...), so a check
+    that hangs during the TLS handshake, authentication or while closing the connection may outlive
+    its `timeout`. The helpers in this module enforce the deadline at the runner level: once the
+    timeout expires the check is cancelled in the background and an unhealthy result is returned
+    immediately.
+
+    A connection budget caps the number of checks talking to dependencies at the same time across
+    all probes, so liveness, readiness and startup probes together can never exhaust the
+    `max_connections` of a database. Time spent waiting for the budget counts against the timeout.
+
+    A rate limiter decouples the probe frequency from the backend load: each dependency is contacted
+    at most `rate` times per second, and calls over the limit get the latest result for the dependency.
+
+    A check registry runs identical checks (same type and `to_dict()` apart from the name) that are
+    triggered within a short window once, so probes sharing a check share its result as well.
+
+    A DNS cache, installed with `fast_healthchecks.resolver.set_dns_cache`, resolves the hosts of a
+    check before its dependency is contacted and answers the lookups of the drivers while it runs. A
+    host that cannot be resolved fails the check without contacting the dependency.
+
+Example:
+    set_connection_budget(ConnectionBudget(4, per_dependency=1))
+    set_rate_limiter(RateLimiter(1.0))
+    set_check_registry(CheckRegistry(window=1.0))
+    results = await run_checks([
+        RedisHealthCheck(host="localhost", timeout=1.0),
+        UrlHealthCheck(url="https://example.com", timeout=2.0),
+    ])
+"""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable, Iterable
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import replace
+from operator import itemgetter
+from traceback import format_exc
+from typing import final
+
+from fast_healthchecks.checks._base import HealthCheck
+from fast_healthchecks.models import HealthCheckResult
+from fast_healthchecks.resolver import DNSResolutionError, get_dns_cache
+
+__all__ = (
+    "CheckRegistry",
+    "ConnectionBudget",
+    "RateLimiter",
+    "get_check_registry",
+    "get_connection_budget",
+    "get_rate_limiter",
+    "run_check",
+    "run_checks",
+    "set_check_registry",
+    "set_connection_budget",
+    "set_rate_limiter",
+)
+
+_background_tasks: set["asyncio.Future[HealthCheckResult]"] = set()
+
+
+class ConnectionBudget:
+    """A limit on the connections opened by health checks at the same time.
+
+    Checks that exceed the budget wait in a queue per dependency. Freed slots are handed out to the
+    queues in round-robin order, so a busy dependency cannot starve the checks of the others.
+
+    Args:
+        limit: The maximum number of simultaneous connections across all dependencies.
+        per_dependency: The maximum number of simultaneous connections to a single dependency.
+    """
+
+    __slots__ = ("_active", "_active_per_dependency", "_limit", "_per_dependency", "_waiters")
+
+    _limit: int
+    _per_dependency: int | None
+    _active: int
+    _active_per_dependency: dict[str, int]
+    _waiters: dict[str, deque["asyncio.Future[None]"]]
+
+    def __init__(self, limit: int, *, per_dependency: int | None = None) -> None:
+        """Initialize the connection budget."""
+        if limit < 1:
+            msg = f"Invalid limit: {limit}"
+            raise ValueError(msg) from None
+        if per_dependency is not None and per_dependency < 1:
+            msg = f"Invalid per-dependency limit: {per_dependency}"
+            raise ValueError(msg) from None
+        self._limit = limit
+        self._per_dependency = per_dependency
+        self._active = 0
+        self._active_per_dependency = {}
+        self._waiters = {}
+
+    @property
+    def active(self) -> int:
+        """Return the number of connections currently held."""
+        return self._active
+
+    @property
+    def waiting(self) -> int:
+        """Return the number of checks waiting for a connection."""
+        return sum(len(queue) for queue in self._waiters.values())
+
+    def _has_room(self, dependency: str) -> bool:
+        if self._active >= self._limit:
+            return False
+        return self._per_dependency is None or self._active_per_dependency.get(dependency, 0) < self._per_dependency
+
+    def _take(self, dependency: str) -> None:
+        self._active += 1
+        self._active_per_dependency[dependency] = self._active_per_dependency.get(dependency, 0) + 1
+
+    def _release(self, dependency: str) -> None:
+        self._active -= 1
+        self._active_per_dependency[dependency] -= 1
+        if not self._active_per_dependency[dependency]:
+            del self._active_per_dependency[dependency]
+        self._wake()
+
+    def _discard(self, dependency: str, waiter: "asyncio.Future[None]") -> None:
+        queue = self._waiters.get(dependency)
+        if queue is not None and waiter in queue:
+            queue.remove(waiter)
+            if not queue:
+                del self._waiters[dependency]
+
+    def _wake(self) -> None:
+        while self._active < self._limit:
+            dependency = next((dependency for dependency in self._waiters if self._has_room(dependency)), None)
+            if dependency is None:
+                return
+            # Move the served dependency to the back of the line.
+            queue = self._waiters.pop(dependency)
+            waiter = queue.popleft()
+            if queue:
+                self._waiters[dependency] = queue
+            self._take(dependency)
+            waiter.set_result(None)
+
+    @asynccontextmanager
+    async def acquire(self, dependency: str | None) -> AsyncIterator[None]:
+        """Hold a connection to the dependency for the duration of the context.
+
+        Args:
+            dependency: The identity of the dependency, or `None` to bypass the budget.
+        """
+        if dependency is None:
+            yield
+            return
+        if not self._waiters.get(dependency) and self._has_room(dependency):
+            self._take(dependency)
+        else:
+            waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            self._waiters.setdefault(dependency, deque()).append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                if waiter.done() and not waiter.cancelled():
+                    self._release(dependency)
+                else:
+                    waiter.cancel()
+                    self._discard(dependency, waiter)
+                raise
+        try:
+            yield
+        finally:
+            self._release(dependency)
+
+
+_connection_budget: ConnectionBudget | None = None
+
+
+def get_connection_budget() -> ConnectionBudget | None:
+    """Return the process-wide connection budget, or `None` if connections are not limited."""
+    return _connection_budget
+
+
+def set_connection_budget(budget: ConnectionBudget | None) -> None:
+    """Install the process-wide connection budget shared by all health checks.
+
+    Args:
+        budget: The connection budget, or `None` to stop limiting connections.
+    """
+    global _connection_budget  # noqa: PLW0603
+    _connection_budget = budget
+
+
+class RateLimiter:
+    """A token-bucket limit on how often health checks contact each dependency.
+
+    Every dependency gets a bucket of `burst` tokens refilled at `rate` tokens per second, and each
+    call of a check takes a token. A call over the limit returns the latest result of the same check,
+    or else the latest result of any check of the dependency, without contacting the dependency. If
+    there is no result yet, it waits for the next token, unless the token comes later than the
+    timeout of the check, in which case it fails at once.
+
+    Args:
+        rate: The number of calls per second allowed for each dependency.
+        burst: The number of calls allowed at once, defaults to one.
+    """
+
+    __slots__ = ("_buckets", "_burst", "_latest", "_rate", "_results")
+
+    _rate: float
+    _burst: int
+    _buckets: dict[str, tuple[float, float]]
+    _results: dict[tuple[str, str], HealthCheckResult]
+    _latest: dict[str, HealthCheckResult]
+
+    def __init__(self, rate: float, *, burst: int = 1) -> None:
+        """Initialize the rate limiter."""
+        if rate <= 0:
+            msg = f"Invalid rate: {rate}"
+            raise ValueError(msg) from None
+        if burst < 1:
+            msg = f"Invalid burst: {burst}"
+            raise ValueError(msg) from None
+        self._rate = rate
+        self._burst = burst
+        self._buckets = {}
+        self._results = {}
+        self._latest = {}
+
+    def _tokens(self, dependency: str) -> float:
+        now = time.monotonic()
+        tokens, updated = self._buckets.get(dependency, (self._burst, now))
+        tokens = min(self._burst, tokens + (now - updated) * self._rate)
+        self._buckets[dependency] = (tokens, now)
+        return tokens
+
+    def _take(self, dependency: str) -> float:
+        """Take a token, returning how long to wait until it becomes available."""
+        tokens = self._tokens(dependency) - 1
+        self._buckets[dependency] = (tokens, self._buckets[dependency][1])
+        return max(0.0, -tokens / self._rate)
+
+    def _refund(self, dependency: str) -> None:
+        """Give back a token that was taken but not used."""
+        tokens = min(self._burst, self._tokens(dependency) + 1)
+        self._buckets[dependency] = (tokens, self._buckets[dependency][1])
+
+    def _cached(self, check: HealthCheck[HealthCheckResult], dependency: str) -> HealthCheckResult | None:
+        cached = self._results.get((dependency, check.name))
+        if cached is not None:
+            return cached
+        latest = self._latest.get(dependency)
+        return None if latest is None else replace(latest, name=check.name)
+
+    async def acquire(self, check: HealthCheck[HealthCheckResult]) -> HealthCheckResult | None:
+        """Take a token for the check's dependency.
+
+        Args:
+            check: The health check about to run.
+
+        Returns:
+            The latest result for the dependency if it is over its limit, an unhealthy result if the
+            next token comes later than the timeout of the check, or `None` if the check may contact
+            the dependency.
+        """
+        dependency = check.dependency
+        if dependency is None:
+            return None
+        if self._tokens(dependency) < 1:
+            cached = self._cached(check, dependency)
+            if cached is not None:
+                return cached
+        delay = self._take(dependency)
+        if not delay:
+            return None
+        timeout = check.timeout
+        if timeout is not None and delay >= timeout:
+            self._refund(dependency)
+            return HealthCheckResult(
+                name=check.name,
+                healthy=False,
+                error_details=f"RateLimitError: {dependency} can be contacted again in {delay:.3f} seconds",
+            )
+        try:
+            await asyncio.sleep(delay)
+        except BaseException:
+            self._refund(dependency)
+            raise
+        return None
+
+    def record(self, check: HealthCheck[HealthCheckResult], result: HealthCheckResult) -> None:
+        """Remember the latest result of the check.
+
+        Args:
+            check: The health check that ran.
+            result: The result of the health check.
+        """
+        dependency = check.dependency
+        if dependency is not None:
+            self._results[dependency, check.name] = result
+            self._latest[dependency] = result
+
+
+_rate_limiter: RateLimiter | None = None
+
+
+def get_rate_limiter() -> RateLimiter | None:
+    """Return the process-wide rate limiter, or `None` if calls are not limited."""
+    return _rate_limiter
+
+
+def set_rate_limiter(limiter: RateLimiter | None) -> None:
+    """Install the process-wide rate limiter shared by all health checks.
+
+    Args:
+        limiter: The rate limiter, or `None` to stop limiting calls.
+    """
+    global _rate_limiter  # noqa: PLW0603
+    _rate_limiter = limiter
+
+
+@final
+class _Identity:
+    """A key comparing an object by identity, holding a reference so its id cannot be reused."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: object) -> None:
+        self.value = value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Identity) and other.value is self.value
+
+    def __hash__(self) -> int:
+        return id(self.value)
+
+
+def _config_key(value: object) -> Hashable:
+    """Return a key comparing plain values by value and objects, such as clients, by identity."""
+    if value is None or isinstance(value, (str, bytes, int, float)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return tuple(_config_key(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted(((str(key), _config_key(item)) for key, item in value.items()), key=itemgetter(0)))
+    return _Identity(value)
+
+
+class _SharedRun:
+    """A run of a health check shared by the callers of identical checks."""
+
+    __slots__ = ("future", "started", "waiters")
+
+    def __init__(self, future: "asyncio.Future[HealthCheckResult]") -> None:
+        self.future = future
+        self.started = time.monotonic()
+        self.waiters = 0
+
+
+class CheckRegistry:
+    """A registry sharing the results of identical health checks.
+
+    Checks are identical when they have the same type and the same `to_dict()` apart from their
+    name, where objects such as clients, pools and SSL contexts must be the same instance. An
+    identical check triggered while another one is running, or within `window` seconds after it
+    started, does not run again but gets the same result under its own name. Checks without
+    `to_dict()` always run.
+
+    Args:
+        window: How long, in seconds, the result of a check is shared after it started.
+    """
+
+    __slots__ = ("_runs", "_window")
+
+    _window: float
+    _runs: dict[Hashable, _SharedRun]
+
+    def __init__(self, window: float = 1.0) -> None:
+        """Initialize the check registry."""
+        if window < 0:
+            msg = f"Invalid window: {window}"
+            raise ValueError(msg) from None
+        self._window = window
+        self._runs = {}
+
+    @staticmethod
+    def _key(check: HealthCheck[HealthCheckResult]) -> Hashable | None:
+        to_dict = getattr(check, "to_dict", None)
+        if to_dict is None:
+            return None
+        config = to_dict()
+        config.pop("name", None)
+        return type(check), _config_key(config)
+
+    def _is_fresh(self, run: _SharedRun) -> bool:
+        return not run.future.done() or time.monotonic() - run.started <= self._window
+
+    async def run(
+        self,
+        check: HealthCheck[HealthCheckResult],
+        execute: Callable[[HealthCheck[HealthCheckResult]], Awaitable[HealthCheckResult]],
+    ) -> HealthCheckResult:
+        """Run the health check, or share the result of an identical one.
+
+        Args:
+            check: The health check to run.
+            execute: The function running the health check.
+
+        Returns:
+            The result of the health check.
+        """
+        key = self._key(check)
+        if key is None:
+            return await execute(check)
+        run = self._runs.get(key)
+        if run is None or not self._is_fresh(run):
+            run = self._runs[key] = _SharedRun(asyncio.ensure_future(execute(check)))
+        run.waiters += 1
+        try:
+            result = await asyncio.shield(run.future)
+        except asyncio.CancelledError:
+            # Stop the shared run once nobody is waiting for it anymore.
+            if not run.future.done() and run.waiters == 1:
+                run.future.cancel()
+                if self._runs.get(key) is run:
+                    del self._runs[key]
+            raise
+        finally:
+            run.waiters -= 1
+        return replace(result, name=check.name)
+
+
+_check_registry: CheckRegistry | None = None
+
+
+def get_check_registry() -> CheckRegistry | None:
+    """Return the process-wide check registry, or `None` if identical checks are not shared."""
+    return _check_registry
+
+
+def set_check_registry(registry: CheckRegistry | None) -> None:
+    """Install the process-wide check registry shared by all probes.
+
+    Args:
+        registry: The check registry, or `None` to stop sharing the results of identical checks.
+    """
+    global _check_registry  # noqa: PLW0603
+    _check_registry = registry
+
+
+def _forget_task(task: "asyncio.Future[HealthCheckResult]") -> None:
+    """Drop the reference to a timed out check and retrieve its outcome."""
+    _background_tasks.discard(task)
+    if not task.cancelled():
+        _ = task.exception()
+
+
+async def _contact(check: HealthCheck[HealthCheckResult]) -> HealthCheckResult:
+    dns_cache = get_dns_cache()
+    async with AsyncExitStack() as stack:
+        if dns_cache is not None:
+            try:
+                await stack.enter_async_context(dns_cache.resolve_dependency(check.dependency))
+            except DNSResolutionError as exc:
+                return HealthCheckResult(name=check.name, healthy=False, error_details=f"DNSResolutionError: {exc}")
+        if _connection_budget is not None:
+            await stack.enter_async_context(_connection_budget.acquire(check.dependency))
+        return await check()
+
+
+async def _limit(check: HealthCheck[HealthCheckResult]) -> HealthCheckResult:
+    limiter = _rate_limiter
+    if limiter is None:
+        return await _contact(check)
+    cached = await limiter.acquire(check)
+    if cached is not None:
+        return cached
+    result = await _contact(check)
+    limiter.record(check, result)
+    return result
+
+
+async def _execute(check: HealthCheck[HealthCheckResult]) -> HealthCheckResult:
+    # The budget, the rate limiter and the DNS cache read the dependency outside of the error handling
+    # of the check, so a misconfigured address fails the check here instead of escaping the runner.
+    try:
+        _ = check.dependency
+    except Exception:  # noqa: BLE001
+        return HealthCheckResult(name=check.name, healthy=False, error_details=format_exc())
+    if _check_registry is None:
+        return await _limit(check)
+    return await _check_registry.run(check, _limit)
+
+
+async def run_check(check: HealthCheck[HealthCheckResult]) -> HealthCheckResult:
+    """Run the health check, bounded by its timeout.
+
+    Args:
+        check: The health check to run.
+
+    Returns:
+        The result of the health check, or an unhealthy result if the check did not complete in time.
+    """
+    timeout = check.timeout
+    task = asyncio.ensure_future(_execute(check))
+    if timeout is None:
+        return await task
+    try:
+        done, _ = await asyncio.wait({task}, timeout=timeout)
+    except BaseException:
+        task.cancel()
+        raise
+    if task in done:
+        return task.result()
+    task.cancel()
+    _background_tasks.add(task)
+    task.add_done_callback(_forget_task)
+    return HealthCheckResult(
+        name=check.name,
+        healthy=False,
+        error_details=f"TimeoutError: health check did not complete within {timeout} seconds",
+    )
+
+
+async def run_checks(checks: Iterable[HealthCheck[HealthCheckResult]]) -> list[HealthCheckResult]:
+    """Run the health checks concurrently, each bounded by its own timeout.
+
+    Args:
+        checks: The health checks to run.
+
+    Returns:
+        The results of the health checks, in the same order as the checks.
+    """
+    return list(await asyncio.gather(*(run_check(check) for check in checks)))
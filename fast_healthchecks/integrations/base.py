@@ -3,13 +3,15 @@
 import asyncio
 import json
 import re
-from collections.abc import Awaitable, Callable, Iterable
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from contextlib import asynccontextmanager
 from dataclasses import asdict
 from http import HTTPStatus
 from typing import Any, NamedTuple, TypeAlias
 
 from fast_healthchecks.checks.types import Check
-from fast_healthchecks.models import HealthcheckReport, HealthCheckResult
+from fast_healthchecks.execution import run_checks
+from fast_healthchecks.models import HealthcheckReport
 
 HandlerType: TypeAlias = Callable[["ProbeAsgiResponse"], Awaitable[dict[str, str]]]
 
@@ -118,7 +120,7 @@ class ProbeAsgi:
         self._success_status = success_status
         self._failure_status = failure_status
         self._debug = debug
-        self._exclude_fields = {"allow_partial_failure", "error_details"} if not debug else set()
+        self._exclude_fields = {"allow_partial_failure", "error_details", "details"} if not debug else set()
         self._map_status = {True: success_status, False: failure_status}
         self._map_handler = {True: success_handler, False: failure_handler}
 
@@ -128,13 +130,14 @@ class ProbeAsgi:
         Returns:
             A tuple containing the response body, headers, and status code.
         """
-        tasks = [check() for check in self._probe.checks]
-        results: list[HealthCheckResult] = await asyncio.gather(*tasks)  # ty: ignore[invalid-assignment]
+        results = await run_checks(self._probe.checks)
         report = HealthcheckReport(results=results)
         response = ProbeAsgiResponse(
             data=asdict(
                 report,
-                dict_factory=lambda x: {k: v for (k, v) in x if k not in self._exclude_fields},
+                dict_factory=lambda x: {
+                    k: v for (k, v) in x if k not in self._exclude_fields and not (k == "details" and v is None)
+                },
             ),
             healthy=report.healthy,
         )
@@ -198,3 +201,37 @@ def make_probe_asgi(  # noqa: PLR0913
         failure_status=failure_status,
         debug=debug,
     )
+
+
+def _probe_checks(probes: Iterable[Probe]) -> list[Check]:
+    """Return the checks of the probes, each check once, in order."""
+    checks: dict[int, Check] = {}
+    for probe in probes:
+        for check in probe.checks:
+            checks.setdefault(id(check), check)
+    return list(checks.values())
+
+
+@asynccontextmanager
+async def healthcheck_lifespan(*probes: Probe, warm_up: bool = True) -> AsyncIterator[None]:
+    """Manage the long-lived resources of the checks of the probes for the lifetime of the application.
+
+    On enter the checks are started and, with `warm_up`, run once, so DNS lookups, TLS handshakes
+    and connections of the persistent modes are done before the first probe arrives. On exit the
+    checks are closed.
+
+    Args:
+        probes: The probes whose checks to manage.
+        warm_up: Whether to run the checks once after starting them.
+
+    Yields:
+        Nothing, the checks are ready to serve probes.
+    """
+    checks = _probe_checks(probes)
+    try:
+        await asyncio.gather(*(check.start() for check in checks))
+        if warm_up:
+            await run_checks(checks)
+        yield
+    finally:
+        await asyncio.gather(*(check.aclose() for check in checks), return_exceptions=True)
@@ -5,7 +5,13 @@ from typing import Any
 from fastapi import APIRouter, status
 from fastapi.responses import Response
 
-from fast_healthchecks.integrations.base import HandlerType, Probe, default_handler, make_probe_asgi
+from fast_healthchecks.integrations.base import (
+    HandlerType,
+    Probe,
+    default_handler,
+    healthcheck_lifespan,
+    make_probe_asgi,
+)
 
 
 class HealthcheckRouter(APIRouter):
@@ -14,6 +20,10 @@ class HealthcheckRouter(APIRouter):
     Args:
         probes: An iterable of probes to run.
         debug: Whether to include the probes in the schema. Defaults to False.
+        warm_up: Whether to run the checks once on startup. Defaults to True.
+
+    The checks are started on application startup and closed on shutdown through the lifespan
+    of the router, which FastAPI merges into the lifespan of the application on `include_router`.
     """
 
     def __init__(  # noqa: PLR0913
@@ -25,11 +35,13 @@ class HealthcheckRouter(APIRouter):
         failure_status: int = status.HTTP_503_SERVICE_UNAVAILABLE,
         debug: bool = False,
         prefix: str = "/health",
+        warm_up: bool = True,
         **kwargs: dict[str, Any],
     ) -> None:
         """Initialize the router."""
         kwargs["prefix"] = prefix  # ty: ignore[invalid-assignment]
         kwargs["tags"] = ["Healthchecks"]  # ty: ignore[invalid-assignment]
+        kwargs.setdefault("lifespan", lambda _: healthcheck_lifespan(*probes, warm_up=warm_up))  # ty: ignore[no-matching-overload]
         super().__init__(**kwargs)
         for probe in probes:
             self._add_probe_route(
@@ -1,13 +1,20 @@
 """FastStream integration for health checks."""
 
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
+from contextlib import AbstractAsyncContextManager
 from http import HTTPStatus
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from faststream.asgi.handlers import get
 from faststream.asgi.response import AsgiResponse
 
-from fast_healthchecks.integrations.base import HandlerType, Probe, default_handler, make_probe_asgi
+from fast_healthchecks.integrations.base import (
+    HandlerType,
+    Probe,
+    default_handler,
+    healthcheck_lifespan,
+    make_probe_asgi,
+)
 
 if TYPE_CHECKING:
     from faststream.asgi.types import ASGIApp, Scope
@@ -62,3 +69,18 @@ def health(  # noqa: PLR0913
         )
         for probe in probes
     ]
+
+
+def health_lifespan(
+    *probes: Probe,
+    warm_up: bool = True,
+) -> Callable[..., AbstractAsyncContextManager[None]]:
+    """Make a lifespan that starts the checks of the probes on startup and closes them on shutdown.
+
+    Pass it to `AsgiFastStream(lifespan=...)`.
+    """
+
+    def lifespan(**_: Any) -> AbstractAsyncContextManager[None]:  # noqa: ANN401
+        return healthcheck_lifespan(*probes, warm_up=warm_up)
+
+    return lifespan
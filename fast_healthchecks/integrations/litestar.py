@@ -1,12 +1,19 @@
 """FastAPI integration for health checks."""
 
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
+from contextlib import AbstractAsyncContextManager
 from http import HTTPStatus
 
-from litestar import Response, get
+from litestar import Litestar, Response, get
 from litestar.handlers.http_handlers import HTTPRouteHandler
 
-from fast_healthchecks.integrations.base import HandlerType, Probe, default_handler, make_probe_asgi
+from fast_healthchecks.integrations.base import (
+    HandlerType,
+    Probe,
+    default_handler,
+    healthcheck_lifespan,
+    make_probe_asgi,
+)
 
 
 def _add_probe_route(  # noqa: PLR0913
@@ -63,3 +70,18 @@ def health(  # noqa: PLR0913
         )
         for probe in probes
     ]
+
+
+def health_lifespan(
+    *probes: Probe,
+    warm_up: bool = True,
+) -> Callable[[Litestar], AbstractAsyncContextManager[None]]:
+    """Make a lifespan that starts the checks of the probes on startup and closes them on shutdown.
+
+    Pass it to `Litestar(lifespan=[...])`.
+    """
+
+    def lifespan(_: Litestar) -> AbstractAsyncContextManager[None]:
+        return healthcheck_lifespan(*probes, warm_up=warm_up)
+
+    return lifespan
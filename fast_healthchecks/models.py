@@ -1,6 +1,7 @@
 """Models for healthchecks."""
 
 from dataclasses import dataclass
+from typing import Any
 
 __all__ = (
     "HealthCheckResult",
@@ -16,11 +17,13 @@ class HealthCheckResult:
         name: Name of the healthcheck.
         healthy: Whether the healthcheck passed.
         error_details: Details of the error if the healthcheck failed.
+        details: Additional information collected by the healthcheck.
     """
 
     name: str
     healthy: bool
     error_details: str | None = None
+    details: dict[str, Any] | None = None
 
     def __str__(self) -> str:
         """Return a string representation of the result."""
@@ -0,0 +1,337 @@
+"""A DNS cache shared by all health checks.
+
+Drivers resolve the hostname of their dependency on every connection, usually with `getaddrinfo` in
+the default executor of the event loop, so each probe pays an executor hop and the latency of the
+system resolver. With a DNS cache installed, the runner resolves the hosts of a check through the
+cache before contacting the dependency, and the lookups the drivers make through the event loop
+while the check runs are answered from the cache. Lookups made outside of health checks are not
+affected.
+
+Entries live for `ttl` seconds, or for the TTL of the DNS records if it is shorter and dnspython is
+installed; the TTL is looked up in the background, so it never delays a probe. An entry used after
+`prefetch` of its lifetime is refreshed in the background, so probes keep being answered from the
+cache while the records are re-resolved. A host that cannot be resolved fails the check right away
+with a `DNSResolutionError` instead of a driver-specific connection error, and the failure is cached
+for `negative_ttl` seconds. Unix sockets and `mongodb+srv://` seed names, which are looked up as SRV
+records by the driver, are not resolved.
+
+Event loops implemented in C, such as uvloop, cannot be hooked: with them, the runner still resolves
+the hosts through the cache and reports DNS failures, but the drivers do their own lookups.
+
+Example:
+    set_dns_cache(DNSCache(ttl=30.0))
+"""
+
+import asyncio
+import contextlib
+import ipaddress
+import socket
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextvars import ContextVar
+from functools import partial
+from typing import Any, TypeAlias
+
+from fast_healthchecks.checks._base import split_host_port
+
+try:
+    import dns.asyncresolver
+    import dns.exception
+except ImportError:  # pragma: no cover
+    DNSPYTHON_INSTALLED = False
+else:
+    DNSPYTHON_INSTALLED = True
+
+__all__ = (
+    "DNSCache",
+    "DNSResolutionError",
+    "get_dns_cache",
+    "set_dns_cache",
+)
+
+AddrInfo: TypeAlias = tuple[socket.AddressFamily, socket.SocketKind, int, str, tuple[Any, ...]]
+
+# The lookups of the drivers carry no flags, or only `AI_ADDRCONFIG`, which does not change the
+# answer on hosts that have the address families configured they connect with.
+_CACHEABLE_FLAGS = frozenset({0, socket.AI_ADDRCONFIG})
+_RECORD_TTL_LIFETIME = 1.0
+# Dependencies without address records to resolve: Unix sockets and SRV seed names.
+_UNRESOLVED_SCHEMES = ("unix://", "mongodb+srv://")
+
+
+class DNSResolutionError(socket.gaierror):
+    """The hostname of a dependency could not be resolved."""
+
+
+class _Entry:
+    """The outcome of resolving a host."""
+
+    __slots__ = ("created", "error", "expires", "refresh", "results")
+
+    def __init__(
+        self,
+        results: list[AddrInfo],
+        error: socket.gaierror | None,
+        ttl: float,
+        prefetch: float,
+    ) -> None:
+        self.created = time.monotonic()
+        self.results = results
+        self.error = error
+        self.expires = self.created + ttl
+        self.refresh = self.created + ttl * prefetch
+
+    def limit(self, ttl: float, prefetch: float) -> None:
+        """Shorten the lifetime of the entry to at most `ttl` seconds from its creation."""
+        self.expires = min(self.expires, self.created + ttl)
+        self.refresh = min(self.refresh, self.created + ttl * prefetch)
+
+
+async def _record_ttl(host: str) -> float | None:
+    """Return the TTL of the address records of the host, or `None` if it is unknown."""
+    if not DNSPYTHON_INSTALLED:
+        return None  # pragma: no cover
+    for rdtype in ("A", "AAAA"):
+        try:
+            answer = await dns.asyncresolver.resolve(
+                host,
+                rdtype,
+                raise_on_no_answer=False,
+                lifetime=_RECORD_TTL_LIFETIME,
+                search=True,
+            )
+        except dns.exception.DNSException:
+            return None
+        if answer.rrset is not None:
+            return float(answer.rrset.ttl)
+    return None
+
+
+def _is_hostname(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        return bool(host)
+    return False
+
+
+def _dependency_hosts(dependency: str) -> list[str]:
+    """Return the hostnames of a `host:port` or URL list, skipping IP addresses, Unix sockets and SRV seeds."""
+    if dependency.startswith(_UNRESOLVED_SCHEMES):
+        return []
+    hosts: list[str] = []
+    for address in dependency.split(","):
+        netloc = address.strip().rpartition("//")[2].partition("/")[0].rpartition("@")[2]
+        host, _ = split_host_port(netloc, 0)
+        if _is_hostname(host) and host not in hosts:
+            hosts.append(host)
+    return hosts
+
+
+class DNSCache:
+    """A cache of DNS lookups with TTLs, negative caching and background prefetch.
+
+    Concurrent lookups of the same host share a single resolution.
+
+    Args:
+        ttl: How long, in seconds, a resolved host is cached at most.
+        negative_ttl: How long, in seconds, a host that could not be resolved is cached.
+        prefetch: The fraction of the lifetime of an entry after which using it refreshes it in
+            the background.
+    """
+
+    __slots__ = ("_entries", "_lookups", "_negative_ttl", "_prefetch", "_ttl", "_ttl_lookups")
+
+    _ttl: float
+    _negative_ttl: float
+    _prefetch: float
+    _entries: dict[str, _Entry]
+    _lookups: dict[str, "asyncio.Future[_Entry]"]
+    _ttl_lookups: "set[asyncio.Task[None]]"
+
+    def __init__(self, ttl: float = 60.0, *, negative_ttl: float = 5.0, prefetch: float = 0.8) -> None:
+        """Initialize the DNS cache."""
+        if ttl <= 0:
+            msg = f"Invalid TTL: {ttl}"
+            raise ValueError(msg) from None
+        if negative_ttl < 0:
+            msg = f"Invalid negative TTL: {negative_ttl}"
+            raise ValueError(msg) from None
+        if not 0 < prefetch <= 1:
+            msg = f"Invalid prefetch: {prefetch}"
+            raise ValueError(msg) from None
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._prefetch = prefetch
+        self._entries = {}
+        self._lookups = {}
+        self._ttl_lookups = set()
+
+    async def _resolve(self, host: str) -> _Entry:
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(None, partial(socket.getaddrinfo, host, None))
+        except socket.gaierror as exc:
+            entry = _Entry([], exc, self._negative_ttl, 1.0)
+        else:
+            entry = _Entry(results, None, self._ttl, self._prefetch)
+            # The record TTL takes up to a second per record type to look up, so it only shortens the
+            # entry once known instead of delaying the check.
+            ttl_lookup = asyncio.ensure_future(self._limit_to_record_ttl(host, entry))
+            self._ttl_lookups.add(ttl_lookup)
+            ttl_lookup.add_done_callback(self._ttl_lookups.discard)
+        self._entries[host] = entry
+        return entry
+
+    async def _limit_to_record_ttl(self, host: str, entry: _Entry) -> None:
+        record_ttl = await _record_ttl(host)
+        if record_ttl is not None:
+            entry.limit(record_ttl, self._prefetch)
+
+    def _forget_lookup(self, host: str, lookup: "asyncio.Future[_Entry]") -> None:
+        if self._lookups.get(host) is lookup:
+            del self._lookups[host]
+        if not lookup.cancelled():
+            _ = lookup.exception()
+
+    def _start_lookup(self, host: str) -> "asyncio.Future[_Entry]":
+        lookup = self._lookups.get(host)
+        if lookup is None:
+            lookup = self._lookups[host] = asyncio.ensure_future(self._resolve(host))
+            lookup.add_done_callback(partial(self._forget_lookup, host))
+        return lookup
+
+    async def _entry(self, host: str) -> _Entry:
+        entry = self._entries.get(host)
+        now = time.monotonic()
+        if entry is None or now >= entry.expires:
+            # The lookup is shared, so a cancelled check must not cancel it.
+            return await asyncio.shield(self._start_lookup(host))
+        if now >= entry.refresh:
+            self._start_lookup(host)
+        return entry
+
+    async def getaddrinfo(  # noqa: PLR0913
+        self,
+        host: str,
+        port: int,
+        *,
+        family: int = 0,
+        type: int = 0,  # noqa: A002
+        proto: int = 0,
+        flags: int = 0,
+    ) -> list[AddrInfo]:
+        """Resolve the host like `loop.getaddrinfo`, answering from the cache.
+
+        Args:
+            host: The hostname to resolve.
+            port: The port to put in the socket addresses.
+            family: The address family to return, or `0` for any.
+            type: The socket type to return, or `0` for any.
+            proto: The protocol to return, or `0` for any.
+            flags: The `getaddrinfo` flags, ignored.
+
+        Returns:
+            The `getaddrinfo` results.
+
+        Raises:
+            DNSResolutionError: If the host cannot be resolved.
+        """
+        del flags
+        entry = await self._entry(host)
+        if entry.error is not None:
+            raise DNSResolutionError(entry.error.errno, f"{entry.error.strerror}: {host}")
+        results = [
+            (result_family, result_type, result_proto, canonname, (sockaddr[0], port, *sockaddr[2:]))
+            for result_family, result_type, result_proto, canonname, sockaddr in entry.results
+            if family in {0, result_family} and type in {0, result_type} and proto in {0, result_proto}
+        ]
+        if not results:
+            raise DNSResolutionError(socket.EAI_NONAME, f"No matching address: {host}")
+        return results
+
+    @contextlib.asynccontextmanager
+    async def resolve_dependency(self, dependency: str | None) -> AsyncIterator[None]:
+        """Resolve the hosts of a check and answer its lookups from the cache for the duration of the context.
+
+        Args:
+            dependency: The `dependency` of the check about to run.
+
+        Raises:
+            DNSResolutionError: If none of the hosts of the dependency can be resolved.
+        """
+        hosts = _dependency_hosts(dependency) if dependency is not None else []
+        if hosts:
+            entries = await asyncio.gather(*(self._entry(host) for host in hosts))
+            errors = [
+                (host, entry.error) for host, entry in zip(hosts, entries, strict=True) if entry.error is not None
+            ]
+            if len(errors) == len(hosts):
+                host, error = errors[0]
+                raise DNSResolutionError(error.errno, f"{error.strerror}: {host}")
+        _install(asyncio.get_running_loop())
+        token = _active_cache.set(self)
+        try:
+            yield
+        finally:
+            _active_cache.reset(token)
+
+
+_active_cache = ContextVar[DNSCache | None]("_active_cache", default=None)
+
+
+class _CachingGetaddrinfo:
+    """The `getaddrinfo` of an event loop, answered from the DNS cache while a check runs."""
+
+    __slots__ = ("_getaddrinfo",)
+
+    def __init__(self, getaddrinfo: Callable[..., Awaitable[list[AddrInfo]]]) -> None:
+        self._getaddrinfo = getaddrinfo
+
+    async def __call__(  # noqa: PLR0913
+        self,
+        host: bytes | str | None,
+        port: bytes | str | int | None,
+        *,
+        family: int = 0,
+        type: int = 0,  # noqa: A002
+        proto: int = 0,
+        flags: int = 0,
+    ) -> list[AddrInfo]:
+        cache = _active_cache.get()
+        if (
+            cache is None
+            or not isinstance(host, str)
+            or not _is_hostname(host)
+            or flags not in _CACHEABLE_FLAGS
+            or not (port is None or isinstance(port, int) or (isinstance(port, str) and port.isdigit()))
+        ):
+            return await self._getaddrinfo(host, port, family=family, type=type, proto=proto, flags=flags)
+        return await cache.getaddrinfo(host, int(port or 0), family=family, type=type, proto=proto, flags=flags)
+
+
+def _install(loop: asyncio.AbstractEventLoop) -> None:
+    """Route the lookups of the event loop through the DNS cache of the running check."""
+    if isinstance(loop.getaddrinfo, _CachingGetaddrinfo):
+        return
+    # Event loops implemented in C do not allow replacing their methods.
+    with contextlib.suppress(AttributeError):
+        loop.getaddrinfo = _CachingGetaddrinfo(loop.getaddrinfo)  # ty: ignore[invalid-assignment]
+
+
+_dns_cache: DNSCache | None = None
+
+
+def get_dns_cache() -> DNSCache | None:
+    """Return the process-wide DNS cache, or `None` if lookups are not cached."""
+    return _dns_cache
+
+
+def set_dns_cache(cache: DNSCache | None) -> None:
+    """Install the process-wide DNS cache shared by all health checks.
+
+    Args:
+        cache: The DNS cache, or `None` to stop caching lookups.
+    """
+    global _dns_cache  # noqa: PLW0603
+    _dns_cache = cache
@@ -0,0 +1,144 @@
+"""A package-wide registry of SSL contexts that resume TLS sessions.
+
+Building an SSL context loads the trust store, and a full TLS handshake costs a key exchange and the
+verification of the certificate chain. The checks take their SSL contexts from this registry, so a
+context is built once per set of verification parameters and shared by all the checks, and the
+contexts resume the TLS session of the previous connection to the same server, so repeated probes
+do an abbreviated handshake instead of a full one.
+
+The contexts are shared, so they must not be modified.
+
+Example:
+    context = get_ssl_context(cafile="/path/to/ca.pem")
+"""
+
+import ssl
+from functools import lru_cache
+
+__all__ = (
+    "SessionResumingSSLContext",
+    "get_ssl_context",
+)
+
+
+class _SessionSavingSSLObject(ssl.SSLObject):
+    """An SSL object handing its session to its context once the handshake is done and when it is closed.
+
+    TLS 1.3 servers send their session tickets after the handshake, so the session is saved again on
+    close to pick them up.
+    """
+
+    def do_handshake(self) -> None:
+        super().do_handshake()
+        self._save_session()
+
+    def unwrap(self) -> None:
+        self._save_session()
+        super().unwrap()
+
+    def _save_session(self) -> None:
+        context = self.context
+        if isinstance(context, SessionResumingSSLContext) and not self.server_side:
+            context._save_session(self.server_hostname, self.session)  # noqa: SLF001
+
+
+class SessionResumingSSLContext(ssl.SSLContext):
+    """An SSL context that resumes the TLS session of the previous connection to the same server.
+
+    asyncio, and so every asyncio driver, creates the TLS state of a client connection with
+    `wrap_bio`, which is where the session of the previous connection is passed on. Only the
+    sessions are kept, so closed connections are not kept alive. `wrap_bio` is not told the port of
+    the server, so the sessions are tracked per server hostname; a session that another service on
+    the same host does not know falls back to a full handshake.
+    """
+
+    sslobject_class = _SessionSavingSSLObject
+    _sessions: dict[str | None, ssl.SSLSession]
+
+    def __new__(cls, protocol: int = ssl.PROTOCOL_TLS_CLIENT) -> "SessionResumingSSLContext":
+        """Create a client context, the sessions are tracked per server hostname.
+
+        Args:
+            protocol: The protocol of the context.
+
+        Returns:
+            The SSL context.
+        """
+        context = super().__new__(cls, protocol)
+        context._sessions = {}
+        return context
+
+    def wrap_bio(
+        self,
+        incoming: ssl.MemoryBIO,
+        outgoing: ssl.MemoryBIO,
+        server_side: bool = False,  # noqa: FBT001, FBT002
+        server_hostname: str | bytes | None = None,
+        session: ssl.SSLSession | None = None,
+    ) -> ssl.SSLObject:
+        """Wrap the BIO pair, resuming the session of the previous connection to the server.
+
+        Returns:
+            The SSL object of the connection.
+        """
+        if session is None and not server_side:
+            key = server_hostname.decode() if isinstance(server_hostname, bytes) else server_hostname
+            session = self._sessions.get(key)
+        return super().wrap_bio(incoming, outgoing, server_side, server_hostname, session)
+
+    def _save_session(self, server_hostname: str | None, session: ssl.SSLSession | None) -> None:
+        if session is not None:
+            self._sessions[server_hostname] = session
+
+
+def get_ssl_context(  # noqa: PLR0913
+    *,
+    verify: bool = True,
+    check_hostname: bool = True,
+    cafile: str | None = None,
+    capath: str | None = None,
+    certfile: str | None = None,
+    keyfile: str | None = None,
+) -> ssl.SSLContext:
+    """Return the shared client SSL context for the verification parameters.
+
+    Args:
+        verify: Whether to verify the certificate of the server.
+        check_hostname: Whether to match the certificate of the server against its hostname.
+        cafile: The path to the CA certificates, the default CA certificates are used if neither
+            `cafile` nor `capath` is given.
+        capath: The path to a directory of CA certificates.
+        certfile: The path to the client certificate.
+        keyfile: The path to the key of the client certificate.
+
+    Returns:
+        The SSL context.
+    """
+    if not verify:
+        # Nothing is verified, so the verification parameters do not tell contexts apart.
+        check_hostname, cafile, capath = False, None, None
+    return _create_ssl_context(verify, check_hostname, cafile, capath, certfile, keyfile)
+
+
+@lru_cache
+def _create_ssl_context(  # noqa: PLR0913, PLR0917
+    verify: bool,  # noqa: FBT001
+    check_hostname: bool,  # noqa: FBT001
+    cafile: str | None,
+    capath: str | None,
+    certfile: str | None,
+    keyfile: str | None,
+) -> ssl.SSLContext:
+    context = SessionResumingSSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    if verify:
+        context.check_hostname = check_hostname
+        if cafile is not None or capath is not None:
+            context.load_verify_locations(cafile=cafile, capath=capath)
+        else:
+            context.load_default_certs(ssl.Purpose.SERVER_AUTH)
+    else:
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    if certfile is not None:
+        context.load_cert_chain(certfile=certfile, keyfile=keyfile)
+    return context
@@ -0,0 +1,150 @@
+import datetime
+import gc
+import socket
+import socketserver
+import struct
+import threading
+from collections.abc import Generator
+from typing import Any
+
+import bson
+import pytest
+
+
+class HangingServer:
+    """A local stand-in server that accepts TCP connections and never answers.
+
+    Every phase that needs a reply from the peer (TLS handshake, protocol greeting, authentication,
+    query, graceful close) blocks forever, so any check pointed at it can only finish through a timeout.
+    """
+
+    def __init__(self) -> None:
+        self._sock = socket.create_server(("127.0.0.1", 0))
+        self._sock.settimeout(0.05)
+        self._connections: list[socket.socket] = []
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self.host, self.port = self._sock.getsockname()[:2]
+
+    def _serve(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                conn, _ = self._sock.accept()
+            except TimeoutError:
+                continue
+            except OSError:
+                return
+            self._connections.append(conn)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._thread.join()
+        for conn in self._connections:
+            conn.close()
+        self._sock.close()
+
+
+@pytest.fixture(name="hanging_server")
+def fixture_hanging_server() -> Generator[HangingServer, None, None]:
+    server = HangingServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+OP_REPLY = 1
+OP_QUERY = 2004
+OP_MSG = 2013
+HEADER = struct.Struct("<iiii")
+
+
+class _MongoHandler(socketserver.BaseRequestHandler):
+    """Answer every command over OP_QUERY or OP_MSG like a healthy standalone `mongod`."""
+
+    request: socket.socket
+
+    def handle(self) -> None:
+        while header := self._read(HEADER.size):
+            length, request_id, _, op_code = HEADER.unpack(header)
+            body = self._read(length - HEADER.size)
+            if op_code == OP_QUERY:
+                # flags, then the collection name, number to skip and to return before the query document.
+                name_end = body.index(b"\x00", 4)
+                reply = struct.pack("<iqii", 0, 0, 0, 1) + bson.encode(self._reply(bson.decode(body[name_end + 9 :])))
+                self._send(OP_REPLY, request_id, reply)
+            elif op_code == OP_MSG:
+                # flag bits, then a kind 0 section holding the command document.
+                command = bson.decode(body[5 : 5 + int.from_bytes(body[5:9], "little")])
+                self._send(OP_MSG, request_id, struct.pack("<IB", 0, 0) + bson.encode(self._reply(command)))
+            else:
+                return
+
+    def _read(self, size: int) -> bytes:
+        data = b""
+        while len(data) < size:
+            chunk = self.request.recv(size - len(data))
+            if not chunk:
+                return b""
+            data += chunk
+        return data
+
+    def _send(self, op_code: int, response_to: int, body: bytes) -> None:
+        self.request.sendall(HEADER.pack(HEADER.size + len(body), 0, response_to, op_code) + body)
+
+    @staticmethod
+    def _reply(command: dict[str, Any]) -> dict[str, Any]:
+        if next(iter(command)).lower() in {"hello", "ismaster"}:
+            # No `topologyVersion`, so the drivers poll instead of streaming heartbeats.
+            return {
+                "ok": 1.0,
+                "helloOk": True,
+                "isWritablePrimary": True,
+                "ismaster": True,
+                "maxBsonObjectSize": 16 * 1024 * 1024,
+                "maxMessageSizeBytes": 48_000_000,
+                "maxWriteBatchSize": 100_000,
+                "localTime": datetime.datetime.now(tz=datetime.timezone.utc),
+                "logicalSessionTimeoutMinutes": 30,
+                "minWireVersion": 0,
+                "maxWireVersion": 21,
+            }
+        return {"ok": 1.0}
+
+
+class FakeMongoServer(socketserver.ThreadingTCPServer):
+    """A local stand-in `mongod` answering `hello`, `ping` and any other command with success."""
+
+    daemon_threads = True
+    block_on_close = False
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _MongoHandler)
+        self.host, self.port = self.server_address[:2]
+        self._thread = threading.Thread(target=self.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+        self._thread.join()
+
+
+@pytest.fixture(name="mongo_server")
+def fixture_mongo_server() -> Generator[FakeMongoServer, None, None]:
+    server = FakeMongoServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture(autouse=True)
+def _collect_garbage() -> Generator[None, None, None]:
+    # Checks cancelled by the runner are abandoned mid-handshake; collect what they leave behind while the
+    # test's warning filters still apply instead of at interpreter shutdown.
+    yield
+    gc.collect()
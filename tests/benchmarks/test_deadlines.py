@@ -0,0 +1,59 @@
+import time
+from collections.abc import Callable
+
+import pytest
+
+from fast_healthchecks.checks._base import HealthCheck  # noqa: PLC2701
+from fast_healthchecks.checks.kafka import KafkaHealthCheck
+from fast_healthchecks.checks.mongo import MongoHealthCheck
+from fast_healthchecks.checks.opensearch import OpenSearchHealthCheck
+from fast_healthchecks.checks.postgresql.asyncpg import PostgreSQLAsyncPGHealthCheck
+from fast_healthchecks.checks.postgresql.psycopg import PostgreSQLPsycopgHealthCheck
+from fast_healthchecks.checks.rabbitmq import RabbitMQHealthCheck
+from fast_healthchecks.checks.redis import RedisHealthCheck
+from fast_healthchecks.checks.url import UrlHealthCheck
+from fast_healthchecks.execution import run_check
+from fast_healthchecks.models import HealthCheckResult
+from tests.benchmarks.conftest import HangingServer
+
+pytestmark = [
+    pytest.mark.benchmark,
+    # Drivers cancelled mid-handshake may leave their sockets to the garbage collector.
+    pytest.mark.filterwarnings("ignore::pytest.PytestUnraisableExceptionWarning"),
+]
+
+TIMEOUT = 0.5
+# Scheduling slack on top of the timeout, generous enough for slow CI runners.
+SLACK = 0.25
+
+CheckFactory = Callable[[str, int], HealthCheck[HealthCheckResult]]
+
+FACTORIES: dict[str, CheckFactory] = {
+    "kafka": lambda host, port: KafkaHealthCheck(bootstrap_servers=f"{host}:{port}", timeout=TIMEOUT),
+    "mongo": lambda host, port: MongoHealthCheck(hosts=host, port=port, timeout=TIMEOUT),
+    "opensearch": lambda host, port: OpenSearchHealthCheck(hosts=[f"{host}:{port}"], timeout=TIMEOUT),
+    "postgresql-asyncpg": lambda host, port: PostgreSQLAsyncPGHealthCheck(host=host, port=port, timeout=TIMEOUT),
+    "postgresql-psycopg": lambda host, port: PostgreSQLPsycopgHealthCheck(host=host, port=port, timeout=TIMEOUT),
+    "rabbitmq": lambda host, port: RabbitMQHealthCheck(
+        host=host,
+        port=port,
+        user="guest",
+        password="guest",
+        timeout=TIMEOUT,
+    ),
+    "redis": lambda host, port: RedisHealthCheck(host=host, port=port, timeout=TIMEOUT),
+    "redis-tls": lambda host, port: RedisHealthCheck(host=host, port=port, ssl=True, timeout=TIMEOUT),
+    "url": lambda host, port: UrlHealthCheck(url=f"http://{host}:{port}/health", timeout=TIMEOUT),
+    "url-tls": lambda host, port: UrlHealthCheck(url=f"https://{host}:{port}/health", timeout=TIMEOUT),
+}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("factory", FACTORIES.values(), ids=FACTORIES.keys())
+async def test_check_is_bounded_by_timeout(hanging_server: HangingServer, factory: CheckFactory) -> None:
+    check = factory(hanging_server.host, hanging_server.port)
+    start = time.perf_counter()
+    result = await run_check(check)
+    elapsed = time.perf_counter() - start
+    assert result.healthy is False
+    assert elapsed < TIMEOUT + SLACK, f"{check.name} took {elapsed:.3f}s with timeout {TIMEOUT}s"
@@ -0,0 +1,35 @@
+import time
+import tracemalloc
+from collections.abc import Callable
+
+import pytest
+
+from fast_healthchecks.checks.mongo import MongoDriver, MongoHealthCheck
+from tests.benchmarks.conftest import FakeMongoServer
+
+pytestmark = pytest.mark.benchmark
+
+ROUNDS = 20
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("driver", ["pymongo", "motor"])
+async def test_mongo_driver_latency_and_memory(
+    mongo_server: FakeMongoServer,
+    driver: MongoDriver,
+    record_property: Callable[[str, object], None],
+) -> None:
+    check = MongoHealthCheck(hosts=mongo_server.host, port=mongo_server.port, driver=driver, timeout=2.0)
+    # Warm up imports, thread pools and caches outside of the measurement.
+    assert (await check()).healthy is True
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    results = [await check() for _ in range(ROUNDS)]
+    latency = (time.perf_counter() - start) / ROUNDS
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert all(result.healthy for result in results), [result.error_details for result in results]
+    record_property(f"{driver}_latency_ms", round(latency * 1000, 3))
+    record_property(f"{driver}_peak_memory_kib", round(peak / 1024, 1))
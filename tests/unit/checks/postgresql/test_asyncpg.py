@@ -1,12 +1,12 @@
 import ssl
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from urllib.parse import ParseResult, unquote, urlparse
 
 import pytest
-from asyncpg import Connection
+from asyncpg import Connection, Pool
 
-from fast_healthchecks.checks.postgresql.asyncpg import PostgreSQLAsyncPGHealthCheck
+from fast_healthchecks.checks.postgresql.asyncpg import PostgreSQLAsyncPGHealthCheck, PostgreSQLAsyncPGPoolHealthCheck
 from fast_healthchecks.checks.postgresql.base import create_ssl_context
 from tests.utils import (
     TEST_SSLCERT,
@@ -46,6 +46,7 @@ pytestmark = pytest.mark.unit
                 "database": None,
                 "ssl": None,
                 "direct_tls": False,
+                "preflight": False,
                 "timeout": 5.0,
                 "name": "PostgreSQL",
             },
@@ -65,6 +66,7 @@ pytestmark = pytest.mark.unit
                 "database": None,
                 "ssl": None,
                 "direct_tls": False,
+                "preflight": False,
                 "timeout": 5.0,
                 "name": "PostgreSQL",
             },
@@ -85,6 +87,7 @@ pytestmark = pytest.mark.unit
                 "database": None,
                 "ssl": None,
                 "direct_tls": False,
+                "preflight": False,
                 "timeout": 5.0,
                 "name": "PostgreSQL",
             },
@@ -106,6 +109,7 @@ pytestmark = pytest.mark.unit
                 "database": "db",
                 "ssl": None,
                 "direct_tls": False,
+                "preflight": False,
                 "timeout": 5.0,
                 "name": "PostgreSQL",
             },
@@ -128,6 +132,7 @@ pytestmark = pytest.mark.unit
                 "database": "db",
                 "ssl": ("verify-full", TEST_SSLCERT, TEST_SSLKEY, TEST_SSLROOTCERT),
                 "direct_tls": False,
+                "preflight": False,
                 "timeout": 5.0,
                 "name": "PostgreSQL",
             },
@@ -151,6 +156,7 @@ pytestmark = pytest.mark.unit
                 "database": "db",
                 "ssl": ("verify-full", TEST_SSLCERT, TEST_SSLKEY, TEST_SSLROOTCERT),
                 "direct_tls": True,
+                "preflight": False,
                 "timeout": 5.0,
                 "name": "PostgreSQL",
             },
@@ -175,6 +181,7 @@ pytestmark = pytest.mark.unit
                 "database": "db",
                 "ssl": ("verify-full", TEST_SSLCERT, TEST_SSLKEY, TEST_SSLROOTCERT),
                 "direct_tls": True,
+                "preflight": False,
                 "timeout": 10.0,
                 "name": "PostgreSQL",
             },
@@ -189,6 +196,7 @@ pytestmark = pytest.mark.unit
                 "database": "db",
                 "ssl": ("verify-full", TEST_SSLCERT, TEST_SSLKEY, TEST_SSLROOTCERT),
                 "direct_tls": True,
+                "preflight": False,
                 "timeout": 10.0,
                 "name": "test",
             },
@@ -200,6 +208,7 @@ pytestmark = pytest.mark.unit
                 "database": "db",
                 "ssl": ("verify-full", TEST_SSLCERT, TEST_SSLKEY, TEST_SSLROOTCERT),
                 "direct_tls": True,
+                "preflight": False,
                 "timeout": 10.0,
                 "name": "test",
             },
@@ -242,6 +251,7 @@ def test__init(params: dict[str, Any], expected: dict[str, Any] | str, exception
             {
                 "database": "db",
                 "direct_tls": False,
+                "preflight": False,
                 "host": "localhost",
                 "password": "pass",
                 "port": 5432,
@@ -258,6 +268,7 @@ def test__init(params: dict[str, Any], expected: dict[str, Any] | str, exception
             {
                 "database": "db",
                 "direct_tls": False,
+                "preflight": False,
                 "host": "localhost",
                 "password": "pass",
                 "port": 5432,
@@ -276,6 +287,7 @@ def test__init(params: dict[str, Any], expected: dict[str, Any] | str, exception
             {
                 "database": "db",
                 "direct_tls": False,
+                "preflight": False,
                 "host": "localhost",
                 "password": "pass",
                 "port": 5432,
@@ -294,6 +306,7 @@ def test__init(params: dict[str, Any], expected: dict[str, Any] | str, exception
             {
                 "database": "db",
                 "direct_tls": False,
+                "preflight": False,
                 "host": "localhost",
                 "password": "pass",
                 "port": 5432,
@@ -310,6 +323,7 @@ def test__init(params: dict[str, Any], expected: dict[str, Any] | str, exception
             {
                 "database": "db",
                 "direct_tls": False,
+                "preflight": False,
                 "host": "localhost",
                 "password": "pass",
                 "port": 5432,
@@ -326,6 +340,7 @@ def test__init(params: dict[str, Any], expected: dict[str, Any] | str, exception
             {
                 "database": "db",
                 "direct_tls": False,
+                "preflight": False,
                 "host": "localhost",
                 "password": "pass",
                 "port": 5432,
@@ -344,6 +359,7 @@ def test__init(params: dict[str, Any], expected: dict[str, Any] | str, exception
             {
                 "database": "db",
                 "direct_tls": False,
+                "preflight": False,
                 "host": "localhost",
                 "password": "pass",
                 "port": 5432,
@@ -362,6 +378,7 @@ def test__init(params: dict[str, Any], expected: dict[str, Any] | str, exception
             {
                 "database": "db",
                 "direct_tls": False,
+                "preflight": False,
                 "host": "localhost",
                 "password": "pass",
                 "port": 5432,
@@ -378,6 +395,7 @@ def test__init(params: dict[str, Any], expected: dict[str, Any] | str, exception
             {
                 "database": "db",
                 "direct_tls": False,
+                "preflight": False,
                 "host": "localhost",
                 "password": "pass",
                 "port": 5432,
@@ -394,6 +412,7 @@ def test__init(params: dict[str, Any], expected: dict[str, Any] | str, exception
             {
                 "database": "db",
                 "direct_tls": False,
+                "preflight": False,
                 "host": "localhost",
                 "password": "pass",
                 "port": 5432,
@@ -412,6 +431,7 @@ def test__init(params: dict[str, Any], expected: dict[str, Any] | str, exception
             {
                 "database": "db",
                 "direct_tls": False,
+                "preflight": False,
                 "host": "localhost",
                 "password": "pass",
                 "port": 5432,
@@ -430,6 +450,7 @@ def test__init(params: dict[str, Any], expected: dict[str, Any] | str, exception
             {
                 "database": "db",
                 "direct_tls": False,
+                "preflight": False,
                 "host": "localhost",
                 "password": "pass",
                 "port": 5432,
@@ -446,6 +467,7 @@ def test__init(params: dict[str, Any], expected: dict[str, Any] | str, exception
             {
                 "database": "db",
                 "direct_tls": False,
+                "preflight": False,
                 "host": "localhost",
                 "password": "pass",
                 "port": 5432,
@@ -462,6 +484,7 @@ def test__init(params: dict[str, Any], expected: dict[str, Any] | str, exception
             {
                 "database": "db",
                 "direct_tls": False,
+                "preflight": False,
                 "host": "localhost",
                 "password": "pass",
                 "port": 5432,
@@ -480,6 +503,7 @@ def test__init(params: dict[str, Any], expected: dict[str, Any] | str, exception
             {
                 "database": "db",
                 "direct_tls": False,
+                "preflight": False,
                 "host": "localhost",
                 "password": "pass",
                 "port": 5432,
@@ -498,6 +522,7 @@ def test__init(params: dict[str, Any], expected: dict[str, Any] | str, exception
             {
                 "database": "db",
                 "direct_tls": False,
+                "preflight": False,
                 "host": "localhost",
                 "password": "pass",
                 "port": 5432,
@@ -514,6 +539,7 @@ def test__init(params: dict[str, Any], expected: dict[str, Any] | str, exception
             {
                 "database": "db",
                 "direct_tls": False,
+                "preflight": False,
                 "host": "localhost",
                 "password": "pass",
                 "port": 5432,
@@ -530,6 +556,7 @@ def test__init(params: dict[str, Any], expected: dict[str, Any] | str, exception
             {
                 "database": "db",
                 "direct_tls": False,
+                "preflight": False,
                 "host": "localhost",
                 "password": "pass",
                 "port": 5432,
@@ -548,6 +575,7 @@ def test__init(params: dict[str, Any], expected: dict[str, Any] | str, exception
             {
                 "database": "db",
                 "direct_tls": False,
+                "preflight": False,
                 "host": "localhost",
                 "password": "pass",
                 "port": 5432,
@@ -566,6 +594,7 @@ def test__init(params: dict[str, Any], expected: dict[str, Any] | str, exception
             {
                 "database": "db",
                 "direct_tls": False,
+                "preflight": False,
                 "host": "localhost",
                 "password": "pass",
                 "port": 5432,
@@ -596,6 +625,7 @@ def test__init(params: dict[str, Any], expected: dict[str, Any] | str, exception
             {
                 "database": "db",
                 "direct_tls": False,
+                "preflight": False,
                 "host": "localhost",
                 "password": "pass",
                 "port": 5432,
@@ -614,6 +644,7 @@ def test__init(params: dict[str, Any], expected: dict[str, Any] | str, exception
             {
                 "database": "db",
                 "direct_tls": False,
+                "preflight": False,
                 "host": "localhost",
                 "password": "pass",
                 "port": 5432,
@@ -634,6 +665,7 @@ def test__init(params: dict[str, Any], expected: dict[str, Any] | str, exception
             {
                 "database": "db",
                 "direct_tls": False,
+                "preflight": False,
                 "host": "localhost",
                 "password": "pass",
                 "port": 5432,
@@ -655,6 +687,7 @@ def test__init(params: dict[str, Any], expected: dict[str, Any] | str, exception
             {
                 "database": "db",
                 "direct_tls": False,
+                "preflight": False,
                 "host": "localhost",
                 "password": "pass",
                 "port": 5432,
@@ -819,3 +852,50 @@ async def test__call_failure() -> None:
             Connection_mock.fetchval.assert_called_once_with("SELECT 1")
             Connection_mock.is_closed.assert_called_once_with()
             Connection_mock.close.assert_called_once_with(timeout=1.5)
+
+
+def test_dependency() -> None:
+    assert PostgreSQLAsyncPGHealthCheck(host="db", port=6432).dependency == "db:6432"
+
+
+def create_pool_mock(connection: MagicMock) -> MagicMock:
+    pool = MagicMock(spec=Pool)
+    pool.acquire.return_value.__aenter__ = AsyncMock(return_value=connection)
+    pool.acquire.return_value.__aexit__ = AsyncMock(return_value=None)
+    pool.get_size.return_value = 5
+    pool.get_idle_size.return_value = 3
+    pool.get_min_size.return_value = 2
+    pool.get_max_size.return_value = 10
+    return pool
+
+
+def test_from_pool() -> None:
+    pool = MagicMock(spec=Pool)
+    health_check = PostgreSQLAsyncPGHealthCheck.from_pool(pool, timeout=1.5, name="test")
+    assert isinstance(health_check, PostgreSQLAsyncPGPoolHealthCheck)
+    assert health_check.to_dict() == {"pool": pool, "timeout": 1.5, "name": "test"}
+    assert health_check.dependency is None
+
+
+@pytest.mark.asyncio
+async def test_pool_call_success() -> None:
+    connection = MagicMock(spec=Connection)
+    pool = create_pool_mock(connection)
+    result = await PostgreSQLAsyncPGHealthCheck.from_pool(pool, timeout=1.5, name="test")()
+    assert result.healthy is True
+    assert result.name == "test"
+    assert result.details == {"size": 5, "idle": 3, "min_size": 2, "max_size": 10}
+    pool.acquire.assert_called_once_with(timeout=1.5)
+    connection.execute.assert_awaited_once_with("SELECT 1", timeout=1.5)
+    connection.transaction.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_pool_call_failure() -> None:
+    connection = MagicMock(spec=Connection)
+    connection.execute.side_effect = Exception("Database error")
+    pool = create_pool_mock(connection)
+    result = await PostgreSQLAsyncPGHealthCheck.from_pool(pool, name="test")()
+    assert result.healthy is False
+    assert "Database error" in str(result.error_details)
+    assert result.details == {"size": 5, "idle": 3, "min_size": 2, "max_size": 10}
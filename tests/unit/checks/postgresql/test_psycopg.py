@@ -5,9 +5,10 @@ from urllib.parse import ParseResult, unquote, urlparse
 
 import pytest
 from psycopg.connection_async import AsyncConnection, AsyncCursor
+from psycopg_pool import AsyncConnectionPool
 
 from fast_healthchecks.checks.postgresql.base import create_ssl_context
-from fast_healthchecks.checks.postgresql.psycopg import PostgreSQLPsycopgHealthCheck
+from fast_healthchecks.checks.postgresql.psycopg import PostgreSQLPsycopgHealthCheck, PostgreSQLPsycopgPoolHealthCheck
 from tests.utils import (
     TEST_SSLCERT,
     TEST_SSLKEY,
@@ -48,6 +49,8 @@ pytestmark = pytest.mark.unit
                 "sslcert": None,
                 "sslkey": None,
                 "sslrootcert": None,
+                "preflight": False,
+                "pooled": False,
                 "timeout": 5.0,
                 "name": "PostgreSQL",
             },
@@ -69,6 +72,8 @@ pytestmark = pytest.mark.unit
                 "sslcert": None,
                 "sslkey": None,
                 "sslrootcert": None,
+                "preflight": False,
+                "pooled": False,
                 "timeout": 5.0,
                 "name": "PostgreSQL",
             },
@@ -91,6 +96,8 @@ pytestmark = pytest.mark.unit
                 "sslcert": None,
                 "sslkey": None,
                 "sslrootcert": None,
+                "preflight": False,
+                "pooled": False,
                 "timeout": 5.0,
                 "name": "PostgreSQL",
             },
@@ -114,6 +121,8 @@ pytestmark = pytest.mark.unit
                 "sslcert": None,
                 "sslkey": None,
                 "sslrootcert": None,
+                "preflight": False,
+                "pooled": False,
                 "timeout": 5.0,
                 "name": "PostgreSQL",
             },
@@ -138,6 +147,8 @@ pytestmark = pytest.mark.unit
                 "sslcert": None,
                 "sslkey": None,
                 "sslrootcert": None,
+                "preflight": False,
+                "pooled": False,
                 "timeout": 5.0,
                 "name": "PostgreSQL",
             },
@@ -163,6 +174,8 @@ pytestmark = pytest.mark.unit
                 "sslcert": TEST_SSLCERT,
                 "sslkey": None,
                 "sslrootcert": None,
+                "preflight": False,
+                "pooled": False,
                 "timeout": 5.0,
                 "name": "PostgreSQL",
             },
@@ -189,6 +202,8 @@ pytestmark = pytest.mark.unit
                 "sslcert": TEST_SSLCERT,
                 "sslkey": TEST_SSLKEY,
                 "sslrootcert": None,
+                "preflight": False,
+                "pooled": False,
                 "timeout": 5.0,
                 "name": "PostgreSQL",
             },
@@ -216,6 +231,8 @@ pytestmark = pytest.mark.unit
                 "sslcert": TEST_SSLCERT,
                 "sslkey": TEST_SSLKEY,
                 "sslrootcert": TEST_SSLROOTCERT,
+                "preflight": False,
+                "pooled": False,
                 "timeout": 5.0,
                 "name": "PostgreSQL",
             },
@@ -240,6 +257,8 @@ pytestmark = pytest.mark.unit
                 "sslcert": None,
                 "sslkey": None,
                 "sslrootcert": None,
+                "preflight": False,
+                "pooled": False,
                 "timeout": 5.0,
                 "name": "PostgreSQL",
             },
@@ -265,6 +284,8 @@ pytestmark = pytest.mark.unit
                 "sslcert": TEST_SSLCERT,
                 "sslkey": None,
                 "sslrootcert": None,
+                "preflight": False,
+                "pooled": False,
                 "timeout": 5.0,
                 "name": "PostgreSQL",
             },
@@ -291,6 +312,8 @@ pytestmark = pytest.mark.unit
                 "sslcert": TEST_SSLCERT,
                 "sslkey": TEST_SSLKEY,
                 "sslrootcert": None,
+                "preflight": False,
+                "pooled": False,
                 "timeout": 5.0,
                 "name": "PostgreSQL",
             },
@@ -318,6 +341,8 @@ pytestmark = pytest.mark.unit
                 "sslcert": TEST_SSLCERT,
                 "sslkey": TEST_SSLKEY,
                 "sslrootcert": TEST_SSLROOTCERT,
+                "preflight": False,
+                "pooled": False,
                 "timeout": 5.0,
                 "name": "PostgreSQL",
             },
@@ -342,6 +367,8 @@ pytestmark = pytest.mark.unit
                 "sslcert": None,
                 "sslkey": None,
                 "sslrootcert": None,
+                "preflight": False,
+                "pooled": False,
                 "timeout": 5.0,
                 "name": "PostgreSQL",
             },
@@ -367,6 +394,8 @@ pytestmark = pytest.mark.unit
                 "sslcert": TEST_SSLCERT,
                 "sslkey": None,
                 "sslrootcert": None,
+                "preflight": False,
+                "pooled": False,
                 "timeout": 5.0,
                 "name": "PostgreSQL",
             },
@@ -393,6 +422,8 @@ pytestmark = pytest.mark.unit
                 "sslcert": TEST_SSLCERT,
                 "sslkey": TEST_SSLKEY,
                 "sslrootcert": None,
+                "preflight": False,
+                "pooled": False,
                 "timeout": 5.0,
                 "name": "PostgreSQL",
             },
@@ -420,6 +451,8 @@ pytestmark = pytest.mark.unit
                 "sslcert": TEST_SSLCERT,
                 "sslkey": TEST_SSLKEY,
                 "sslrootcert": TEST_SSLROOTCERT,
+                "preflight": False,
+                "pooled": False,
                 "timeout": 5.0,
                 "name": "PostgreSQL",
             },
@@ -444,6 +477,8 @@ pytestmark = pytest.mark.unit
                 "sslcert": None,
                 "sslkey": None,
                 "sslrootcert": None,
+                "preflight": False,
+                "pooled": False,
                 "timeout": 5.0,
                 "name": "PostgreSQL",
             },
@@ -469,6 +504,8 @@ pytestmark = pytest.mark.unit
                 "sslcert": TEST_SSLCERT,
                 "sslkey": None,
                 "sslrootcert": None,
+                "preflight": False,
+                "pooled": False,
                 "timeout": 5.0,
                 "name": "PostgreSQL",
             },
@@ -495,6 +532,8 @@ pytestmark = pytest.mark.unit
                 "sslcert": TEST_SSLCERT,
                 "sslkey": TEST_SSLKEY,
                 "sslrootcert": None,
+                "preflight": False,
+                "pooled": False,
                 "timeout": 5.0,
                 "name": "PostgreSQL",
             },
@@ -522,6 +561,8 @@ pytestmark = pytest.mark.unit
                 "sslcert": TEST_SSLCERT,
                 "sslkey": TEST_SSLKEY,
                 "sslrootcert": TEST_SSLROOTCERT,
+                "preflight": False,
+                "pooled": False,
                 "timeout": 5.0,
                 "name": "PostgreSQL",
             },
@@ -546,6 +587,8 @@ pytestmark = pytest.mark.unit
                 "sslcert": None,
                 "sslkey": None,
                 "sslrootcert": None,
+                "preflight": False,
+                "pooled": False,
                 "timeout": 5.0,
                 "name": "PostgreSQL",
             },
@@ -571,6 +614,8 @@ pytestmark = pytest.mark.unit
                 "sslcert": TEST_SSLCERT,
                 "sslkey": None,
                 "sslrootcert": None,
+                "preflight": False,
+                "pooled": False,
                 "timeout": 5.0,
                 "name": "PostgreSQL",
             },
@@ -597,6 +642,8 @@ pytestmark = pytest.mark.unit
                 "sslcert": TEST_SSLCERT,
                 "sslkey": TEST_SSLKEY,
                 "sslrootcert": None,
+                "preflight": False,
+                "pooled": False,
                 "timeout": 5.0,
                 "name": "PostgreSQL",
             },
@@ -624,6 +671,8 @@ pytestmark = pytest.mark.unit
                 "sslcert": TEST_SSLCERT,
                 "sslkey": TEST_SSLKEY,
                 "sslrootcert": TEST_SSLROOTCERT,
+                "preflight": False,
+                "pooled": False,
                 "timeout": 5.0,
                 "name": "PostgreSQL",
             },
@@ -648,6 +697,8 @@ pytestmark = pytest.mark.unit
                 "sslcert": None,
                 "sslkey": None,
                 "sslrootcert": None,
+                "preflight": False,
+                "pooled": False,
                 "timeout": 5.0,
                 "name": "PostgreSQL",
             },
@@ -673,6 +724,8 @@ pytestmark = pytest.mark.unit
                 "sslcert": TEST_SSLCERT,
                 "sslkey": None,
                 "sslrootcert": None,
+                "preflight": False,
+                "pooled": False,
                 "timeout": 5.0,
                 "name": "PostgreSQL",
             },
@@ -699,6 +752,8 @@ pytestmark = pytest.mark.unit
                 "sslcert": TEST_SSLCERT,
                 "sslkey": TEST_SSLKEY,
                 "sslrootcert": None,
+                "preflight": False,
+                "pooled": False,
                 "timeout": 5.0,
                 "name": "PostgreSQL",
             },
@@ -726,6 +781,8 @@ pytestmark = pytest.mark.unit
                 "sslcert": TEST_SSLCERT,
                 "sslkey": TEST_SSLKEY,
                 "sslrootcert": TEST_SSLROOTCERT,
+                "preflight": False,
+                "pooled": False,
                 "timeout": 5.0,
                 "name": "PostgreSQL",
             },
@@ -754,6 +811,8 @@ pytestmark = pytest.mark.unit
                 "sslcert": TEST_SSLCERT,
                 "sslkey": TEST_SSLKEY,
                 "sslrootcert": TEST_SSLROOTCERT,
+                "preflight": False,
+                "pooled": False,
                 "timeout": 10.0,
                 "name": "PostgreSQL",
             },
@@ -770,6 +829,8 @@ pytestmark = pytest.mark.unit
                 "sslcert": TEST_SSLCERT,
                 "sslkey": TEST_SSLKEY,
                 "sslrootcert": TEST_SSLROOTCERT,
+                "preflight": False,
+                "pooled": False,
                 "timeout": 10.0,
                 "name": "test",
             },
@@ -783,6 +844,8 @@ pytestmark = pytest.mark.unit
                 "sslcert": TEST_SSLCERT,
                 "sslkey": TEST_SSLKEY,
                 "sslrootcert": TEST_SSLROOTCERT,
+                "preflight": False,
+                "pooled": False,
                 "timeout": 10.0,
                 "name": "test",
             },
@@ -820,6 +883,8 @@ def test__init(params: dict[str, Any], expected: dict[str, Any] | str, exception
                 "sslkey": None,
                 "sslmode": "disable",
                 "sslrootcert": None,
+                "preflight": False,
+                "pooled": False,
                 "user": "postgres",
                 "timeout": 5.0,
                 "name": "PostgreSQL",
@@ -838,6 +903,8 @@ def test__init(params: dict[str, Any], expected: dict[str, Any] | str, exception
                 "sslkey": None,
                 "sslmode": "disable",
                 "sslrootcert": None,
+                "preflight": False,
+                "pooled": False,
                 "user": "postgres",
                 "timeout": 5.0,
                 "name": "PostgreSQL",
@@ -858,6 +925,8 @@ def test__init(params: dict[str, Any], expected: dict[str, Any] | str, exception
                 "sslkey": unquote(TEST_SSLKEY),
                 "sslmode": "disable",
                 "sslrootcert": None,
+                "preflight": False,
+                "pooled": False,
                 "user": "postgres",
                 "timeout": 5.0,
                 "name": "PostgreSQL",
@@ -878,6 +947,8 @@ def test__init(params: dict[str, Any], expected: dict[str, Any] | str, exception
                 "sslkey": unquote(TEST_SSLKEY),
                 "sslmode": "disable",
                 "sslrootcert": unquote(TEST_SSLROOTCERT),
+                "preflight": False,
+                "pooled": False,
                 "user": "postgres",
                 "timeout": 5.0,
                 "name": "PostgreSQL",
@@ -896,6 +967,8 @@ def test__init(params: dict[str, Any], expected: dict[str, Any] | str, exception
                 "sslkey": None,
                 "sslmode": "allow",
                 "sslrootcert": None,
+                "preflight": False,
+                "pooled": False,
                 "user": "postgres",
                 "timeout": 5.0,
                 "name": "PostgreSQL",
@@ -914,6 +987,8 @@ def test__init(params: dict[str, Any], expected: dict[str, Any] | str, exception
                 "sslkey": None,
                 "sslmode": "allow",
                 "sslrootcert": None,
+                "preflight": False,
+                "pooled": False,
                 "user": "postgres",
                 "timeout": 5.0,
                 "name": "PostgreSQL",
@@ -934,6 +1009,8 @@ def test__init(params: dict[str, Any], expected: dict[str, Any] | str, exception
                 "sslkey": TEST_SSLKEY,
                 "sslmode": "allow",
                 "sslrootcert": None,
+                "preflight": False,
+                "pooled": False,
                 "user": "postgres",
                 "timeout": 5.0,
                 "name": "PostgreSQL",
@@ -954,6 +1031,8 @@ def test__init(params: dict[str, Any], expected: dict[str, Any] | str, exception
                 "sslkey": TEST_SSLKEY,
                 "sslmode": "allow",
                 "sslrootcert": TEST_SSLROOTCERT,
+                "preflight": False,
+                "pooled": False,
                 "user": "postgres",
                 "timeout": 5.0,
                 "name": "PostgreSQL",
@@ -972,6 +1051,8 @@ def test__init(params: dict[str, Any], expected: dict[str, Any] | str, exception
                 "sslkey": None,
                 "sslmode": "prefer",
                 "sslrootcert": None,
+                "preflight": False,
+                "pooled": False,
                 "user": "postgres",
                 "timeout": 5.0,
                 "name": "PostgreSQL",
@@ -990,6 +1071,8 @@ def test__init(params: dict[str, Any], expected: dict[str, Any] | str, exception
                 "sslkey": None,
                 "sslmode": "prefer",
                 "sslrootcert": None,
+                "preflight": False,
+                "pooled": False,
                 "user": "postgres",
                 "timeout": 5.0,
                 "name": "PostgreSQL",
@@ -1010,6 +1093,8 @@ def test__init(params: dict[str, Any], expected: dict[str, Any] | str, exception
                 "sslkey": TEST_SSLKEY,
                 "sslmode": "prefer",
                 "sslrootcert": None,
+                "preflight": False,
+                "pooled": False,
                 "user": "postgres",
                 "timeout": 5.0,
                 "name": "PostgreSQL",
@@ -1030,6 +1115,8 @@ def test__init(params: dict[str, Any], expected: dict[str, Any] | str, exception
                 "sslkey": TEST_SSLKEY,
                 "sslmode": "prefer",
                 "sslrootcert": TEST_SSLROOTCERT,
+                "preflight": False,
+                "pooled": False,
                 "user": "postgres",
                 "timeout": 5.0,
                 "name": "PostgreSQL",
@@ -1062,6 +1149,8 @@ def test__init(params: dict[str, Any], expected: dict[str, Any] | str, exception
                 "sslkey": TEST_SSLKEY,
                 "sslmode": "verify-full",
                 "sslrootcert": None,
+                "preflight": False,
+                "pooled": False,
                 "user": "postgres",
                 "timeout": 5.0,
                 "name": "PostgreSQL",
@@ -1082,6 +1171,8 @@ def test__init(params: dict[str, Any], expected: dict[str, Any] | str, exception
                 "sslkey": TEST_SSLKEY,
                 "sslmode": "verify-full",
                 "sslrootcert": TEST_SSLROOTCERT,
+                "preflight": False,
+                "pooled": False,
                 "user": "postgres",
                 "timeout": 5.0,
                 "name": "PostgreSQL",
@@ -1104,6 +1195,8 @@ def test__init(params: dict[str, Any], expected: dict[str, Any] | str, exception
                 "sslkey": TEST_SSLKEY,
                 "sslmode": "verify-full",
                 "sslrootcert": TEST_SSLROOTCERT,
+                "preflight": False,
+                "pooled": False,
                 "user": "postgres",
                 "timeout": 10.0,
                 "name": "PostgreSQL",
@@ -1127,6 +1220,8 @@ def test__init(params: dict[str, Any], expected: dict[str, Any] | str, exception
                 "sslkey": TEST_SSLKEY,
                 "sslmode": "verify-full",
                 "sslrootcert": TEST_SSLROOTCERT,
+                "preflight": False,
+                "pooled": False,
                 "user": "postgres",
                 "timeout": 10.0,
                 "name": "test",
@@ -1193,6 +1288,7 @@ async def test_psycopg_AsyncConnection_connect_args_kwargs() -> None:  # noqa: N
                 sslcert=TEST_SSLCERT,
                 sslkey=TEST_SSLKEY,
                 sslrootcert=TEST_SSLROOTCERT,
+                connect_timeout=2,
             )
             asyncpg_connect_mock.assert_awaited_once_with(
                 host="localhost2",
@@ -1204,6 +1300,7 @@ async def test_psycopg_AsyncConnection_connect_args_kwargs() -> None:  # noqa: N
                 sslcert=TEST_SSLCERT,
                 sslkey=TEST_SSLKEY,
                 sslrootcert=TEST_SSLROOTCERT,
+                connect_timeout=2,
             )
             AsyncConnection_mock.cursor.assert_called_once_with()
             AsyncCursor_mock.execute.assert_called_once_with("SELECT 1")
@@ -1272,3 +1369,116 @@ async def test__call_failure() -> None:
             assert result.healthy is False
             assert result.name == "test"
             assert "Database error" in str(result.error_details)
+
+
+def test_dependency() -> None:
+    assert PostgreSQLPsycopgHealthCheck(host="db", port=6432).dependency == "db:6432"
+
+
+POOL_STATS = {"pool_min": 1, "pool_max": 1, "pool_size": 1, "pool_available": 1, "requests_waiting": 0}
+
+
+def create_pool_mock(connection: MagicMock) -> MagicMock:
+    pool = MagicMock(spec=AsyncConnectionPool)
+    pool.connection.return_value.__aenter__ = AsyncMock(return_value=connection)
+    pool.connection.return_value.__aexit__ = AsyncMock(return_value=None)
+    pool.get_stats.return_value = POOL_STATS
+    pool.max_lifetime = 3600.0
+    pool.max_idle = 600.0
+    return pool
+
+
+def test_from_pool() -> None:
+    pool = MagicMock(spec=AsyncConnectionPool)
+    pool.conninfo = "postgresql://user@db1:5433,db2/app"
+    pool.kwargs = {}
+    health_check = PostgreSQLPsycopgHealthCheck.from_pool(pool, timeout=1.5, name="test")
+    assert isinstance(health_check, PostgreSQLPsycopgPoolHealthCheck)
+    assert health_check.to_dict() == {"pool": pool, "timeout": 1.5, "name": "test"}
+    assert health_check.dependency == "db1:5433,db2:5432"
+
+
+@pytest.mark.parametrize(
+    ("conninfo", "kwargs", "expected"),
+    [
+        ("host=db port=6432", {}, "db:6432"),
+        ("dbname=app", {"host": "db", "port": 6432}, "db:6432"),
+        ("host=/var/run/postgresql", {}, None),
+        ("", {}, None),
+    ],
+)
+def test_pool_dependency(conninfo: str, kwargs: dict[str, Any], expected: str | None) -> None:
+    pool = MagicMock(spec=AsyncConnectionPool)
+    pool.conninfo = conninfo
+    pool.kwargs = kwargs
+    assert PostgreSQLPsycopgHealthCheck.from_pool(pool).dependency == expected
+
+
+@pytest.mark.asyncio
+async def test_pool_call_success() -> None:
+    connection = MagicMock(spec=AsyncConnection)
+    pool = create_pool_mock(connection)
+    result = await PostgreSQLPsycopgHealthCheck.from_pool(pool, timeout=1.5, name="test")()
+    assert result.healthy is True
+    assert result.details == {**POOL_STATS, "max_lifetime": 3600.0, "max_idle": 600.0}
+    pool.connection.assert_called_once_with(timeout=1.5)
+    connection.execute.assert_awaited_once_with("SELECT 1")
+
+
+@pytest.mark.asyncio
+async def test_pool_call_exhausted() -> None:
+    pool = create_pool_mock(MagicMock(spec=AsyncConnection))
+    pool.connection.return_value.__aenter__.side_effect = Exception("couldn't get a connection after 1.50 sec")
+    pool.get_stats.return_value = {**POOL_STATS, "pool_available": 0, "requests_waiting": 3}
+    result = await PostgreSQLPsycopgHealthCheck.from_pool(pool, timeout=1.5, name="test")()
+    assert result.healthy is False
+    assert "couldn't get a connection" in str(result.error_details)
+    assert result.details is not None
+    assert result.details["requests_waiting"] == 3  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_pooled_call() -> None:
+    health_check = PostgreSQLPsycopgHealthCheck(host="localhost", port=5432, pooled=True, timeout=1.5, name="test")
+    connection = MagicMock(spec=AsyncConnection)
+    pool = create_pool_mock(connection)
+    with patch("psycopg_pool.AsyncConnectionPool", return_value=pool) as patched_pool:
+        assert (await health_check()).healthy is True
+        assert (await health_check()).healthy is True
+        patched_pool.assert_called_once_with(
+            kwargs={
+                "host": "localhost",
+                "port": 5432,
+                "user": None,
+                "password": None,
+                "dbname": None,
+                "sslmode": None,
+                "sslcert": None,
+                "sslkey": None,
+                "sslrootcert": None,
+                "connect_timeout": 2,
+            },
+            min_size=1,
+            max_size=1,
+            open=False,
+            timeout=1.5,
+            name="test",
+        )
+    assert pool.open.await_count == 2  # noqa: PLR2004
+    assert connection.execute.await_count == 2  # noqa: PLR2004
+    await health_check.aclose()
+    pool.close.assert_awaited_once_with(timeout=1.5)
+
+
+@pytest.mark.asyncio
+async def test_start_pooled() -> None:
+    health_check = PostgreSQLPsycopgHealthCheck(host="localhost", port=5432, pooled=True)
+    pool = create_pool_mock(MagicMock(spec=AsyncConnection))
+    with patch("psycopg_pool.AsyncConnectionPool", return_value=pool) as patched_pool:
+        await health_check.start()
+        patched_pool.assert_called_once()
+        pool.open.assert_awaited_once_with()
+        await PostgreSQLPsycopgHealthCheck(host="localhost", port=5432).start()
+        patched_pool.assert_called_once()
+    await health_check.aclose()
+    pool.close.assert_awaited_once()
@@ -59,3 +59,18 @@ async def test_async_function_failure() -> None:
     assert result.healthy is False
     assert result.error_details is not None
     assert "Test exception" in result.error_details
+
+
+def test_dependency() -> None:
+    assert FunctionHealthCheck(func=dummy_sync_function).dependency is None
+
+
+def test_to_dict() -> None:
+    check = FunctionHealthCheck(func=dummy_sync_function, args=(1,), kwargs={"a": 2}, timeout=1.0)
+    assert check.to_dict() == {
+        "func": dummy_sync_function,
+        "args": (1,),
+        "kwargs": {"a": 2},
+        "timeout": 1.0,
+        "name": "Function",
+    }
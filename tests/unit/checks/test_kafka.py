@@ -1,11 +1,14 @@
 import ssl
 from typing import Any
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from aiokafka import AIOKafkaClient
+from aiokafka import AIOKafkaClient, AIOKafkaProducer
+from aiokafka.errors import NodeNotReadyError
+from aiokafka.structs import BrokerMetadata
 
-from fast_healthchecks.checks.kafka import KafkaHealthCheck
+from fast_healthchecks.checks.kafka import KafkaClientHealthCheck, KafkaHealthCheck, SecurityProtocol
+from fast_healthchecks.tls import get_ssl_context
 
 pytestmark = pytest.mark.unit
 
@@ -31,6 +34,8 @@ test_ssl_context = ssl.create_default_context()
                 "sasl_mechanism": "PLAIN",
                 "sasl_plain_username": None,
                 "sasl_plain_password": None,
+                "preflight": False,
+                "persistent": False,
                 "timeout": 5.0,
                 "name": "Kafka",
             },
@@ -48,6 +53,8 @@ test_ssl_context = ssl.create_default_context()
                 "sasl_mechanism": "PLAIN",
                 "sasl_plain_username": None,
                 "sasl_plain_password": None,
+                "preflight": False,
+                "persistent": False,
                 "timeout": 5.0,
                 "name": "Kafka",
             },
@@ -75,6 +82,8 @@ test_ssl_context = ssl.create_default_context()
                 "sasl_mechanism": "PLAIN",
                 "sasl_plain_username": None,
                 "sasl_plain_password": None,
+                "preflight": False,
+                "persistent": False,
                 "timeout": 5.0,
                 "name": "Kafka",
             },
@@ -93,6 +102,8 @@ test_ssl_context = ssl.create_default_context()
                 "sasl_mechanism": "PLAIN",
                 "sasl_plain_username": None,
                 "sasl_plain_password": None,
+                "preflight": False,
+                "persistent": False,
                 "timeout": 5.0,
                 "name": "Kafka",
             },
@@ -111,6 +122,8 @@ test_ssl_context = ssl.create_default_context()
                 "sasl_mechanism": "PLAIN",
                 "sasl_plain_username": None,
                 "sasl_plain_password": None,
+                "preflight": False,
+                "persistent": False,
                 "timeout": 5.0,
                 "name": "Kafka",
             },
@@ -129,6 +142,8 @@ test_ssl_context = ssl.create_default_context()
                 "sasl_mechanism": "PLAIN",
                 "sasl_plain_username": None,
                 "sasl_plain_password": None,
+                "preflight": False,
+                "persistent": False,
                 "timeout": 5.0,
                 "name": "Kafka",
             },
@@ -158,6 +173,8 @@ test_ssl_context = ssl.create_default_context()
                 "sasl_mechanism": "PLAIN",
                 "sasl_plain_username": None,
                 "sasl_plain_password": None,
+                "preflight": False,
+                "persistent": False,
                 "timeout": 5.0,
                 "name": "Kafka",
             },
@@ -177,6 +194,8 @@ test_ssl_context = ssl.create_default_context()
                 "sasl_mechanism": "GSSAPI",
                 "sasl_plain_username": None,
                 "sasl_plain_password": None,
+                "preflight": False,
+                "persistent": False,
                 "timeout": 5.0,
                 "name": "Kafka",
             },
@@ -196,6 +215,8 @@ test_ssl_context = ssl.create_default_context()
                 "sasl_mechanism": "SCRAM-SHA-256",
                 "sasl_plain_username": None,
                 "sasl_plain_password": None,
+                "preflight": False,
+                "persistent": False,
                 "timeout": 5.0,
                 "name": "Kafka",
             },
@@ -215,6 +236,8 @@ test_ssl_context = ssl.create_default_context()
                 "sasl_mechanism": "SCRAM-SHA-512",
                 "sasl_plain_username": None,
                 "sasl_plain_password": None,
+                "preflight": False,
+                "persistent": False,
                 "timeout": 5.0,
                 "name": "Kafka",
             },
@@ -234,6 +257,8 @@ test_ssl_context = ssl.create_default_context()
                 "sasl_mechanism": "OAUTHBEARER",
                 "sasl_plain_username": None,
                 "sasl_plain_password": None,
+                "preflight": False,
+                "persistent": False,
                 "timeout": 5.0,
                 "name": "Kafka",
             },
@@ -254,6 +279,8 @@ test_ssl_context = ssl.create_default_context()
                 "sasl_mechanism": "OAUTHBEARER",
                 "sasl_plain_username": "user",
                 "sasl_plain_password": None,
+                "preflight": False,
+                "persistent": False,
                 "timeout": 5.0,
                 "name": "Kafka",
             },
@@ -275,6 +302,8 @@ test_ssl_context = ssl.create_default_context()
                 "sasl_mechanism": "OAUTHBEARER",
                 "sasl_plain_username": "user",
                 "sasl_plain_password": "password",
+                "preflight": False,
+                "persistent": False,
                 "timeout": 5.0,
                 "name": "Kafka",
             },
@@ -297,6 +326,8 @@ test_ssl_context = ssl.create_default_context()
                 "sasl_mechanism": "OAUTHBEARER",
                 "sasl_plain_username": "user",
                 "sasl_plain_password": "password",
+                "preflight": False,
+                "persistent": False,
                 "timeout": 1.5,
                 "name": "Kafka",
             },
@@ -310,6 +341,8 @@ test_ssl_context = ssl.create_default_context()
                 "sasl_mechanism": "OAUTHBEARER",
                 "sasl_plain_username": "user",
                 "sasl_plain_password": "password",
+                "preflight": False,
+                "persistent": False,
                 "timeout": 1.5,
                 "name": "Test",
             },
@@ -320,6 +353,8 @@ test_ssl_context = ssl.create_default_context()
                 "sasl_mechanism": "OAUTHBEARER",
                 "sasl_plain_username": "user",
                 "sasl_plain_password": "password",
+                "preflight": False,
+                "persistent": False,
                 "timeout": 1.5,
                 "name": "Test",
             },
@@ -361,6 +396,27 @@ async def test_AIOKafkaClient_args_kwargs() -> None:  # noqa: N802
         )
 
 
+@pytest.mark.parametrize(
+    ("security_protocol", "expected"),
+    [
+        ("PLAINTEXT", None),
+        ("SASL_PLAINTEXT", None),
+        ("SSL", get_ssl_context()),
+        ("SASL_SSL", get_ssl_context()),
+    ],
+)
+@pytest.mark.asyncio
+async def test_AIOKafkaClient_default_ssl_context(  # noqa: N802
+    security_protocol: SecurityProtocol,
+    expected: ssl.SSLContext | None,
+) -> None:
+    health_check = KafkaHealthCheck(bootstrap_servers="localhost:9092", security_protocol=security_protocol)
+    with patch("fast_healthchecks.checks.kafka.AIOKafkaClient", spec=AIOKafkaClient) as mock:
+        await health_check()
+    assert mock.call_args.kwargs["ssl_context"] is expected
+    assert health_check.to_dict()["ssl_context"] is None
+
+
 @pytest.mark.asyncio
 async def test__call_success() -> None:
     health_check = KafkaHealthCheck(bootstrap_servers="localhost:9092")
@@ -396,3 +452,100 @@ async def test__call_failure() -> None:
         mock_bootstrap.assert_awaited_once_with()
         mock_close.assert_called_once_with()
         mock_close.assert_awaited_once_with()
+
+
+def test_dependency() -> None:
+    check = KafkaHealthCheck(bootstrap_servers="kafka1:9092, kafka2")
+    assert check.dependency == "kafka1:9092,kafka2:9092"
+
+
+def create_persistent_client_mock() -> MagicMock:
+    brokers = [BrokerMetadata(2, "kafka2", 9092, None), BrokerMetadata(1, "kafka1", 9092, None)]
+    client = MagicMock(spec=AIOKafkaClient)
+    client.cluster = MagicMock()
+    client.cluster.brokers.return_value = set(brokers)
+    response = MagicMock()
+    response.brokers = [(2, "kafka2", 9092, None), (1, "kafka1", 9092, None)]
+    response.controller_id = 1
+    client.send = AsyncMock(return_value=response)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_call_persistent() -> None:
+    health_check = KafkaHealthCheck(bootstrap_servers="kafka1:9092,kafka2:9092", persistent=True)
+    client = create_persistent_client_mock()
+    with patch("fast_healthchecks.checks.kafka.AIOKafkaClient", return_value=client) as mock:
+        first = await health_check()
+        second = await health_check()
+    mock.assert_called_once()
+    client.bootstrap.assert_awaited_once_with()
+    client.check_version.assert_not_called()
+    assert client.send.await_count == 2  # noqa: PLR2004
+    assert [call.args[0] for call in client.send.await_args_list] == [1, 1]
+    assert first == second
+    assert first.healthy is True
+    assert first.details == {"node": 1, "controller": 1, "brokers": ["kafka1:9092", "kafka2:9092"]}
+    await health_check.aclose()
+    client.close.assert_awaited_once_with()
+
+
+@pytest.mark.asyncio
+async def test_call_persistent_unreachable_broker() -> None:
+    health_check = KafkaHealthCheck(bootstrap_servers="kafka1:9092,kafka2:9092", persistent=True)
+    client = create_persistent_client_mock()
+    response = client.send.return_value
+    client.send.side_effect = [NodeNotReadyError("node 1"), response, response]
+    with patch("fast_healthchecks.checks.kafka.AIOKafkaClient", return_value=client) as mock:
+        first = await health_check()
+        second = await health_check()
+    mock.assert_called_once()
+    assert [call.args[0] for call in client.send.await_args_list] == [1, 2, 2]
+    assert first.healthy is True
+    assert second.details == {"node": 2, "controller": 1, "brokers": ["kafka1:9092", "kafka2:9092"]}
+    client.close.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_call_persistent_failure() -> None:
+    health_check = KafkaHealthCheck(bootstrap_servers="kafka1:9092", persistent=True)
+    client = create_persistent_client_mock()
+    client.send.side_effect = NodeNotReadyError("not ready")
+    with patch("fast_healthchecks.checks.kafka.AIOKafkaClient", return_value=client) as mock:
+        result = await health_check()
+        assert result.healthy is False
+        assert "Unable to get cluster metadata from any broker: node 1:" in str(result.error_details)
+        client.close.assert_awaited_once_with()
+        await health_check()
+    assert mock.call_count == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_from_client() -> None:
+    client = create_persistent_client_mock()
+    health_check = KafkaHealthCheck.from_client(client, timeout=1.5, name="test")
+    assert isinstance(health_check, KafkaClientHealthCheck)
+    assert health_check.to_dict() == {"client": client, "timeout": 1.5, "name": "test"}
+    assert health_check.dependency == "kafka1:9092,kafka2:9092"
+    result = await health_check()
+    assert result.healthy is True
+    assert result.details == {"node": 1, "controller": 1, "brokers": ["kafka1:9092", "kafka2:9092"]}
+    client.bootstrap.assert_not_called()
+    client.close.assert_not_called()
+
+
+def test_from_client_producer() -> None:
+    producer = MagicMock(spec=AIOKafkaProducer)
+    producer.client = create_persistent_client_mock()
+    health_check = KafkaHealthCheck.from_client(producer)
+    assert health_check.to_dict()["client"] is producer.client
+
+
+@pytest.mark.asyncio
+async def test_from_client_failure() -> None:
+    client = create_persistent_client_mock()
+    client.cluster.brokers.return_value = set()
+    result = await KafkaHealthCheck.from_client(client)()
+    assert result.healthy is False
+    assert "Unable to get cluster metadata" in str(result.error_details)
+    client.close.assert_not_called()
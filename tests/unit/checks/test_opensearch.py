@@ -1,16 +1,20 @@
 import ssl
 from typing import Any
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from opensearchpy import AsyncOpenSearch  # ty: ignore[possibly-unbound-import]
 
-from fast_healthchecks.checks.opensearch import OpenSearchHealthCheck
+from fast_healthchecks.checks.opensearch import OpenSearchClientHealthCheck, OpenSearchHealthCheck
+from fast_healthchecks.tls import get_ssl_context
+from tests.utils import SSLROOTCERT_NAME, TEST_CERT_LOCATION
 
 pytestmark = pytest.mark.unit
 
 test_ssl_context = ssl.create_default_context()
 
+CA_CERTS = str(TEST_CERT_LOCATION / SSLROOTCERT_NAME)
+
 
 @pytest.mark.parametrize(
     ("params", "expected", "exception"),
@@ -31,6 +35,8 @@ test_ssl_context = ssl.create_default_context()
                 "verify_certs": False,
                 "ssl_show_warn": False,
                 "ca_certs": None,
+                "cluster_health": False,
+                "persistent": False,
                 "timeout": 5.0,
                 "name": "OpenSearch",
             },
@@ -48,6 +54,8 @@ test_ssl_context = ssl.create_default_context()
                 "verify_certs": False,
                 "ssl_show_warn": False,
                 "ca_certs": None,
+                "cluster_health": False,
+                "persistent": False,
                 "timeout": 5.0,
                 "name": "OpenSearch",
             },
@@ -66,6 +74,8 @@ test_ssl_context = ssl.create_default_context()
                 "verify_certs": False,
                 "ssl_show_warn": False,
                 "ca_certs": None,
+                "cluster_health": False,
+                "persistent": False,
                 "timeout": 5.0,
                 "name": "OpenSearch",
             },
@@ -85,6 +95,8 @@ test_ssl_context = ssl.create_default_context()
                 "verify_certs": True,
                 "ssl_show_warn": False,
                 "ca_certs": None,
+                "cluster_health": False,
+                "persistent": False,
                 "timeout": 5.0,
                 "name": "OpenSearch",
             },
@@ -105,6 +117,8 @@ test_ssl_context = ssl.create_default_context()
                 "verify_certs": True,
                 "ssl_show_warn": True,
                 "ca_certs": None,
+                "cluster_health": False,
+                "persistent": False,
                 "timeout": 5.0,
                 "name": "OpenSearch",
             },
@@ -126,6 +140,8 @@ test_ssl_context = ssl.create_default_context()
                 "verify_certs": True,
                 "ssl_show_warn": True,
                 "ca_certs": "ca_certs",
+                "cluster_health": False,
+                "persistent": False,
                 "timeout": 5.0,
                 "name": "OpenSearch",
             },
@@ -148,6 +164,8 @@ test_ssl_context = ssl.create_default_context()
                 "verify_certs": True,
                 "ssl_show_warn": True,
                 "ca_certs": "ca_certs",
+                "cluster_health": False,
+                "persistent": False,
                 "timeout": 1.5,
                 "name": "OpenSearch",
             },
@@ -161,6 +179,8 @@ test_ssl_context = ssl.create_default_context()
                 "verify_certs": True,
                 "ssl_show_warn": True,
                 "ca_certs": "ca_certs",
+                "cluster_health": False,
+                "persistent": False,
                 "timeout": 1.5,
                 "name": "Test",
             },
@@ -171,6 +191,8 @@ test_ssl_context = ssl.create_default_context()
                 "verify_certs": True,
                 "ssl_show_warn": True,
                 "ca_certs": "ca_certs",
+                "cluster_health": False,
+                "persistent": False,
                 "timeout": 1.5,
                 "name": "Test",
             },
@@ -189,13 +211,34 @@ def test__init(params: dict[str, Any], expected: dict[str, Any] | str, exception
 
 @pytest.mark.asyncio
 async def test_AsyncOpenSearch_args_kwargs() -> None:  # noqa: N802
+    health_check = OpenSearchHealthCheck(
+        hosts=["localhost:9200"],
+        http_auth=("user", "password"),
+        timeout=1.5,
+        name="OpenSearch",
+    )
+    with patch("fast_healthchecks.checks.opensearch.AsyncOpenSearch", spec=AsyncOpenSearch) as mock:
+        await health_check()
+        mock.assert_called_once_with(
+            hosts=["localhost:9200"],
+            http_auth=("user", "password"),
+            use_ssl=False,
+            verify_certs=False,
+            ssl_show_warn=False,
+            ca_certs=None,
+            timeout=1.5,
+        )
+
+
+@pytest.mark.asyncio
+async def test_AsyncOpenSearch_args_kwargs_ssl() -> None:  # noqa: N802
     health_check = OpenSearchHealthCheck(
         hosts=["localhost:9200"],
         http_auth=("user", "password"),
         use_ssl=True,
         verify_certs=True,
         ssl_show_warn=True,
-        ca_certs="ca_certs",
+        ca_certs=CA_CERTS,
         timeout=1.5,
         name="OpenSearch",
     )
@@ -205,12 +248,34 @@ async def test_AsyncOpenSearch_args_kwargs() -> None:  # noqa: N802
             hosts=["localhost:9200"],
             http_auth=("user", "password"),
             use_ssl=True,
-            verify_certs=True,
-            ssl_show_warn=True,
-            ca_certs="ca_certs",
+            ssl_context=get_ssl_context(cafile=CA_CERTS),
+            timeout=1.5,
         )
 
 
+@pytest.mark.asyncio
+async def test_AsyncOpenSearch_ssl_show_warn() -> None:  # noqa: N802
+    health_check = OpenSearchHealthCheck(
+        hosts=["localhost:9200"],
+        use_ssl=True,
+        verify_certs=False,
+        ssl_show_warn=True,
+    )
+    with (
+        patch("fast_healthchecks.checks.opensearch.AsyncOpenSearch", spec=AsyncOpenSearch),
+        pytest.warns(UserWarning, match=r"^Connecting to localhost:9200 using SSL with verify_certs=False"),
+    ):
+        await health_check()
+
+
+@pytest.mark.asyncio
+async def test_invalid_ca_certs() -> None:
+    health_check = OpenSearchHealthCheck(hosts=["localhost:9200"], use_ssl=True, verify_certs=True, ca_certs="ca_certs")
+    result = await health_check()
+    assert result.healthy is False
+    assert "FileNotFoundError" in str(result.error_details)
+
+
 @pytest.mark.asyncio
 async def test__call_success() -> None:
     health_check = OpenSearchHealthCheck(hosts=["localhost:9200"])
@@ -259,3 +324,111 @@ async def test__call_failure() -> None:
         mock_client.info.assert_awaited_once_with()
         mock_client.close.assert_called_once_with()
         mock_client.close.assert_awaited_once_with()
+
+
+def test_dependency() -> None:
+    assert OpenSearchHealthCheck(hosts=["node1:9200", "node2:9200"]).dependency == "node1:9200,node2:9200"
+
+
+@pytest.mark.asyncio
+async def test__call_persistent() -> None:
+    health_check = OpenSearchHealthCheck(hosts=["localhost:9200"], persistent=True)
+    mock_client = AsyncMock(spec=AsyncOpenSearch)
+    mock_client.info = AsyncMock(return_value={"version": {"number": "2.19.0"}})
+    with patch("fast_healthchecks.checks.opensearch.AsyncOpenSearch", return_value=mock_client) as mock:
+        results = [await health_check() for _ in range(3)]
+        assert all(result.healthy for result in results)
+        mock.assert_called_once()
+        mock_client.close.assert_not_awaited()
+        await health_check.aclose()
+        mock_client.close.assert_awaited_once_with()
+
+
+@pytest.mark.asyncio
+async def test__call_persistent_failure() -> None:
+    health_check = OpenSearchHealthCheck(hosts=["localhost:9200"], persistent=True)
+    mock_client = AsyncMock(spec=AsyncOpenSearch)
+    mock_client.info = AsyncMock(side_effect=[Exception("Connection error"), {"version": {"number": "2.19.0"}}])
+    with patch("fast_healthchecks.checks.opensearch.AsyncOpenSearch", return_value=mock_client) as mock:
+        result = await health_check()
+        assert result.healthy is False
+        assert "Connection error" in str(result.error_details)
+        mock_client.close.assert_awaited_once_with()
+        result = await health_check()
+        assert result.healthy is True
+        assert mock.call_count == 2  # noqa: PLR2004
+
+
+@pytest.mark.parametrize(
+    ("status", "healthy"),
+    [
+        ("green", True),
+        ("yellow", True),
+        ("red", False),
+    ],
+)
+@pytest.mark.asyncio
+async def test__call_cluster_health(status: str, healthy: bool) -> None:  # noqa: FBT001
+    health_check = OpenSearchHealthCheck(hosts=["localhost:9200"], cluster_health=True, timeout=1.5)
+    mock_client = AsyncMock(spec=AsyncOpenSearch)
+    mock_client.cluster = MagicMock()
+    mock_client.cluster.health = AsyncMock(
+        return_value={
+            "cluster_name": "docker-cluster",
+            "status": status,
+            "timed_out": False,
+            "number_of_nodes": 1,
+            "number_of_data_nodes": 1,
+            "active_primary_shards": 5,
+            "active_shards": 5,
+            "relocating_shards": 0,
+            "initializing_shards": 0,
+            "unassigned_shards": 3,
+            "number_of_pending_tasks": 2,
+        },
+    )
+    with patch("fast_healthchecks.checks.opensearch.AsyncOpenSearch", return_value=mock_client):
+        result = await health_check()
+        assert result.healthy is healthy
+        assert result.details == {"status": status, "pending_tasks": 2, "unassigned_shards": 3}
+        mock_client.cluster.health.assert_awaited_once_with(local=True, timeout="1500ms")
+        mock_client.info.assert_not_called()
+        mock_client.close.assert_awaited_once_with()
+
+
+@pytest.mark.asyncio
+async def test_from_client() -> None:
+    mock_client = AsyncMock(spec=AsyncOpenSearch)
+    mock_client.info = AsyncMock(return_value={"version": {"number": "2.19.0"}})
+    mock_client.transport = MagicMock(hosts=[{"host": "search1", "port": 9201}, {"host": "search2"}])
+    health_check = OpenSearchHealthCheck.from_client(mock_client, timeout=1.5, name="test")
+    assert isinstance(health_check, OpenSearchClientHealthCheck)
+    assert health_check.to_dict() == {"client": mock_client, "cluster_health": False, "timeout": 1.5, "name": "test"}
+    assert health_check.dependency == "search1:9201,search2:9200"
+    result = await health_check()
+    assert result.healthy is True
+    mock_client.info.assert_awaited_once_with()
+    mock_client.close.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_from_client_cluster_health() -> None:
+    mock_client = AsyncMock(spec=AsyncOpenSearch)
+    mock_client.cluster = MagicMock()
+    mock_client.cluster.health = AsyncMock(
+        return_value={"status": "yellow", "number_of_pending_tasks": 0, "unassigned_shards": 1},
+    )
+    result = await OpenSearchHealthCheck.from_client(mock_client, cluster_health=True)()
+    assert result.healthy is True
+    assert result.details == {"status": "yellow", "pending_tasks": 0, "unassigned_shards": 1}
+    mock_client.cluster.health.assert_awaited_once_with(local=True, timeout="5000ms")
+
+
+@pytest.mark.asyncio
+async def test_from_client_failure() -> None:
+    mock_client = AsyncMock(spec=AsyncOpenSearch)
+    mock_client.info = AsyncMock(side_effect=Exception("Connection error"))
+    result = await OpenSearchHealthCheck.from_client(mock_client)()
+    assert result.healthy is False
+    assert "Connection error" in str(result.error_details)
+    mock_client.close.assert_not_called()
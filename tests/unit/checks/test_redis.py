@@ -1,10 +1,14 @@
+import asyncio
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from redis.asyncio import Redis
 
-from fast_healthchecks.checks.redis import RedisHealthCheck
+from fast_healthchecks.checks.redis import RedisClientHealthCheck, RedisHealthCheck
+from fast_healthchecks.models import HealthCheckResult
+from fast_healthchecks.tls import get_ssl_context
+from tests.utils import SSLROOTCERT_NAME, TEST_CERT_LOCATION
 
 pytestmark = pytest.mark.unit
 
@@ -22,6 +26,9 @@ pytestmark = pytest.mark.unit
                 "password": None,
                 "ssl": False,
                 "ssl_ca_certs": None,
+                "preflight": False,
+                "persistent": False,
+                "info_sections": (),
                 "timeout": 5.0,
                 "name": "Redis",
             },
@@ -39,6 +46,9 @@ pytestmark = pytest.mark.unit
                 "password": None,
                 "ssl": False,
                 "ssl_ca_certs": None,
+                "preflight": False,
+                "persistent": False,
+                "info_sections": (),
                 "timeout": 5.0,
                 "name": "Redis",
             },
@@ -57,6 +67,9 @@ pytestmark = pytest.mark.unit
                 "password": None,
                 "ssl": False,
                 "ssl_ca_certs": None,
+                "preflight": False,
+                "persistent": False,
+                "info_sections": (),
                 "timeout": 5.0,
                 "name": "Redis",
             },
@@ -76,6 +89,9 @@ pytestmark = pytest.mark.unit
                 "password": None,
                 "ssl": False,
                 "ssl_ca_certs": None,
+                "preflight": False,
+                "persistent": False,
+                "info_sections": (),
                 "timeout": 5.0,
                 "name": "Redis",
             },
@@ -95,6 +111,9 @@ pytestmark = pytest.mark.unit
                 "password": None,
                 "ssl": False,
                 "ssl_ca_certs": None,
+                "preflight": False,
+                "persistent": False,
+                "info_sections": (),
                 "timeout": 5.0,
                 "name": "Redis",
             },
@@ -115,6 +134,9 @@ pytestmark = pytest.mark.unit
                 "password": None,
                 "ssl": False,
                 "ssl_ca_certs": None,
+                "preflight": False,
+                "persistent": False,
+                "info_sections": (),
                 "timeout": 5.0,
                 "name": "Redis",
             },
@@ -136,6 +158,9 @@ pytestmark = pytest.mark.unit
                 "password": "pass",
                 "ssl": False,
                 "ssl_ca_certs": None,
+                "preflight": False,
+                "persistent": False,
+                "info_sections": (),
                 "timeout": 5.0,
                 "name": "Redis",
             },
@@ -158,6 +183,9 @@ pytestmark = pytest.mark.unit
                 "password": "pass",
                 "ssl": False,
                 "ssl_ca_certs": None,
+                "preflight": False,
+                "persistent": False,
+                "info_sections": (),
                 "timeout": 10.0,
                 "name": "Redis",
             },
@@ -181,6 +209,9 @@ pytestmark = pytest.mark.unit
                 "password": "pass",
                 "ssl": False,
                 "ssl_ca_certs": None,
+                "preflight": False,
+                "persistent": False,
+                "info_sections": (),
                 "timeout": 10.0,
                 "name": "test",
             },
@@ -211,6 +242,9 @@ def test_init(params: dict[str, Any], expected: dict[str, Any], exception: type[
                 "password": None,
                 "ssl": False,
                 "ssl_ca_certs": None,
+                "preflight": False,
+                "persistent": False,
+                "info_sections": (),
                 "timeout": 5.0,
                 "name": "Redis",
             },
@@ -227,6 +261,9 @@ def test_init(params: dict[str, Any], expected: dict[str, Any], exception: type[
                 "password": None,
                 "ssl": False,
                 "ssl_ca_certs": None,
+                "preflight": False,
+                "persistent": False,
+                "info_sections": (),
                 "timeout": 5.0,
                 "name": "Redis",
             },
@@ -243,6 +280,9 @@ def test_init(params: dict[str, Any], expected: dict[str, Any], exception: type[
                 "password": None,
                 "ssl": False,
                 "ssl_ca_certs": None,
+                "preflight": False,
+                "persistent": False,
+                "info_sections": (),
                 "timeout": 5.0,
                 "name": "Redis",
             },
@@ -259,6 +299,9 @@ def test_init(params: dict[str, Any], expected: dict[str, Any], exception: type[
                 "password": "pass",
                 "ssl": False,
                 "ssl_ca_certs": None,
+                "preflight": False,
+                "persistent": False,
+                "info_sections": (),
                 "timeout": 5.0,
                 "name": "Redis",
             },
@@ -277,6 +320,9 @@ def test_init(params: dict[str, Any], expected: dict[str, Any], exception: type[
                 "password": "pass",
                 "ssl": False,
                 "ssl_ca_certs": None,
+                "preflight": False,
+                "persistent": False,
+                "info_sections": (),
                 "timeout": 10.0,
                 "name": "Redis",
             },
@@ -296,6 +342,9 @@ def test_init(params: dict[str, Any], expected: dict[str, Any], exception: type[
                 "password": "pass",
                 "ssl": False,
                 "ssl_ca_certs": None,
+                "preflight": False,
+                "persistent": False,
+                "info_sections": (),
                 "timeout": 10.0,
                 "name": "test",
             },
@@ -315,11 +364,39 @@ def test_init(params: dict[str, Any], expected: dict[str, Any], exception: type[
                 "password": "pass",
                 "ssl": True,
                 "ssl_ca_certs": "/root.crt",
+                "preflight": False,
+                "persistent": False,
+                "info_sections": (),
                 "timeout": 10.0,
                 "name": "test",
             },
             None,
         ),
+        (
+            ("rediss://:pass@cache:6380/2",),
+            {},
+            {
+                "host": "cache",
+                "port": 6380,
+                "database": 2,
+                "user": None,
+                "password": "pass",
+                "ssl": True,
+                "ssl_ca_certs": None,
+                "preflight": False,
+                "persistent": False,
+                "info_sections": (),
+                "timeout": 5.0,
+                "name": "Redis",
+            },
+            None,
+        ),
+        (
+            ("redis://localhost/cache",),
+            {},
+            "Invalid database: cache",
+            ValueError,
+        ),
     ],
 )
 def test_from_dsn(
@@ -363,6 +440,7 @@ async def test_call_success() -> None:
             ssl=False,
             ssl_ca_certs=None,
             socket_timeout=10.0,
+            socket_connect_timeout=10.0,
             single_connection_client=True,
         )
 
@@ -393,5 +471,136 @@ async def test_call_exception() -> None:
             ssl=False,
             ssl_ca_certs=None,
             socket_timeout=5.0,
+            socket_connect_timeout=5.0,
             single_connection_client=True,
         )
+
+
+@pytest.mark.asyncio
+async def test_call_preflight_failure() -> None:
+    health_check = RedisHealthCheck(host="localhost", port=6379, preflight=True)
+    with (
+        patch(
+            "fast_healthchecks.checks.redis.tcp_preflight",
+            side_effect=ConnectionError("TCP preflight failed"),
+        ) as patched_preflight,
+        patch("fast_healthchecks.checks.redis.Redis") as patched_Redis,  # noqa: N806
+    ):
+        result = await health_check()
+        assert result.healthy is False
+        assert "TCP preflight failed" in str(result.error_details)
+        patched_preflight.assert_awaited_once_with([("localhost", 6379)], 5.0)
+        patched_Redis.assert_not_called()
+
+
+def test_dependency() -> None:
+    assert RedisHealthCheck(host="redis", port=6380).dependency == "redis:6380"
+
+
+@pytest.mark.asyncio
+async def test_call_persistent() -> None:
+    health_check = RedisHealthCheck(host="localhost", port=6379, persistent=True)
+    redis_mock = MagicMock(spec=Redis)
+    redis_mock.ping = AsyncMock(return_value=True)
+    with (
+        patch("fast_healthchecks.checks.redis.BlockingConnectionPool") as patched_pool,
+        patch("fast_healthchecks.checks.redis.Redis.from_pool", return_value=redis_mock) as patched_from_pool,
+    ):
+        assert (await health_check()).healthy is True
+        assert (await health_check()).healthy is True
+        patched_pool.assert_called_once()
+        assert patched_pool.call_args.kwargs["max_connections"] == 1
+        patched_from_pool.assert_called_once_with(patched_pool.return_value)
+        assert redis_mock.ping.await_count == 2  # noqa: PLR2004
+        await health_check.aclose()
+        redis_mock.aclose.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_call_persistent_reconnects_after_failure() -> None:
+    health_check = RedisHealthCheck(host="localhost", port=6379, persistent=True)
+    broken = MagicMock(spec=Redis)
+    broken.ping = AsyncMock(side_effect=ConnectionError("Connection reset"))
+    healthy = MagicMock(spec=Redis)
+    healthy.ping = AsyncMock(return_value=True)
+    with (
+        patch("fast_healthchecks.checks.redis.BlockingConnectionPool"),
+        patch("fast_healthchecks.checks.redis.Redis.from_pool", side_effect=[broken, healthy]),
+    ):
+        result = await health_check()
+        assert result.healthy is False
+        assert "Connection reset" in str(result.error_details)
+        broken.aclose.assert_awaited_once()
+        assert (await health_check()).healthy is True
+
+
+@pytest.mark.asyncio
+async def test_call_info_sections() -> None:
+    health_check = RedisHealthCheck(host="localhost", port=6379, info_sections=("memory", "replication"))
+    pipeline = MagicMock()
+    pipeline.__aenter__.return_value = pipeline
+    pipeline.execute = AsyncMock(return_value=[True, {"used_memory": 1024}, {"role": "master"}])
+    redis_mock = MagicMock(spec=Redis)
+    redis_mock.__aenter__.return_value = redis_mock
+    redis_mock.pipeline.return_value = pipeline
+    with patch("fast_healthchecks.checks.redis.Redis", return_value=redis_mock):
+        result = await health_check()
+    assert result.healthy is True
+    assert result.details == {"memory": {"used_memory": 1024}, "replication": {"role": "master"}}
+    redis_mock.pipeline.assert_called_once_with(transaction=False)
+    pipeline.ping.assert_called_once_with()
+    assert [call.args for call in pipeline.info.call_args_list] == [("memory",), ("replication",)]
+
+
+@pytest.mark.asyncio
+async def test_from_client() -> None:
+    redis_mock = MagicMock(spec=Redis)
+    redis_mock.ping = AsyncMock(return_value=True)
+    redis_mock.connection_pool = MagicMock(connection_kwargs={"host": "cache", "port": 6380})
+    health_check = RedisHealthCheck.from_client(redis_mock, timeout=1.5, name="test")
+    assert isinstance(health_check, RedisClientHealthCheck)
+    assert health_check.to_dict() == {"client": redis_mock, "info_sections": (), "timeout": 1.5, "name": "test"}
+    assert health_check.dependency == "cache:6380"
+    result = await health_check()
+    assert result == HealthCheckResult(name="test", healthy=True)
+    redis_mock.ping.assert_awaited_once_with()
+    redis_mock.aclose.assert_not_called()
+
+
+def test_from_client_unix_socket() -> None:
+    redis_mock = MagicMock(spec=Redis)
+    redis_mock.connection_pool = MagicMock(connection_kwargs={"path": "/run/redis.sock"})
+    assert RedisHealthCheck.from_client(redis_mock).dependency is None
+
+
+@pytest.mark.asyncio
+async def test_from_client_failure() -> None:
+    redis_mock = MagicMock(spec=Redis)
+    redis_mock.ping = AsyncMock(side_effect=ConnectionError("Connection reset"))
+    result = await RedisHealthCheck.from_client(redis_mock)()
+    assert result.healthy is False
+    assert "Connection reset" in str(result.error_details)
+    redis_mock.aclose.assert_not_called()
+
+
+async def hang() -> None:
+    await asyncio.sleep(10)
+
+
+@pytest.mark.asyncio
+async def test_from_client_timeout() -> None:
+    redis_mock = MagicMock(spec=Redis)
+    redis_mock.ping = AsyncMock(side_effect=hang)
+    result = await RedisHealthCheck.from_client(redis_mock, timeout=0.01)()
+    assert result.healthy is False
+    assert "TimeoutError" in str(result.error_details)
+
+
+@pytest.mark.asyncio
+async def test_ssl_context_from_registry() -> None:
+    ca_certs = str(TEST_CERT_LOCATION / SSLROOTCERT_NAME)
+    health_check = RedisHealthCheck(host="localhost", port=6379, ssl=True, ssl_ca_certs=ca_certs)
+    redis = health_check._create_client()
+    connection = redis.connection_pool.make_connection()
+    assert connection._connection_arguments()["ssl"] is get_ssl_context(cafile=ca_certs)
+    await redis.aclose()
@@ -0,0 +1,32 @@
+import asyncio
+
+import pytest
+
+from fast_healthchecks.checks.tcp import TcpHealthCheck
+from tests.utils import serve
+
+pytestmark = pytest.mark.unit
+
+
+def test_to_dict() -> None:
+    health_check = TcpHealthCheck(host="localhost", port=8080)
+    assert health_check.dependency == "localhost:8080"
+    assert health_check.to_dict() == {"host": "localhost", "port": 8080, "timeout": 5.0, "name": "TCP"}
+
+
+async def test_connect() -> None:
+    async with serve(lambda *_: asyncio.sleep(0)) as port:
+        result = await TcpHealthCheck(host="127.0.0.1", port=port)()
+
+    assert result.healthy is True, result.error_details
+    assert result.details is not None
+    assert result.details["connect_time_ms"] >= 0
+
+
+async def test_connection_refused() -> None:
+    async with serve(lambda *_: asyncio.sleep(0)) as port:
+        pass
+    result = await TcpHealthCheck(host="127.0.0.1", port=port)()
+
+    assert result.healthy is False
+    assert "ConnectionRefusedError" in str(result.error_details)
@@ -0,0 +1,114 @@
+import asyncio
+import ssl
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import pytest
+
+from fast_healthchecks.checks import tls
+from fast_healthchecks.checks.tls import TlsHealthCheck
+from tests.utils import SSLCERT_NAME, SSLKEY_NAME, TEST_CERT_LOCATION
+
+pytestmark = pytest.mark.unit
+
+
+class FakeSSLObject:
+    def __init__(self, peer_cert: dict[str, str]) -> None:
+        self._peer_cert = peer_cert
+
+    def getpeercert(self) -> dict[str, str]:
+        return self._peer_cert
+
+
+@asynccontextmanager
+async def tls_server() -> AsyncIterator[int]:
+    server_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    server_context.load_cert_chain(TEST_CERT_LOCATION / SSLCERT_NAME, TEST_CERT_LOCATION / SSLKEY_NAME)
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        await reader.read()
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0, ssl=server_context)
+    async with server:
+        yield server.sockets[0].getsockname()[1]
+
+
+def unverified_context() -> ssl.SSLContext:
+    context = ssl.create_default_context()
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    return context
+
+
+def test_days_to_expiry() -> None:
+    not_after = time.strftime("%b %d %H:%M:%S %Y GMT", time.gmtime(time.time() + 10 * tls.SECONDS_PER_DAY))
+    days_to_expiry = tls._days_to_expiry(FakeSSLObject({"notAfter": not_after}))  # ty: ignore[invalid-argument-type]
+    assert days_to_expiry == pytest.approx(10, abs=0.01)
+    assert tls._days_to_expiry(FakeSSLObject({})) is None  # ty: ignore[invalid-argument-type]
+
+
+async def test_handshake() -> None:
+    async with tls_server() as port:
+        result = await TlsHealthCheck(host="127.0.0.1", port=port, ssl_context=unverified_context())()
+
+    assert result.healthy is True, result.error_details
+    assert result.details is not None
+    assert result.details["protocol"] == "TLSv1.3"
+    assert result.details["days_to_expiry"] is None
+    assert result.details["connect_time_ms"] >= 0
+    assert result.details["handshake_time_ms"] >= 0
+
+
+async def test_handshake_unknown_expiry() -> None:
+    async with tls_server() as port:
+        health_check = TlsHealthCheck(
+            host="127.0.0.1",
+            port=port,
+            ssl_context=unverified_context(),
+            min_days_to_expiry=14,
+        )
+        result = await health_check()
+
+    assert result.healthy is False
+    assert "CertificateExpiryError: The certificate was not verified, its expiry is unknown" in str(
+        result.error_details,
+    )
+
+
+async def test_certificate_expires_soon(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(tls, "_days_to_expiry", lambda _: 3.0)
+    async with tls_server() as port:
+        health_check = TlsHealthCheck(
+            host="127.0.0.1",
+            port=port,
+            ssl_context=unverified_context(),
+            min_days_to_expiry=14,
+        )
+        result = await health_check()
+
+    assert result.healthy is False
+    assert "CertificateExpiryError: The certificate expires in 3.0 days" in str(result.error_details)
+
+
+async def test_handshake_failure() -> None:
+    async with tls_server() as port:
+        result = await TlsHealthCheck(host="127.0.0.1", port=port)()
+
+    assert result.healthy is False
+    assert "SSLCertVerificationError" in str(result.error_details)
+
+
+def test_to_dict() -> None:
+    health_check = TlsHealthCheck(host="example.com")
+    assert health_check.dependency == "example.com:443"
+    assert health_check.to_dict() == {
+        "host": "example.com",
+        "port": 443,
+        "server_hostname": None,
+        "ssl_context": None,
+        "min_days_to_expiry": None,
+        "timeout": 5.0,
+        "name": "TLS",
+    }
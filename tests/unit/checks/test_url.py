@@ -1,10 +1,18 @@
+import asyncio
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
 from unittest.mock import MagicMock, patch
 
+import certifi
 import pytest
-from httpx import AsyncClient, Response
+from httpx import AsyncClient, ConnectError, MockTransport, Request, Response
 
-from fast_healthchecks.checks.url import UrlHealthCheck
+from fast_healthchecks.checks.url import UrlGroupHealthCheck, UrlHealthCheck, _shared_clients  # noqa: PLC2701
+from fast_healthchecks.execution import ConnectionBudget, run_check, set_connection_budget
 from fast_healthchecks.models import HealthCheckResult
+from fast_healthchecks.resolver import DNSCache, set_dns_cache
+from fast_healthchecks.tls import get_ssl_context
 
 pytestmark = pytest.mark.unit
 
@@ -102,3 +110,379 @@ async def test_AsyncClient_args_kwargs() -> None:  # noqa: N802
             follow_redirects=False,
         )
         AsyncClient_mock.get.assert_called_once_with("https://httpbingo.org/status/200")
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("https://example.com/health", "example.com:443"),
+        ("http://example.com/health", "example.com:80"),
+        ("http://example.com:8080/health", "example.com:8080"),
+    ],
+)
+def test_dependency(url: str, expected: str) -> None:
+    assert UrlHealthCheck(url=url).dependency == expected
+
+
+def test_dependency_uds(tmp_path: Path) -> None:
+    check = UrlHealthCheck(url="http://envoy/ready", uds=str(tmp_path / "envoy.sock"))
+    assert check.dependency == f"unix://{tmp_path}/envoy.sock"
+
+
+async def test_uds(tmp_path: Path) -> None:
+    requests: list[bytes] = []
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        requests.append(await reader.readuntil(b"\r\n\r\n"))
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 4\r\nConnection: close\r\n\r\nLIVE")
+        await writer.drain()
+        writer.close()
+
+    path = str(tmp_path / "envoy.sock")
+    server = await asyncio.start_unix_server(handle, path)
+    async with server:
+        check = UrlHealthCheck(url="http://envoy/ready", uds=path, body_contains="LIVE", name="envoy")
+        assert await check() == HealthCheckResult(name="envoy", healthy=True)
+        persistent = UrlHealthCheck(url="http://envoy/ready", uds=path, persistent=True, name="envoy")
+        assert await persistent() == HealthCheckResult(name="envoy", healthy=True)
+        assert (True, False, path) in _shared_clients
+        await persistent.aclose()
+    assert [request.split(b"\r\n", 1)[0] for request in requests] == [b"GET /ready HTTP/1.1"] * 2
+    assert b"host: envoy" in requests[0].lower()
+
+
+async def test_uds_with_dns_cache(tmp_path: Path) -> None:
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        await reader.readuntil(b"\r\n\r\n")
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 4\r\nConnection: close\r\n\r\nLIVE")
+        await writer.drain()
+        writer.close()
+
+    path = str(tmp_path / "envoy.sock")
+    server = await asyncio.start_unix_server(handle, path)
+    set_dns_cache(DNSCache())
+    try:
+        async with server:
+            check = UrlHealthCheck(url="http://envoy/ready", uds=path, name="envoy")
+            assert await run_check(check) == HealthCheckResult(name="envoy", healthy=True)
+    finally:
+        set_dns_cache(None)
+
+
+def test_to_dict() -> None:
+    check = UrlHealthCheck(url="https://example.com", username="user", password="pass", name="Example")
+    assert check.to_dict() == {
+        "url": "https://example.com",
+        "username": "user",
+        "password": "pass",
+        "verify_ssl": True,
+        "follow_redirects": True,
+        "uds": None,
+        "persistent": False,
+        "http2": False,
+        "method": "GET",
+        "max_body_bytes": None,
+        "body_contains": None,
+        "body_pattern": None,
+        "json_fields": {},
+        "timeout": 5.0,
+        "name": "Example",
+    }
+
+
+@pytest.mark.asyncio
+async def test_persistent_shares_client() -> None:
+    requests: list[Request] = []
+
+    def handler(request: Request) -> Response:
+        requests.append(request)
+        return Response(status_code=200)
+
+    first = UrlHealthCheck(url="https://example.com/health", persistent=True, http2=True, name="first")
+    second = UrlHealthCheck(
+        url="https://example.org/health",
+        username="user",
+        password="passwd",
+        persistent=True,
+        http2=True,
+        name="second",
+    )
+    with patch("fast_healthchecks.checks.url.AsyncHTTPTransport", return_value=MockTransport(handler)) as transport:
+        assert await first() == HealthCheckResult(name="first", healthy=True)
+        assert await first() == HealthCheckResult(name="first", healthy=True)
+        assert await second() == HealthCheckResult(name="second", healthy=True)
+    transport.assert_called_once_with(verify=get_ssl_context(cafile=certifi.where()), http2=True, uds=None)
+    assert len(requests) == 3  # noqa: PLR2004
+    assert "authorization" not in requests[0].headers
+    assert requests[2].headers["authorization"].startswith("Basic ")
+    client, users = _shared_clients[True, True, None]
+    assert users == 2  # noqa: PLR2004
+    await first.aclose()
+    await first.aclose()
+    assert not client.is_closed
+    await second.aclose()
+    assert client.is_closed
+    assert (True, True, None) not in _shared_clients
+
+
+@pytest.mark.asyncio
+async def test_persistent_failure() -> None:
+    check = UrlHealthCheck(url="https://example.com/health", persistent=True)
+    with patch(
+        "fast_healthchecks.checks.url.AsyncHTTPTransport",
+        return_value=MockTransport(lambda _: Response(status_code=503)),
+    ):
+        result = await check()
+    assert result.healthy is False
+    assert "503 Service Unavailable" in str(result.error_details)
+    await check.aclose()
+
+
+@pytest.mark.asyncio
+async def test_start() -> None:
+    check = UrlHealthCheck(url="https://example.com/health", persistent=True, http2=True)
+    await check.start()
+    await check.start()
+    _, users = _shared_clients[True, True, None]
+    assert users == 1
+    await check.aclose()
+    assert (True, True, None) not in _shared_clients
+    await UrlHealthCheck(url="https://example.com/health").start()
+    assert (True, False, None) not in _shared_clients
+
+
+class ChunkedBody:
+    """A response body sent in chunks, recording how many of them were read."""
+
+    def __init__(self, *chunks: bytes) -> None:
+        self.chunks = chunks
+        self.sent = 0
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for chunk in self.chunks:
+            self.sent += 1
+            yield chunk
+
+
+async def check_body(body: ChunkedBody, **params: Any) -> HealthCheckResult:  # noqa: ANN401
+    transport = MockTransport(lambda _: Response(status_code=200, content=body))
+    with patch("fast_healthchecks.checks.url.AsyncHTTPTransport", return_value=transport):
+        return await UrlHealthCheck(url="https://example.com/status", **params)()
+
+
+async def test_head() -> None:
+    requests: list[Request] = []
+
+    def handler(request: Request) -> Response:
+        requests.append(request)
+        return Response(status_code=200)
+
+    with patch("fast_healthchecks.checks.url.AsyncHTTPTransport", return_value=MockTransport(handler)):
+        result = await UrlHealthCheck(url="https://example.com/health", method="HEAD")()
+    assert result.healthy is True
+    assert [request.method for request in requests] == ["HEAD"]
+
+
+def test_head_with_body_assertions() -> None:
+    with pytest.raises(ValueError, match="HEAD responses have no body to assert on"):
+        UrlHealthCheck(url="https://example.com/health", method="HEAD", body_contains="ok")
+
+
+async def test_max_body_bytes_stops_reading() -> None:
+    body = ChunkedBody(b"a" * 10, b"b" * 10, b"c" * 10, b"d" * 10)
+    result = await check_body(body, max_body_bytes=15)
+    assert result.healthy is True
+    assert body.sent == 2  # noqa: PLR2004
+
+
+@pytest.mark.parametrize(
+    ("params", "healthy", "sent", "error"),
+    [
+        ({"body_contains": "status: ok"}, True, 2, None),
+        ({"body_contains": "status: ok", "max_body_bytes": 10}, False, 1, "The body does not contain 'status: ok'"),
+        ({"body_contains": "degraded"}, False, 3, "The body does not contain 'degraded'"),
+        ({"body_pattern": r"status: (ok|degraded)"}, True, 3, None),
+        ({"body_pattern": r"^status: ok$"}, False, 3, "The body does not match '^status: ok$'"),
+    ],
+)
+async def test_body_assertions(
+    params: dict[str, Any],
+    healthy: bool,  # noqa: FBT001
+    sent: int,
+    error: str | None,
+) -> None:
+    body = ChunkedBody(b"<html> status", b": ok, version: 1.2 ", b"</html>")
+    result = await check_body(body, **params)
+    assert result.healthy is healthy
+    assert body.sent == sent
+    if error is not None:
+        assert f"ResponseBodyError: {error}" in str(result.error_details)
+
+
+@pytest.mark.parametrize(
+    ("params", "error"),
+    [
+        ({"json_fields": {"status": "ok", "checks.1.healthy": True}}, None),
+        ({"json_fields": {"checks.2.healthy": True}}, "The JSON body has no field 'checks.2.healthy'"),
+        ({"json_fields": {"status": "down"}}, "The JSON field 'status' is 'ok', expected 'down'"),
+        (
+            {"json_fields": {"status": "ok"}, "max_body_bytes": 20},
+            "The body is not valid JSON, it was cut at 20 bytes",
+        ),
+        (
+            {"json_fields": {"status": "ok"}, "max_body_bytes": 27},
+            "The body is not valid JSON, it was cut at 27 bytes",
+        ),
+        ({"json_fields": {"status": "ok"}, "max_body_bytes": 66}, None),
+    ],
+)
+async def test_json_fields(params: dict[str, Any], error: str | None) -> None:
+    body = ChunkedBody(b'{"status": "ok", "checks": ', b'[{"healthy": true}, {"healthy": true}]}')
+    result = await check_body(body, **params)
+    assert result.healthy is (error is None), result.error_details
+    if error is not None:
+        assert f"ResponseBodyError: {error}" in str(result.error_details)
+
+
+def group_handler(request: Request) -> Response:
+    if request.url.host == "down.example.com":
+        msg = "Connection refused"
+        raise ConnectError(msg, request=request)
+    return Response(status_code=int(request.url.path.rsplit("/", 1)[-1]))
+
+
+GROUP_URLS = [
+    "https://a.example.com/status/200",
+    "https://b.example.com/status/503",
+    "https://down.example.com/status/200",
+]
+
+
+@pytest.mark.parametrize(
+    ("min_healthy", "healthy", "error_details"),
+    [
+        (1, True, None),
+        (None, False, "1 of 3 URLs are healthy, 3 required"),
+    ],
+)
+async def test_url_group(min_healthy: int | None, healthy: bool, error_details: str | None) -> None:  # noqa: FBT001
+    with patch("fast_healthchecks.checks.url.AsyncHTTPTransport", return_value=MockTransport(group_handler)):
+        check = UrlGroupHealthCheck(urls=GROUP_URLS, min_healthy=min_healthy, name="group")
+        result = await check()
+    assert result.healthy is healthy
+    assert result.error_details == error_details
+    assert result.details == {
+        "healthy": 1,
+        "total": 3,
+        "min_healthy": min_healthy or 3,
+        "urls": {
+            "https://a.example.com/status/200": {"healthy": True, "status_code": 200, "error": None},
+            "https://b.example.com/status/503": {"healthy": False, "status_code": 503, "error": "HTTP 503"},
+            "https://down.example.com/status/200": {
+                "healthy": False,
+                "status_code": None,
+                "error": "ConnectError: Connection refused",
+            },
+        },
+    }
+
+
+async def test_url_group_bounds_concurrency() -> None:
+    active = peak = 0
+
+    async def handler(_: Request) -> Response:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return Response(status_code=200)
+
+    urls = [f"https://service-{index}.example.com/health" for index in range(6)]
+    with patch("fast_healthchecks.checks.url.AsyncHTTPTransport", return_value=MockTransport(handler)):
+        result = await UrlGroupHealthCheck(urls=urls, max_concurrency=2)()
+    assert result.healthy is True
+    assert peak == 2  # noqa: PLR2004
+
+
+async def test_url_group_takes_connection_budget_per_url() -> None:
+    active = peak = 0
+
+    async def handler(_: Request) -> Response:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return Response(status_code=200)
+
+    budget = ConnectionBudget(4, per_dependency=1)
+    set_connection_budget(budget)
+    try:
+        urls = [f"https://service-{index % 2}.example.com/health/{index}" for index in range(6)]
+        with patch("fast_healthchecks.checks.url.AsyncHTTPTransport", return_value=MockTransport(handler)):
+            result = await run_check(UrlGroupHealthCheck(urls=urls, max_concurrency=6))
+    finally:
+        set_connection_budget(None)
+    assert result.healthy is True
+    assert peak == 2  # noqa: PLR2004
+    assert budget.active == 0
+
+
+async def test_url_group_deadline() -> None:
+    async def handler(_: Request) -> Response:
+        await asyncio.sleep(0.2)
+        return Response(status_code=200)
+
+    urls = [f"https://service-{index}.example.com/health" for index in range(3)]
+    with patch("fast_healthchecks.checks.url.AsyncHTTPTransport", return_value=MockTransport(handler)):
+        result = await UrlGroupHealthCheck(urls=urls, max_concurrency=1, timeout=0.3)()
+    assert result.healthy is False
+    assert result.details is not None
+    assert result.details["urls"][urls[2]] == {
+        "healthy": False,
+        "status_code": None,
+        "error": "TimeoutError: no time left for the request",
+    }
+
+
+async def test_url_group_persistent_shares_client() -> None:
+    with patch("fast_healthchecks.checks.url.AsyncHTTPTransport", return_value=MockTransport(group_handler)):
+        group = UrlGroupHealthCheck(urls=GROUP_URLS[:1], persistent=True)
+        single = UrlHealthCheck(url=GROUP_URLS[0], persistent=True)
+        assert (await group()).healthy is True
+        assert (await single()).healthy is True
+    client, users = _shared_clients[True, False, None]
+    assert users == 2  # noqa: PLR2004
+    await group.aclose()
+    await single.aclose()
+    assert client.is_closed
+
+
+@pytest.mark.parametrize(
+    ("urls", "params", "message"),
+    [
+        ([], {}, "At least one URL is required"),
+        (GROUP_URLS, {"min_healthy": 4}, "min_healthy must be between 1 and 3, got 4"),
+        (GROUP_URLS, {"max_concurrency": 0}, "max_concurrency must be at least 1, got 0"),
+    ],
+)
+def test_url_group_invalid(urls: list[str], params: dict[str, Any], message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        UrlGroupHealthCheck(urls=urls, **params)
+
+
+def test_url_group_to_dict() -> None:
+    check = UrlGroupHealthCheck(urls=["https://a.example.com/health", "https://a.example.com/ready", "http://b"])
+    assert check.dependency is None
+    assert check.to_dict() == {
+        "urls": ["https://a.example.com/health", "https://a.example.com/ready", "http://b"],
+        "min_healthy": 3,
+        "max_concurrency": 10,
+        "verify_ssl": True,
+        "follow_redirects": True,
+        "persistent": False,
+        "http2": False,
+        "timeout": 5.0,
+        "name": "HTTP group",
+    }
@@ -0,0 +1,64 @@
+import asyncio
+import struct
+
+import pytest
+
+from fast_healthchecks.checks.wire.kafka import KafkaWireHealthCheck
+from tests.utils import serve
+
+pytestmark = pytest.mark.unit
+
+
+def api_versions(error_code: int) -> bytes:
+    response = struct.pack("!ihi", 1, error_code, 1) + struct.pack("!hhh", 18, 0, 3)
+    return struct.pack("!i", len(response)) + response
+
+
+async def test_api_versions() -> None:
+    requests: list[bytes] = []
+
+    async def handler(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        (size,) = struct.unpack("!i", await reader.readexactly(4))
+        requests.append(await reader.readexactly(size))
+        writer.write(api_versions(0))
+        await writer.drain()
+
+    async with serve(handler) as port:
+        health_check = KafkaWireHealthCheck(bootstrap_servers=f"127.0.0.1:{port}")
+        result = await health_check()
+
+    assert result.healthy is True, result.error_details
+    assert requests == [struct.pack("!hhih", 18, 0, 1, 17) + b"fast_healthchecks"]
+
+
+async def test_falls_back_to_next_server() -> None:
+    async def broken(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        (size,) = struct.unpack("!i", await reader.readexactly(4))
+        await reader.readexactly(size)
+        writer.write(api_versions(35))
+        await writer.drain()
+
+    async def healthy(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        (size,) = struct.unpack("!i", await reader.readexactly(4))
+        await reader.readexactly(size)
+        writer.write(api_versions(0))
+        await writer.drain()
+
+    async with serve(broken) as broken_port, serve(healthy) as healthy_port:
+        servers = f"127.0.0.1:{broken_port}, 127.0.0.1:{healthy_port}"
+        assert (await KafkaWireHealthCheck(bootstrap_servers=servers)()).healthy is True
+        result = await KafkaWireHealthCheck(bootstrap_servers=f"127.0.0.1:{broken_port}")()
+
+    assert result.healthy is False
+    assert "WireProtocolError: ApiVersions failed with error code 35" in str(result.error_details)
+
+
+def test_dependency() -> None:
+    health_check = KafkaWireHealthCheck(bootstrap_servers="broker1,[::1]:9093")
+    assert health_check.dependency == "broker1:9092,::1:9093"
+    assert health_check.to_dict() == {
+        "bootstrap_servers": "broker1,[::1]:9093",
+        "ssl_context": None,
+        "timeout": 5.0,
+        "name": "Kafka",
+    }
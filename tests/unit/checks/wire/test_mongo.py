@@ -0,0 +1,86 @@
+import asyncio
+import struct
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+from typing import Any
+
+import bson
+import pytest
+
+from fast_healthchecks.checks.wire.mongo import OP_MSG, MongoWireHealthCheck
+from fast_healthchecks.tls import get_ssl_context
+from tests.utils import serve
+
+pytestmark = pytest.mark.unit
+
+HELLO_REPLY = {
+    "topologyVersion": {"processId": bson.ObjectId(), "counter": bson.Int64(0)},
+    "isWritablePrimary": True,
+    "maxBsonObjectSize": 16777216,
+    "localTime": datetime(2025, 1, 1, tzinfo=timezone.utc),
+    "hosts": ["db:27017"],
+    "maxWireVersion": 25,
+    "ok": 1.0,
+}
+
+
+def mongod(
+    reply: dict[str, Any],
+    requests: list[dict[str, Any]],
+) -> Callable[[asyncio.StreamReader, asyncio.StreamWriter], Awaitable[None]]:
+    async def handler(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        length, request_id, _, op_code = struct.unpack("<iiii", await reader.readexactly(16))
+        assert op_code == OP_MSG
+        requests.append(bson.decode((await reader.readexactly(length - 16))[5:]))
+        body = b"\x00\x00\x00\x00\x00" + bson.encode(reply)
+        writer.write(struct.pack("<iiii", 16 + len(body), 1, request_id, OP_MSG) + body)
+        await writer.drain()
+
+    return handler
+
+
+@pytest.mark.parametrize(
+    ("dsn", "expected"),
+    [
+        (
+            "mongodb://localhost",
+            {"host": "localhost", "port": 27017, "ssl_context": None, "timeout": 5.0, "name": "MongoDB"},
+        ),
+        (
+            "mongodb://user:pass@db:27018/app?tls=true",
+            {"host": "db", "port": 27018, "ssl_context": get_ssl_context(), "timeout": 5.0, "name": "MongoDB"},
+        ),
+    ],
+)
+def test_from_dsn(dsn: str, expected: dict[str, Any]) -> None:
+    assert MongoWireHealthCheck.from_dsn(dsn).to_dict() == expected
+
+
+@pytest.mark.parametrize(
+    ("dsn", "message"),
+    [
+        ("mongodb+srv://cluster.example.com", r"mongodb\+srv DSNs are not supported"),
+        ("mongodb://db1,db2", "Multiple hosts are not supported for mongodb DSNs"),
+    ],
+)
+def test_from_dsn_unsupported(dsn: str, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        MongoWireHealthCheck.from_dsn(dsn)
+
+
+async def test_hello() -> None:
+    requests: list[dict[str, Any]] = []
+    async with serve(mongod(HELLO_REPLY, requests)) as port:
+        result = await MongoWireHealthCheck(host="127.0.0.1", port=port)()
+
+    assert result.healthy is True, result.error_details
+    assert requests == [{"hello": 1, "$db": "admin"}]
+
+
+async def test_hello_error() -> None:
+    reply = {"ok": 0.0, "errmsg": "node is shutting down", "code": 91}
+    async with serve(mongod(reply, [])) as port:
+        result = await MongoWireHealthCheck(host="127.0.0.1", port=port)()
+
+    assert result.healthy is False
+    assert "WireProtocolError: hello failed: node is shutting down" in str(result.error_details)
@@ -0,0 +1,172 @@
+import asyncio
+import base64
+import hashlib
+import hmac
+import ssl
+import struct
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import pytest
+
+from fast_healthchecks.checks.wire.postgresql import PostgreSQLWireHealthCheck
+from tests.utils import serve
+
+pytestmark = pytest.mark.unit
+
+USER = "postgres"
+PASSWORD = "secret"
+SALT = b"salt1234salt1234"
+ITERATIONS = 4096
+
+Authenticate = Callable[[asyncio.StreamReader, asyncio.StreamWriter], Awaitable[None]]
+
+
+def message(type_: bytes, payload: bytes) -> bytes:
+    return type_ + struct.pack("!i", len(payload) + 4) + payload
+
+
+def auth(code: int, data: bytes = b"") -> bytes:
+    return message(b"R", struct.pack("!i", code) + data)
+
+
+async def read_message(reader: asyncio.StreamReader) -> tuple[bytes, bytes]:
+    header = await reader.readexactly(5)
+    (length,) = struct.unpack("!i", header[1:])
+    return header[:1], await reader.readexactly(length - 4)
+
+
+async def cleartext(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    writer.write(auth(3))
+    assert await read_message(reader) == (b"p", PASSWORD.encode() + b"\x00")
+
+
+async def md5(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    writer.write(auth(5, b"abcd"))
+    inner = hashlib.md5((PASSWORD + USER).encode()).hexdigest()
+    outer = hashlib.md5(inner.encode() + b"abcd").hexdigest()
+    assert await read_message(reader) == (b"p", f"md5{outer}".encode() + b"\x00")
+
+
+async def scram(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    writer.write(auth(10, b"SCRAM-SHA-256\x00\x00"))
+    _, payload = await read_message(reader)
+    mechanism, _, rest = payload.partition(b"\x00")
+    assert mechanism == b"SCRAM-SHA-256"
+    client_first_bare = rest[4:].decode().removeprefix("n,,")
+    nonce = client_first_bare.split("r=", 1)[1] + "server"
+    server_first = f"r={nonce},s={base64.b64encode(SALT).decode()},i={ITERATIONS}"
+    writer.write(auth(11, server_first.encode()))
+    _, client_final = await read_message(reader)
+    without_proof, _, proof = client_final.decode().rpartition(",p=")
+    auth_message = f"{client_first_bare},{server_first},{without_proof}".encode()
+    salted_password = hashlib.pbkdf2_hmac("sha256", PASSWORD.encode(), SALT, ITERATIONS)
+    client_key = hmac.digest(salted_password, b"Client Key", "sha256")
+    signature = hmac.digest(hashlib.sha256(client_key).digest(), auth_message, "sha256")
+    assert base64.b64decode(proof) == bytes(key ^ sig for key, sig in zip(client_key, signature, strict=True))
+    server_key = hmac.digest(salted_password, b"Server Key", "sha256")
+    writer.write(auth(12, b"v=" + base64.b64encode(hmac.digest(server_key, auth_message, "sha256"))))
+
+
+def backend(authenticate: Authenticate, startups: list[dict[str, str]]) -> Authenticate:
+    async def handler(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        (length,) = struct.unpack("!i", await reader.readexactly(4))
+        startup = (await reader.readexactly(length - 4))[4:].split(b"\x00")
+        startups.append({
+            key.decode(): value.decode() for key, value in zip(startup[::2], startup[1::2], strict=True) if key
+        })
+        await authenticate(reader, writer)
+        writer.write(auth(0) + message(b"S", b"server_version\x0017\x00") + message(b"Z", b"I"))
+        await writer.drain()
+        assert await read_message(reader) == (b"Q", b"SELECT 1\x00")
+        writer.write(message(b"C", b"SELECT 1\x00") + message(b"Z", b"I"))
+        await writer.drain()
+        assert await read_message(reader) == (b"X", b"")
+
+    return handler
+
+
+@pytest.mark.parametrize(
+    ("dsn", "expected"),
+    [
+        (
+            "postgresql://localhost",
+            {
+                "host": "localhost",
+                "port": 5432,
+                "user": "postgres",
+                "password": None,
+                "database": None,
+                "ssl_context": None,
+                "timeout": 5.0,
+                "name": "PostgreSQL",
+            },
+        ),
+        (
+            "postgresql+asyncpg://user:p%40ss@db:6432/app?sslmode=prefer",
+            {
+                "host": "db",
+                "port": 6432,
+                "user": "user",
+                "password": "p@ss",
+                "database": "app",
+                "ssl_context": None,
+                "timeout": 5.0,
+                "name": "PostgreSQL",
+            },
+        ),
+    ],
+)
+def test_from_dsn(dsn: str, expected: dict[str, Any]) -> None:
+    assert PostgreSQLWireHealthCheck.from_dsn(dsn).to_dict() == expected
+
+
+def test_from_dsn_require() -> None:
+    health_check = PostgreSQLWireHealthCheck.from_dsn("postgresql://localhost/app?sslmode=require")
+    assert health_check.to_dict()["ssl_context"] is not None
+
+
+@pytest.mark.parametrize("authenticate", [cleartext, md5, scram])
+async def test_select_one(authenticate: Authenticate) -> None:
+    startups: list[dict[str, str]] = []
+    async with serve(backend(authenticate, startups)) as port:
+        health_check = PostgreSQLWireHealthCheck(host="127.0.0.1", port=port, user=USER, password=PASSWORD)
+        result = await health_check()
+
+    assert result.healthy is True, result.error_details
+    assert startups == [{"user": USER, "database": USER}]
+
+
+async def test_error_response() -> None:
+    async def handler(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        await reader.readexactly(4)
+        writer.write(message(b"E", b"SFATAL\x00C28P01\x00Mpassword authentication failed\x00\x00"))
+        await writer.drain()
+
+    async with serve(handler) as port:
+        result = await PostgreSQLWireHealthCheck(host="127.0.0.1", port=port, password=PASSWORD)()
+
+    assert result.healthy is False
+    assert "WireProtocolError: FATAL 28P01: password authentication failed" in str(result.error_details)
+
+
+async def test_password_required() -> None:
+    async with serve(backend(cleartext, [])) as port:
+        result = await PostgreSQLWireHealthCheck(host="127.0.0.1", port=port)()
+
+    assert result.healthy is False
+    assert "WireProtocolError: The server requires a password" in str(result.error_details)
+
+
+async def test_ssl_request_refused() -> None:
+    async def handler(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        assert await reader.readexactly(8) == struct.pack("!ii", 8, 80877103)
+        writer.write(b"N")
+        await writer.drain()
+
+    async with serve(handler) as port:
+        health_check = PostgreSQLWireHealthCheck(host="127.0.0.1", port=port, ssl_context=ssl.create_default_context())
+        result = await health_check()
+
+    assert result.healthy is False
+    assert "WireProtocolError: The server does not accept TLS connections" in str(result.error_details)
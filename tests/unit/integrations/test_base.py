@@ -0,0 +1,46 @@
+import pytest
+
+from fast_healthchecks.integrations.base import Probe, healthcheck_lifespan
+from tests.utils import LifecycleCheck
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.asyncio
+async def test_healthcheck_lifespan() -> None:
+    shared = LifecycleCheck("shared")
+    other = LifecycleCheck("other")
+    async with healthcheck_lifespan(
+        Probe(name="liveness", checks=[shared]),
+        Probe(name="readiness", checks=[shared, other]),
+    ):
+        assert shared.events == ["start", "call"]
+        assert other.events == ["start", "call"]
+    assert shared.events == ["start", "call", "aclose"]
+    assert other.events == ["start", "call", "aclose"]
+
+
+@pytest.mark.asyncio
+async def test_healthcheck_lifespan_without_warm_up() -> None:
+    check = LifecycleCheck()
+    async with healthcheck_lifespan(Probe(name="readiness", checks=[check]), warm_up=False):
+        assert check.events == ["start"]
+    assert check.events == ["start", "aclose"]
+
+
+class FailingStartCheck(LifecycleCheck):
+    async def start(self) -> None:
+        self.events.append("start")
+        msg = "Cannot start"
+        raise RuntimeError(msg)
+
+
+@pytest.mark.asyncio
+async def test_healthcheck_lifespan_start_failure() -> None:
+    check = LifecycleCheck()
+    failing = FailingStartCheck()
+    with pytest.raises(RuntimeError, match="Cannot start"):
+        async with healthcheck_lifespan(Probe(name="readiness", checks=[check, failing])):
+            pass
+    assert check.events == ["start", "aclose"]
+    assert failing.events == ["start", "aclose"]
@@ -1,10 +1,13 @@
 import json
 
 import pytest
-from fastapi import status
+from fastapi import FastAPI, status
 from fastapi.testclient import TestClient
 
 from examples.fastapi_example.main import app_custom, app_fail, app_success
+from fast_healthchecks.integrations.base import Probe
+from fast_healthchecks.integrations.fastapi import HealthcheckRouter
+from tests.utils import LifecycleCheck
 
 pytestmark = pytest.mark.unit
 
@@ -47,3 +50,14 @@ def test_custom_handler() -> None:
         indent=None,
         separators=(",", ":"),
     ).encode("utf-8")
+
+
+def test_lifespan() -> None:
+    check = LifecycleCheck()
+    app = FastAPI()
+    app.include_router(HealthcheckRouter(Probe(name="readiness", checks=[check])))
+    with TestClient(app) as lifespan_client:
+        assert check.events == ["start", "call"]
+        response = lifespan_client.get("/health/readiness")
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+    assert check.events == ["start", "call", "call", "aclose"]
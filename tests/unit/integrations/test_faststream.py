@@ -2,9 +2,13 @@ import json
 from http import HTTPStatus
 
 import pytest
+from faststream.asgi import AsgiFastStream
 from starlette.testclient import TestClient
 
 from examples.faststream_example.main import app_custom, app_fail, app_success
+from fast_healthchecks.integrations.base import Probe
+from fast_healthchecks.integrations.faststream import health, health_lifespan
+from tests.utils import LifecycleCheck
 
 pytestmark = pytest.mark.unit
 
@@ -47,3 +51,13 @@ def test_custom_handler() -> None:
         indent=None,
         separators=(",", ":"),
     ).encode("utf-8")
+
+
+@pytest.mark.asyncio
+async def test_lifespan() -> None:
+    check = LifecycleCheck()
+    probe = Probe(name="readiness", checks=[check])
+    app = AsgiFastStream(asgi_routes=[*health(probe)], lifespan=health_lifespan(probe))
+    async with app.lifespan_context():
+        assert check.events == ["start", "call"]
+    assert check.events == ["start", "call", "aclose"]
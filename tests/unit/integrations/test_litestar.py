@@ -1,10 +1,14 @@
 import json
 
 import pytest
+from litestar import Litestar
 from litestar.status_codes import HTTP_200_OK, HTTP_204_NO_CONTENT, HTTP_503_SERVICE_UNAVAILABLE
 from litestar.testing import TestClient
 
 from examples.litestar_example.main import app_custom, app_fail, app_success
+from fast_healthchecks.integrations.base import Probe
+from fast_healthchecks.integrations.litestar import health, health_lifespan
+from tests.utils import LifecycleCheck
 
 app_success.debug = True
 pytestmark = pytest.mark.unit
@@ -49,3 +53,14 @@ def test_custom_handler() -> None:
         indent=None,
         separators=(",", ":"),
     ).encode("utf-8")
+
+
+def test_lifespan() -> None:
+    check = LifecycleCheck()
+    probe = Probe(name="readiness", checks=[check])
+    app = Litestar(route_handlers=[*health(probe)], lifespan=[health_lifespan(probe, warm_up=False)])
+    with TestClient(app=app) as client:
+        assert check.events == ["start"]
+        response = client.get("/health/readiness")
+        assert response.status_code == HTTP_204_NO_CONTENT
+    assert check.events == ["start", "call", "aclose"]
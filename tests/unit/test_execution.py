@@ -0,0 +1,429 @@
+import asyncio
+import time
+from collections.abc import Generator
+from typing import Any
+
+import pytest
+
+from fast_healthchecks.checks._base import HealthCheck  # noqa: PLC2701
+from fast_healthchecks.checks.function import FunctionHealthCheck
+from fast_healthchecks.checks.kafka import KafkaHealthCheck
+from fast_healthchecks.execution import (
+    CheckRegistry,
+    ConnectionBudget,
+    RateLimiter,
+    get_check_registry,
+    get_connection_budget,
+    get_rate_limiter,
+    run_check,
+    run_checks,
+    set_check_registry,
+    set_connection_budget,
+    set_rate_limiter,
+)
+from fast_healthchecks.models import HealthCheckResult
+
+pytestmark = pytest.mark.unit
+
+HANGING_TIMEOUT = 0.1
+
+
+class HangingCheck(HealthCheck[HealthCheckResult]):
+    """A check that ignores cancellation, like the built-in checks catching `BaseException`."""
+
+    _name = "Hanging"
+    _timeout = HANGING_TIMEOUT
+
+    def __init__(self) -> None:
+        self.finished = asyncio.Event()
+
+    async def __call__(self) -> HealthCheckResult:
+        try:
+            await asyncio.sleep(10)
+        except BaseException:  # noqa: BLE001
+            await asyncio.sleep(0.2)
+            self.finished.set()
+        return HealthCheckResult(name=self._name, healthy=False)
+
+
+async def async_ok() -> bool:
+    await asyncio.sleep(0)
+    return True
+
+
+@pytest.mark.asyncio
+async def test_run_check_success() -> None:
+    result = await run_check(FunctionHealthCheck(func=async_ok, name="ok"))
+    assert result == HealthCheckResult(name="ok", healthy=True)
+
+
+@pytest.mark.asyncio
+async def test_run_check_enforces_deadline() -> None:
+    check = HangingCheck()
+    start = time.perf_counter()
+    result = await run_check(check)
+    elapsed = time.perf_counter() - start
+    assert elapsed < HANGING_TIMEOUT * 2
+    assert result.name == "Hanging"
+    assert result.healthy is False
+    assert result.error_details == "TimeoutError: health check did not complete within 0.1 seconds"
+    await asyncio.wait_for(check.finished.wait(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_run_check_without_timeout() -> None:
+    check = FunctionHealthCheck(func=async_ok, name="ok")
+    check._timeout = None  # ty: ignore[invalid-assignment]
+    result = await run_check(check)
+    assert result.healthy is True
+
+
+@pytest.mark.asyncio
+async def test_run_checks_preserves_order() -> None:
+    results = await run_checks([
+        FunctionHealthCheck(func=async_ok, name="first"),
+        HangingCheck(),
+        FunctionHealthCheck(func=async_ok, name="third"),
+    ])
+    assert [(result.name, result.healthy) for result in results] == [
+        ("first", True),
+        ("Hanging", False),
+        ("third", True),
+    ]
+
+
+class BackendCheck(HealthCheck[HealthCheckResult]):
+    """A check that records how many checks talk to its dependency at the same time."""
+
+    running: int = 0
+    max_running: int = 0
+
+    def __init__(self, dependency: str, name: str) -> None:
+        self._dependency = dependency
+        self._name = name
+        self._timeout = 1.0
+
+    @property
+    def dependency(self) -> str:
+        return self._dependency
+
+    async def __call__(self) -> HealthCheckResult:
+        BackendCheck.running += 1
+        BackendCheck.max_running = max(BackendCheck.max_running, BackendCheck.running)
+        await asyncio.sleep(0.01)
+        BackendCheck.running -= 1
+        return HealthCheckResult(name=self._name, healthy=True)
+
+
+@pytest.fixture(name="budget")
+def fixture_budget() -> Generator[ConnectionBudget, None, None]:
+    budget = ConnectionBudget(2)
+    set_connection_budget(budget)
+    BackendCheck.max_running = 0
+    yield budget
+    set_connection_budget(None)
+
+
+@pytest.mark.parametrize(
+    ("limit", "per_dependency", "message"),
+    [
+        (0, None, "Invalid limit: 0"),
+        (1, 0, "Invalid per-dependency limit: 0"),
+    ],
+)
+def test_connection_budget_invalid(limit: int, per_dependency: int | None, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        ConnectionBudget(limit, per_dependency=per_dependency)
+
+
+@pytest.mark.asyncio
+async def test_connection_budget_round_robin() -> None:
+    budget = ConnectionBudget(1)
+    served: list[str] = []
+
+    async def hold(dependency: str, name: str) -> None:
+        async with budget.acquire(dependency):
+            served.append(name)
+            await asyncio.sleep(0)
+
+    async with budget.acquire("a"):
+        tasks = [
+            asyncio.create_task(hold(dependency, name)) for dependency, name in [("a", "a1"), ("a", "a2"), ("b", "b1")]
+        ]
+        await asyncio.sleep(0)
+        assert budget.active == 1
+        assert budget.waiting == len(tasks)
+    await asyncio.gather(*tasks)
+    assert served == ["a1", "b1", "a2"]
+    assert budget.active == 0
+
+
+async def hold_until(budget: ConnectionBudget, dependency: str, event: asyncio.Event) -> None:
+    async with budget.acquire(dependency):
+        await event.wait()
+
+
+@pytest.mark.asyncio
+async def test_connection_budget_per_dependency() -> None:
+    budget = ConnectionBudget(3, per_dependency=1)
+    release = asyncio.Event()
+    async with budget.acquire("a"):
+        waiter = asyncio.create_task(hold_until(budget, "a", release))
+        async with budget.acquire("b"):
+            await asyncio.sleep(0)
+            assert budget.active == 2  # noqa: PLR2004
+            assert budget.waiting == 1
+    await asyncio.sleep(0)
+    assert budget.active == 1
+    assert budget.waiting == 0
+    release.set()
+    await waiter
+    assert budget.active == 0
+
+
+@pytest.mark.asyncio
+async def test_connection_budget_cancelled_waiter() -> None:
+    budget = ConnectionBudget(1)
+    async with budget.acquire("a"):
+        waiter = asyncio.create_task(hold_until(budget, "a", asyncio.Event()))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert budget.waiting == 0
+    assert budget.active == 0
+    async with budget.acquire("a"):
+        assert budget.active == 1
+
+
+@pytest.mark.asyncio
+async def test_connection_budget_bypass() -> None:
+    budget = ConnectionBudget(1)
+    async with budget.acquire("a"), budget.acquire(None):
+        assert budget.active == 1
+
+
+@pytest.mark.asyncio
+async def test_run_checks_with_connection_budget(budget: ConnectionBudget) -> None:
+    assert get_connection_budget() is budget
+    checks = [BackendCheck(dependency="postgres:5432", name=f"check {i}") for i in range(6)]
+    results = await run_checks(checks)
+    assert all(result.healthy for result in results)
+    assert BackendCheck.max_running == 2  # noqa: PLR2004
+    assert budget.active == 0
+
+
+@pytest.mark.asyncio
+async def test_run_checks_with_connection_budget_invalid_dependency(budget: ConnectionBudget) -> None:
+    [result] = await run_checks([KafkaHealthCheck(bootstrap_servers="kafka:abc", name="Kafka")])
+    assert result.healthy is False
+    assert "ValueError: invalid literal for int() with base 10: 'abc'" in str(result.error_details)
+    assert budget.active == 0
+
+
+class CountingCheck(HealthCheck[HealthCheckResult]):
+    """A check that counts how many times it contacted its dependency."""
+
+    def __init__(self, dependency: str | None, name: str = "Counting") -> None:
+        self._dependency = dependency
+        self._name = name
+        self._timeout = 1.0
+        self.calls = 0
+
+    @property
+    def dependency(self) -> str | None:
+        return self._dependency
+
+    async def __call__(self) -> HealthCheckResult:
+        self.calls += 1
+        return HealthCheckResult(name=self._name, healthy=True, error_details=str(self.calls))
+
+
+@pytest.fixture(name="rate_limiter")
+def fixture_rate_limiter() -> Generator[RateLimiter, None, None]:
+    limiter = RateLimiter(1.0)
+    set_rate_limiter(limiter)
+    yield limiter
+    set_rate_limiter(None)
+
+
+@pytest.mark.parametrize(
+    ("rate", "burst", "message"),
+    [
+        (0, 1, "Invalid rate: 0"),
+        (1, 0, "Invalid burst: 0"),
+    ],
+)
+def test_rate_limiter_invalid(rate: float, burst: int, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        RateLimiter(rate, burst=burst)
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_returns_cached_result(rate_limiter: RateLimiter) -> None:
+    assert get_rate_limiter() is rate_limiter
+    check = CountingCheck("redis:6379")
+    results = [await run_check(check) for _ in range(5)]
+    assert check.calls == 1
+    assert all(result == results[0] for result in results)
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_shares_dependency(rate_limiter: RateLimiter) -> None:  # noqa: ARG001
+    first = CountingCheck("redis:6379", name="first")
+    second = CountingCheck("redis:6379", name="second")
+    other = CountingCheck("postgres:5432")
+    await run_checks([first, other])
+    start = time.perf_counter()
+    result = await run_check(second)
+    assert time.perf_counter() - start < 0.5  # noqa: PLR2004
+    assert result == HealthCheckResult(name="second", healthy=True, error_details="1")
+    assert (first.calls, second.calls, other.calls) == (1, 0, 1)
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_fails_fast_past_timeout(rate_limiter: RateLimiter) -> None:
+    check = CountingCheck("redis:6379")
+    assert await rate_limiter.acquire(check) is None
+    check._timeout = 0.5
+    result = await run_check(check)
+    assert result.healthy is False
+    assert str(result.error_details).startswith("RateLimitError: redis:6379 can be contacted again in")
+    assert check.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_refunds_cancelled_wait() -> None:
+    limiter = RateLimiter(10.0)
+    check = CountingCheck("redis:6379")
+    assert await limiter.acquire(check) is None
+    waiter = asyncio.ensure_future(limiter.acquire(check))
+    await asyncio.sleep(0.01)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    await asyncio.sleep(0.1)
+    start = time.perf_counter()
+    assert await limiter.acquire(check) is None
+    assert time.perf_counter() - start < 0.05  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_refills() -> None:
+    limiter = RateLimiter(100.0, burst=2)
+    check = CountingCheck("redis:6379")
+    assert await limiter.acquire(check) is None
+    assert await limiter.acquire(check) is None
+    limiter.record(check, HealthCheckResult(name="Counting", healthy=True))
+    assert await limiter.acquire(check) == HealthCheckResult(name="Counting", healthy=True)
+    await asyncio.sleep(0.02)
+    assert await limiter.acquire(check) is None
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_bypass(rate_limiter: RateLimiter) -> None:  # noqa: ARG001
+    check = CountingCheck(None)
+    for _ in range(3):
+        await run_check(check)
+    assert check.calls == 3  # noqa: PLR2004
+
+
+class SharedCheck(HealthCheck[HealthCheckResult]):
+    """A configurable check that counts how many times it ran across all instances."""
+
+    calls: int = 0
+
+    def __init__(self, host: object, name: str, delay: float = 0.01) -> None:
+        self._host = host
+        self._name = name
+        self._delay = delay
+        self._timeout = 1.0
+
+    async def __call__(self) -> HealthCheckResult:
+        SharedCheck.calls += 1
+        await asyncio.sleep(self._delay)
+        return HealthCheckResult(name=self._name, healthy=True)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"host": self._host, "timeout": self._timeout, "name": self._name}
+
+
+@pytest.fixture(name="registry")
+def fixture_registry() -> Generator[CheckRegistry, None, None]:
+    registry = CheckRegistry(window=0.05)
+    set_check_registry(registry)
+    SharedCheck.calls = 0
+    yield registry
+    set_check_registry(None)
+
+
+def test_check_registry_invalid() -> None:
+    with pytest.raises(ValueError, match="Invalid window: -1"):
+        CheckRegistry(window=-1)
+
+
+@pytest.mark.asyncio
+async def test_check_registry_shares_identical_checks(registry: CheckRegistry) -> None:
+    assert get_check_registry() is registry
+    liveness = [SharedCheck("redis", name="Redis"), SharedCheck("postgres", name="Postgres")]
+    readiness = [SharedCheck("redis", name="Cache"), SharedCheck("postgres", name="Postgres")]
+    results = await asyncio.gather(run_checks(liveness), run_checks(readiness))
+    assert SharedCheck.calls == 2  # noqa: PLR2004
+    assert [result.name for result in results[0]] == ["Redis", "Postgres"]
+    assert [result.name for result in results[1]] == ["Cache", "Postgres"]
+
+
+class Client:
+    """A client whose `repr` does not tell instances apart."""
+
+    def __repr__(self) -> str:
+        return "Client()"
+
+
+@pytest.mark.asyncio
+async def test_check_registry_compares_objects_by_identity(registry: CheckRegistry) -> None:  # noqa: ARG001
+    client = Client()
+    checks = [
+        SharedCheck(client, name="first"),
+        SharedCheck(client, name="second"),
+        SharedCheck(Client(), name="other"),
+    ]
+    results = await run_checks(checks)
+    assert SharedCheck.calls == 2  # noqa: PLR2004
+    assert [result.name for result in results] == ["first", "second", "other"]
+
+
+@pytest.mark.asyncio
+async def test_check_registry_window(registry: CheckRegistry) -> None:  # noqa: ARG001
+    check = SharedCheck("redis", name="Redis")
+    await run_check(check)
+    await run_check(check)
+    assert SharedCheck.calls == 1
+    await asyncio.sleep(0.1)
+    await run_check(check)
+    assert SharedCheck.calls == 2  # noqa: PLR2004
+
+
+async def call_check(check: HealthCheck[HealthCheckResult]) -> HealthCheckResult:
+    return await check()
+
+
+@pytest.mark.asyncio
+async def test_check_registry_cancels_abandoned_run(registry: CheckRegistry) -> None:
+    check = SharedCheck("redis", name="Redis", delay=10)
+    task = asyncio.create_task(registry.run(check, call_check))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    SharedCheck.calls = 0
+    check._delay = 0
+    await run_check(check)
+    assert SharedCheck.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_check_registry_skips_checks_without_to_dict(registry: CheckRegistry) -> None:  # noqa: ARG001
+    check = CountingCheck("redis:6379")
+    await run_checks([check, check])
+    assert check.calls == 2  # noqa: PLR2004
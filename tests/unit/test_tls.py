@@ -0,0 +1,73 @@
+import asyncio
+import ssl
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import pytest
+
+from fast_healthchecks.tls import SessionResumingSSLContext, get_ssl_context
+from tests.utils import SSLCERT_NAME, SSLKEY_NAME, SSLROOTCERT_NAME, TEST_CERT_LOCATION
+
+pytestmark = pytest.mark.unit
+
+CA_CERTS = str(TEST_CERT_LOCATION / SSLROOTCERT_NAME)
+
+
+def test_get_ssl_context_is_shared() -> None:
+    context = get_ssl_context(cafile=CA_CERTS)
+    assert isinstance(context, SessionResumingSSLContext)
+    assert get_ssl_context(verify=True, check_hostname=True, cafile=CA_CERTS) is context
+    assert get_ssl_context(cafile=CA_CERTS, check_hostname=False) is not context
+    assert get_ssl_context(verify=False, cafile=CA_CERTS) is get_ssl_context(verify=False)
+
+
+@pytest.mark.parametrize(
+    ("params", "verify_mode", "check_hostname"),
+    [
+        ({}, ssl.CERT_REQUIRED, True),
+        ({"check_hostname": False}, ssl.CERT_REQUIRED, False),
+        ({"verify": False}, ssl.CERT_NONE, False),
+    ],
+)
+def test_get_ssl_context_verification(
+    params: dict[str, bool],
+    verify_mode: ssl.VerifyMode,
+    check_hostname: bool,  # noqa: FBT001
+) -> None:
+    context = get_ssl_context(**params)
+    assert context.verify_mode == verify_mode
+    assert context.check_hostname is check_hostname
+
+
+@asynccontextmanager
+async def tls_server() -> AsyncIterator[int]:
+    server_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    server_context.load_cert_chain(TEST_CERT_LOCATION / SSLCERT_NAME, TEST_CERT_LOCATION / SSLKEY_NAME)
+
+    async def handle(_: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        writer.write(b"ok")
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0, ssl=server_context)
+    async with server:
+        yield server.sockets[0].getsockname()[1]
+
+
+async def connect(port: int, context: ssl.SSLContext) -> bool:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port, ssl=context, server_hostname="localhost")
+    assert await reader.read() == b"ok"
+    session_reused: bool = writer.get_extra_info("ssl_object").session_reused
+    writer.close()
+    return session_reused
+
+
+@pytest.mark.asyncio
+async def test_session_resumption() -> None:
+    context = SessionResumingSSLContext()
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    async with tls_server() as port:
+        assert [await connect(port, context) for _ in range(3)] == [False, True, True]
+    # Only the sessions are kept, not the state of the closed connections.
+    assert [type(session) for session in context._sessions.values()] == [ssl.SSLSession]
@@ -1,15 +1,21 @@
+import asyncio
 import shutil
 import tempfile
-from collections.abc import Generator
-from contextlib import contextmanager
+from collections.abc import AsyncIterator, Awaitable, Callable, Generator
+from contextlib import asynccontextmanager, contextmanager
 from pathlib import Path
 from urllib.parse import quote
 
+from fast_healthchecks.checks._base import HealthCheck  # noqa: PLC2701
+from fast_healthchecks.models import HealthCheckResult
+
 __all__ = (
     "SSLCERT_NAME",
     "SSLKEY_NAME",
     "SSLROOTCERT_NAME",
+    "LifecycleCheck",
     "create_temp_files",
+    "serve",
 )
 
 
@@ -47,3 +53,39 @@ def create_temp_files(temp_file_paths: list[str]) -> Generator[None, None, None]
 
     for path in paths:
         path.unlink()
+
+
+class LifecycleCheck(HealthCheck[HealthCheckResult]):
+    """A check that records the calls of its lifecycle methods."""
+
+    def __init__(self, name: str = "Lifecycle") -> None:
+        self._name = name
+        self._timeout = 1.0
+        self.events: list[str] = []
+
+    async def start(self) -> None:
+        self.events.append("start")
+
+    async def __call__(self) -> HealthCheckResult:
+        self.events.append("call")
+        return HealthCheckResult(name=self._name, healthy=True)
+
+    async def aclose(self) -> None:
+        self.events.append("aclose")
+
+
+@asynccontextmanager
+async def serve(
+    handler: Callable[[asyncio.StreamReader, asyncio.StreamWriter], Awaitable[None]],
+) -> AsyncIterator[int]:
+    """Run a local TCP server with the given connection handler and yield its port."""
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            await handler(reader, writer)
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    async with server:
+        yield server.sockets[0].getsockname()[1]